@@ -10,7 +10,7 @@ import os
 import io
 import zipfile
 from datetime import date, time, datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 import aspose.words as aw
 import aspose.pydrawing as drawing
@@ -94,13 +94,47 @@ class ApiExampleBase(unittest.TestCase):
 
         :param filename: Local file system filename of the image file."""
 
-        with drawing.Image.from_file(filename) as image:
-            for x in range(image.width):
-                for y in range(image.height):
-                    if image.get_pixel(x, y).a != 255:
-                        return
+        import image_verification
 
-        raise Exception("The image from \"" + filename + "\" does not contain any transparency.")
+        if not image_verification.contains_transparency(image_verification.load_pixels(filename=filename)):
+            raise Exception("The image from \"" + filename + "\" does not contain any transparency.")
+
+    def verify_image_is_blank(self, expected: bool, filename: Optional[str] = None, image_stream: Optional[io.BytesIO] = None):
+        """Checks whether an image from a file or a stream is a blank page, with nothing drawn on its background.
+
+        :param expected: True if the image is expected to be blank, False if it is expected to have content.
+        :param filename: Local file system filename of the image file.
+        :param image_stream: Stream that contains the image."""
+
+        import image_verification
+
+        pixels = image_verification.load_pixels(filename, image_stream)
+
+        self.assertEqual(expected, image_verification.is_blank(pixels))
+
+    def verify_image_matches_gold(self, filename: str, gold_filename: str, max_changed_fraction: float = 0.01,
+                                  region: Optional[Tuple[int, int, int, int]] = None):
+        """Checks whether an image looks the same as a gold image, allowing for differences in anti-aliasing.
+
+        :param filename: Local file system filename of the image file.
+        :param gold_filename: Local file system filename of the gold image, usually in the "Golds" folder.
+        :param max_changed_fraction: Largest allowed fraction of the image area that differs from the gold image.
+        :param region: Left, top, width and height, in pixels, of the part of the image that the gold image shows,
+            or None to compare the whole image."""
+
+        import image_verification
+
+        actual = image_verification.load_pixels(filename=filename)
+        expected = image_verification.load_pixels(filename=gold_filename)
+        if region is not None:
+            left, top, width, height = region
+            actual = actual[top:top + height, left:left + width]
+
+        self.assertEqual(expected.shape[:2], actual.shape[:2])
+
+        difference = image_verification.image_difference(actual, expected)
+        self.assertGreaterEqual(max_changed_fraction, difference.changed_fraction,
+                                "The image from \"" + filename + "\" differs from \"" + gold_filename + "\": " + str(difference))
 
     def verify_web_response_status_code(self, expected_http_status_code: int, web_address: str):
         """Checks whether an HTTP request sent to the specified address produces an expected web response.
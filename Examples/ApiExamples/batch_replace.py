@@ -0,0 +1,238 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Find-and-replace of many literal and regular expression patterns at once.
+
+Calling "Range.replace" once per pattern traverses the whole document once per pattern, which adds up
+for redaction and templating jobs with hundreds of substitutions. "MultiReplacer" traverses the document once,
+collecting the text of every paragraph as the find-and-replace operation sees it, and skips the paragraphs
+where one combined regular expression finds none of the patterns. In the other paragraphs, the patterns are
+tested in order and "Range.replace" is called on the paragraph for each pattern found; once a replacement changed
+the paragraph, its text is collected again, so a later pattern also finds text that an earlier replacement inserted.
+The range of a paragraph includes the comments, footnotes and shapes inside it, so their text is tested
+with the paragraph, and the replacement in the paragraph covers them; they are not replaced a second time.
+
+Patterns that can span several paragraphs (literal patterns with the "&p", "&b" or "&m" meta-characters),
+patterns whose replacement inserts such breaks, and regular expressions that Python cannot compile
+are applied to the whole range, in their place in the list; the paragraphs are collected again after each of them.
+
+The result is that of calling "Range.replace" for each pattern in order with the same "FindReplaceOptions",
+provided that Python's "re" module finds a regular expression wherever Aspose.Words finds it. Expressions that
+the two engines read differently (for example, .NET-only constructs that Python compiles with another meaning)
+can be missed; such patterns should be applied with "Range.replace_regex" directly."""
+
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+import aspose.words as aw
+
+# Meta-characters of "Range.replace" that stand for paragraph, section and page breaks.
+BREAK_META_CHARACTERS = ("&p", "&b", "&m")
+
+# Meta-characters of "Range.replace" that stand for a single character, with that character.
+CHARACTER_META_CHARACTERS = {"&l": aw.ControlChar.LINE_BREAK, "&&": "&"}
+
+
+class Replacement(NamedTuple):
+    pattern: str
+    replacement: str
+    is_regex: bool = False
+
+
+class _ParagraphTextCollector(aw.DocumentVisitor):
+    """Collects the text of every paragraph, leaving out the text that the find-and-replace options ignore.
+
+    The range of a paragraph includes the paragraphs of the comments, footnotes and shapes inside it, so these
+    are not listed on their own: their text is listed with the outermost paragraph that contains them."""
+
+    def __init__(self, options: aw.replacing.FindReplaceOptions):
+
+        aw.DocumentVisitor.__init__(self)
+
+        self.ignore_fields = options.ignore_fields
+        self.ignore_field_codes = options.ignore_field_codes
+        self.ignore_deleted = options.ignore_deleted
+        self.ignore_inserted = options.ignore_inserted
+
+        self.paragraphs = []  # type: List[Tuple[aw.Paragraph, List[str]]]
+        self._buffers = []  # type: List[Tuple[aw.Paragraph, List[str]]]
+        self._texts = []  # type: List[str]
+        self._fields = []  # True for each enclosing field whose code is being visited, False once at its result.
+
+    def visit_paragraph_start(self, paragraph: aw.Paragraph) -> aw.VisitorAction:
+        # Paragraphs can nest (for example, inside comments and footnotes), so keep one buffer per level.
+        self._buffers.append((paragraph, []))
+        return aw.VisitorAction.CONTINUE
+
+    def visit_paragraph_end(self, paragraph: aw.Paragraph) -> aw.VisitorAction:
+        paragraph, parts = self._buffers.pop()
+        if parts:
+            self._texts.append("".join(parts))
+        if not self._buffers and self._texts:
+            self.paragraphs.append((paragraph, self._texts))
+            self._texts = []
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_start(self, field_start: aw.fields.FieldStart) -> aw.VisitorAction:
+        self._fields.append(True)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_separator(self, field_separator: aw.fields.FieldSeparator) -> aw.VisitorAction:
+        if self._fields:
+            self._fields[-1] = False
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_end(self, field_end: aw.fields.FieldEnd) -> aw.VisitorAction:
+        if self._fields:
+            self._fields.pop()
+        return aw.VisitorAction.CONTINUE
+
+    def visit_run(self, run: aw.Run) -> aw.VisitorAction:
+        if self._buffers and not self._is_ignored(run):
+            self._buffers[-1][1].append(run.text)
+        return aw.VisitorAction.CONTINUE
+
+    def _is_ignored(self, run: aw.Run) -> bool:
+
+        if self._fields and (self.ignore_fields or (self.ignore_field_codes and self._fields[-1])):
+            return True
+
+        return (self.ignore_deleted and run.is_delete_revision) or (self.ignore_inserted and run.is_insert_revision)
+
+
+class MultiReplacer:
+    """Applies a list of replacements, in order, with one traversal of the document to locate them
+    (and one more after each replacement that is applied to the whole range)."""
+
+    def __init__(self, replacements: List[Replacement], options: Optional[aw.replacing.FindReplaceOptions] = None):
+
+        self.replacements = list(replacements)
+        self.options = options if options is not None else aw.replacing.FindReplaceOptions()
+
+        flags = 0 if self.options.match_case else re.IGNORECASE
+
+        # Python expression of every replacement, or None for replacements applied to the whole range.
+        self._expressions = [self._compile(replacement, flags) for replacement in self.replacements]
+
+        # Expressions that cannot be combined (for example, because of inline flags or numbered
+        # back-references) are tested one by one in every paragraph.
+        self._separate = []
+        alternatives = []
+        for index, expression in enumerate(self._expressions):
+            if expression is None:
+                continue
+            alternative = "(?:{})".format(expression.pattern)
+            if expression.groups or not self._is_valid(alternative):
+                self._separate.append(index)
+            else:
+                alternatives.append(alternative)
+
+        self._combined = re.compile("|".join(alternatives), flags) if alternatives else None
+
+    def replace(self, node: aw.Node) -> List[int]:
+        """Applies the replacements to the range of a node (usually, a document).
+        Returns the number of replacements made for each pattern."""
+
+        counts = [0] * len(self.replacements)
+
+        # Replacements applied to the whole range split the list into runs of replacements applied paragraph by paragraph.
+        indexes = []
+        for index, expression in enumerate(self._expressions):
+            if expression is not None:
+                indexes.append(index)
+                continue
+
+            self._replace_in_paragraphs(node, indexes, counts)
+            indexes = []
+
+            counts[index] += self._replace(node.range, self.replacements[index])
+
+        self._replace_in_paragraphs(node, indexes, counts)
+
+        return counts
+
+    def _replace_in_paragraphs(self, node: aw.Node, indexes: List[int], counts: List[int]):
+        """Applies the replacements with the given indexes, in order, to every paragraph that contains their patterns."""
+
+        if not indexes:
+            return
+
+        collector = _ParagraphTextCollector(self.options)
+        node.accept(collector)
+
+        # Each paragraph comes with the texts of the comments, footnotes and shapes inside it,
+        # which its range includes, so a replacement in the paragraph also covers them.
+        for paragraph, texts in collector.paragraphs:
+            if not any(self._may_match(text) for text in texts):
+                continue
+
+            for index in indexes:
+                if texts is None:
+                    texts = self._paragraph_texts(paragraph)
+
+                expression = self._expressions[index]
+                if any(expression.search(text) for text in texts):
+                    count = self._replace(paragraph.range, self.replacements[index])
+                    if count:
+                        counts[index] += count
+                        # The paragraph changed, so later patterns are tested against its new text.
+                        texts = None
+
+    def _may_match(self, text: str) -> bool:
+        """Tells whether any of the patterns applied paragraph by paragraph can occur in the text."""
+
+        if self._combined is not None and self._combined.search(text):
+            return True
+
+        return any(self._expressions[index].search(text) for index in self._separate)
+
+    def _paragraph_texts(self, paragraph: aw.Paragraph) -> List[str]:
+
+        collector = _ParagraphTextCollector(self.options)
+        paragraph.accept(collector)
+
+        return collector.paragraphs[0][1] if collector.paragraphs else []
+
+    def _replace(self, node_range: aw.Range, replacement: Replacement) -> int:
+
+        if replacement.is_regex:
+            return node_range.replace_regex(replacement.pattern, replacement.replacement, self.options)
+
+        return node_range.replace(replacement.pattern, replacement.replacement, self.options)
+
+    @staticmethod
+    def _compile(replacement: Replacement, flags: int) -> Optional[re.Pattern]:
+
+        if any(meta in replacement.replacement for meta in BREAK_META_CHARACTERS):
+            return None
+
+        if replacement.is_regex:
+            try:
+                return re.compile(replacement.pattern, flags)
+            except re.error:
+                return None
+
+        if any(meta in replacement.pattern for meta in BREAK_META_CHARACTERS):
+            return None
+
+        pattern = re.sub("&[l&]", lambda match: CHARACTER_META_CHARACTERS[match.group()], replacement.pattern)
+
+        return re.compile(re.escape(pattern), flags)
+
+    @staticmethod
+    def _is_valid(pattern: str) -> bool:
+
+        try:
+            re.compile(pattern)
+            return True
+        except re.error:
+            return False
+
+
+def replace_all(node: aw.Node, replacements: List[Replacement], options: Optional[aw.replacing.FindReplaceOptions] = None) -> List[int]:
+    """Applies a list of replacements to the range of a node. Returns the number of replacements made for each pattern."""
+
+    return MultiReplacer(replacements, options).replace(node)
@@ -0,0 +1,245 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Document fingerprints for fast equality checks.
+
+"DocumentFingerprint" stores a hash of the text of every block-level node (paragraph, table or other block)
+and of the headers and footers of every section, and optionally a hash of the formatting of each block.
+A rolling hash over the blocks of each section, and over the sections, gives the digest of the document,
+so two fingerprints are compared in constant time, and the blocks of two fingerprints tell what changed.
+
+A fingerprint can also be checked against a document directly with "matches", which stops at the first
+block that differs, and it can be saved as JSON, for example to keep the fingerprints of stored documents."""
+
+import json
+import difflib
+import hashlib
+from typing import Iterable, List, NamedTuple, Optional
+
+import aspose.words as aw
+
+PARAGRAPH = "paragraph"
+TABLE = "table"
+OTHER = "other"
+
+
+class BlockFingerprint(NamedTuple):
+    kind: str                   # "paragraph", "table" or "other".
+    text: str                   # Hash of the text of the block.
+    formatting: Optional[str]   # Hash of the formatting of the block, if formatting was fingerprinted.
+
+
+class SectionFingerprint(NamedTuple):
+    headers_footers: str                # Hash of the text of the headers and footers of the section.
+    blocks: List[BlockFingerprint]      # Blocks of the body of the section.
+    digest: str                         # Rolling hash of the text of the headers, footers and blocks.
+    formatting_digest: Optional[str]    # Rolling hash of the text and formatting, if formatting was fingerprinted.
+
+
+class FingerprintChange(NamedTuple):
+    section: int        # Index of the section.
+    tag: str            # "replace", "delete" or "insert", as in "difflib.SequenceMatcher.get_opcodes",
+                        # or "headers_footers" if the headers or footers of the section changed.
+    start: int          # Blocks from "start" to "end" of this fingerprint...
+    end: int
+    other_start: int    # ...changed to the blocks from "other_start" to "other_end" of the other one.
+    other_end: int
+
+
+def _hash(*parts: str) -> str:
+
+    sha = hashlib.sha1()
+    for part in parts:
+        sha.update(part.encode("utf-8"))
+        sha.update(b"\0")
+
+    return sha.hexdigest()
+
+
+def _chain(digest: str, parts: Iterable[str]) -> str:
+    """Extends a rolling hash with more hashes."""
+
+    for part in parts:
+        digest = _hash(digest, part)
+
+    return digest
+
+
+def _kind(node: aw.Node) -> str:
+
+    if node.node_type == aw.NodeType.PARAGRAPH:
+        return PARAGRAPH
+    if node.node_type == aw.NodeType.TABLE:
+        return TABLE
+    return OTHER
+
+
+def _headers_footers_hash(section: aw.Section) -> str:
+
+    parts = []
+    for header_footer in section.headers_footers:
+        header_footer = header_footer.as_header_footer()
+        parts += [str(header_footer.header_footer_type), header_footer.get_text()]
+
+    return _hash(*parts)
+
+
+def paragraph_formatting(paragraph: aw.Paragraph) -> List[str]:
+    """Describes the paragraph format of a paragraph and the font of each of its runs."""
+
+    paragraph_format = paragraph.paragraph_format
+    parts = [paragraph_format.style_name, str(paragraph_format.alignment), str(paragraph_format.left_indent),
+             str(paragraph_format.right_indent), str(paragraph_format.first_line_indent),
+             str(paragraph_format.space_before), str(paragraph_format.space_after),
+             str(paragraph_format.line_spacing), str(paragraph.is_list_item)]
+
+    for run in paragraph.runs:
+        run = run.as_run()
+        font = run.font
+        parts += [str(len(run.text)), font.name, str(font.size), str(font.bold), str(font.italic),
+                  str(font.underline), str(font.color.to_argb()), str(font.highlight_color.to_argb())]
+
+    return parts
+
+
+def _formatting_hash(node: aw.Node) -> str:
+
+    if node.node_type == aw.NodeType.PARAGRAPH:
+        return _hash(*paragraph_formatting(node.as_paragraph()))
+
+    parts = [node.as_table().style_name] if node.node_type == aw.NodeType.TABLE else []
+    if node.is_composite:
+        for paragraph in node.as_composite_node().get_child_nodes(aw.NodeType.PARAGRAPH, True):
+            parts += paragraph_formatting(paragraph.as_paragraph())
+
+    return _hash(*parts)
+
+
+def _block_fingerprint(node: aw.Node, with_formatting: bool) -> BlockFingerprint:
+
+    return BlockFingerprint(_kind(node), _hash(node.get_text()), _formatting_hash(node) if with_formatting else None)
+
+
+def _section_fingerprint(headers_footers: str, blocks: List[BlockFingerprint], with_formatting: bool) -> SectionFingerprint:
+
+    digest = _chain(headers_footers, (block.text for block in blocks))
+    formatting_digest = _chain(digest, (block.formatting for block in blocks)) if with_formatting else None
+
+    return SectionFingerprint(headers_footers, blocks, digest, formatting_digest)
+
+
+class DocumentFingerprint:
+    """Hashes of the sections and blocks of a document."""
+
+    def __init__(self, sections: List[SectionFingerprint]):
+
+        self.sections = sections
+        self.with_formatting = all(section.formatting_digest is not None for section in sections)
+        self.digest = _chain("", (section.digest for section in sections))
+        self.formatting_digest = _chain("", (section.formatting_digest for section in sections)) if self.with_formatting else None
+
+    @staticmethod
+    def of(doc: aw.Document, with_formatting: bool = False) -> 'DocumentFingerprint':
+        """Computes the fingerprint of a document, optionally with the formatting of its blocks."""
+
+        sections = []
+        for section in doc.sections:
+            section = section.as_section()
+            headers_footers = _headers_footers_hash(section)
+            blocks = [_block_fingerprint(node, with_formatting) for node in section.body.child_nodes]
+
+            sections.append(_section_fingerprint(headers_footers, blocks, with_formatting))
+
+        return DocumentFingerprint(sections)
+
+    def _check_formatting(self, compare_formatting: bool, other: Optional['DocumentFingerprint'] = None):
+
+        if compare_formatting and not (self.with_formatting and (other is None or other.with_formatting)):
+            raise ValueError("The fingerprint was computed without formatting.")
+
+    def equals(self, other: 'DocumentFingerprint', compare_formatting: bool = False) -> bool:
+        """Tells whether two fingerprints describe documents with the same text,
+        and also with the same formatting if "compare_formatting" is set."""
+
+        self._check_formatting(compare_formatting, other)
+        if compare_formatting:
+            return self.formatting_digest == other.formatting_digest
+
+        return self.digest == other.digest
+
+    def matches(self, doc: aw.Document, compare_formatting: bool = False) -> bool:
+        """Tells whether a document has the fingerprint, without fingerprinting all of it:
+        the check stops at the first section or block that differs."""
+
+        self._check_formatting(compare_formatting)
+
+        if doc.sections.count != len(self.sections):
+            return False
+
+        for section, expected in zip(doc.sections, self.sections):
+            section = section.as_section()
+            nodes = section.body.child_nodes
+            if nodes.count != len(expected.blocks) or _headers_footers_hash(section) != expected.headers_footers:
+                return False
+
+            for node, block in zip(nodes, expected.blocks):
+                if _kind(node) != block.kind or _hash(node.get_text()) != block.text:
+                    return False
+                if compare_formatting and _formatting_hash(node) != block.formatting:
+                    return False
+
+        return True
+
+    def changes(self, other: 'DocumentFingerprint', compare_formatting: bool = False) -> List[FingerprintChange]:
+        """Returns the runs of blocks that differ between two fingerprints, section by section.
+        Sections present in only one of the fingerprints are reported as deleted or inserted as a whole."""
+
+        self._check_formatting(compare_formatting, other)
+
+        changes = []
+        for index in range(max(len(self.sections), len(other.sections))):
+            if index >= len(other.sections):
+                changes.append(FingerprintChange(index, "delete", 0, len(self.sections[index].blocks), 0, 0))
+                continue
+            if index >= len(self.sections):
+                changes.append(FingerprintChange(index, "insert", 0, 0, 0, len(other.sections[index].blocks)))
+                continue
+
+            section = self.sections[index]
+            other_section = other.sections[index]
+            if compare_formatting and section.formatting_digest == other_section.formatting_digest:
+                continue
+            if not compare_formatting and section.digest == other_section.digest:
+                continue
+
+            if section.headers_footers != other_section.headers_footers:
+                changes.append(FingerprintChange(index, "headers_footers", 0, 0, 0, 0))
+
+            keys = [block if compare_formatting else block[:2] for block in section.blocks]
+            other_keys = [block if compare_formatting else block[:2] for block in other_section.blocks]
+            matcher = difflib.SequenceMatcher(None, keys, other_keys, autojunk=False)
+            changes += [FingerprintChange(index, tag, i1, i2, j1, j2)
+                        for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+        return changes
+
+    def to_json(self) -> str:
+
+        return json.dumps({
+            "with_formatting": self.with_formatting,
+            "sections": [[section.headers_footers, [list(block) for block in section.blocks]] for section in self.sections],
+        })
+
+    @staticmethod
+    def from_json(text: str) -> 'DocumentFingerprint':
+
+        data = json.loads(text)
+
+        sections = []
+        for headers_footers, blocks in data["sections"]:
+            sections.append(_section_fingerprint(headers_footers, [BlockFingerprint(*block) for block in blocks], data["with_formatting"]))
+
+        return DocumentFingerprint(sections)
@@ -0,0 +1,168 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Bulk document merging.
+
+Appending many documents one by one spends most of its time loading each source before appending it.
+The pipeline below loads the next sources on background threads while the current one is being appended,
+and, when the caller asked for "KEEP_SOURCE_FORMATTING", appends sources whose style definitions (including
+the lists that styles use) all equal the destination's with "USE_DESTINATION_STYLES": such sources keep the same
+formatting either way, but their styles are resolved by name instead of being compared and copied on every append.
+Any other import format mode is always used as given."""
+
+import time
+import collections
+import concurrent.futures
+from typing import Dict, Iterable, Optional, Tuple
+
+import aspose.words as aw
+
+
+FONT_ATTRIBUTES = ("name", "name_ascii", "name_bi", "name_far_east", "name_other", "size", "size_bi", "bold", "bold_bi",
+                   "italic", "italic_bi", "underline", "strike_through", "double_strike_through", "all_caps", "small_caps",
+                   "superscript", "subscript", "hidden", "spacing", "position", "scaling", "kerning", "locale_id",
+                   "locale_id_bi", "locale_id_far_east")
+
+PARAGRAPH_ATTRIBUTES = ("alignment", "left_indent", "right_indent", "first_line_indent", "space_before", "space_after",
+                        "space_before_auto", "space_after_auto", "line_spacing", "line_spacing_rule", "keep_together",
+                        "keep_with_next", "page_break_before", "widow_control", "outline_level", "bidi",
+                        "no_space_between_paragraphs_of_same_style", "suppress_auto_hyphens", "snap_to_grid")
+
+LIST_LEVEL_ATTRIBUTES = ("number_style", "number_format", "start_at", "alignment", "number_position", "text_position",
+                         "tab_position", "trailing_character", "restart_after_level", "is_legal")
+
+
+def _describe(obj, attributes) -> Tuple:
+
+    return tuple(str(getattr(obj, attribute)) for attribute in attributes)
+
+
+def _font_signature(font: aw.Font) -> Tuple:
+
+    return _describe(font, FONT_ATTRIBUTES) + (str(font.color.to_argb()), str(font.highlight_color.to_argb()))
+
+
+def _list_signature(lst: aw.lists.List) -> Tuple:
+
+    levels = []
+    for level in lst.list_levels:
+        linked_style = level.linked_style.name if level.linked_style is not None else None
+        levels.append(_describe(level, LIST_LEVEL_ATTRIBUTES) + (linked_style,) + _font_signature(level.font))
+
+    style = lst.style.name if lst.style is not None else None
+    return (lst.is_multi_level_list, lst.is_list_style_definition, lst.is_list_style_reference, style, tuple(levels))
+
+
+def style_signature(doc: aw.Document) -> Tuple:
+    """Describes the style definitions of a document: every style with its font, paragraph format and list
+    formatting (including the levels of the list it uses), and the document's default font and paragraph format.
+    Documents whose signatures are equal define the same styles. Lists that are applied to paragraphs directly
+    are not part of the signature: they are copied on every append, whatever the import format mode."""
+
+    styles = []
+    for style in doc.styles:
+        definition = (style.name, str(style.type), style.base_style_name, style.next_paragraph_style_name,
+                      style.linked_style_name, tuple(style.aliases), _font_signature(style.font))
+
+        if style.type == aw.StyleType.PARAGRAPH:
+            definition += (_describe(style.paragraph_format, PARAGRAPH_ATTRIBUTES),)
+        if style.type in (aw.StyleType.PARAGRAPH, aw.StyleType.LIST):
+            list_format = style.list_format
+            definition += (list_format.list_level_number,
+                           _list_signature(list_format.list) if list_format.list is not None else None)
+
+        styles.append(definition)
+
+    styles.sort(key=repr)
+    defaults = (_font_signature(doc.styles.default_font), _describe(doc.styles.default_paragraph_format, PARAGRAPH_ATTRIBUTES))
+
+    return tuple(styles), defaults
+
+
+class DocumentMergePipeline:
+    """Appends many documents to a destination document, loading upcoming sources in the background.
+
+    Per-stage timings (in seconds) are collected in "timings":
+    "load" - time spent loading sources on background threads,
+    "wait" - time the appending thread waited for a source to finish loading,
+    "append" - time spent in "append_document",
+    "total" - wall time of the whole merge."""
+
+    def __init__(self, prefetch: int = 4, import_format_mode: aw.ImportFormatMode = aw.ImportFormatMode.KEEP_SOURCE_FORMATTING):
+
+        self.prefetch = prefetch
+        self.import_format_mode = import_format_mode
+        self.timings = collections.Counter()  # type: Dict[str, float]
+        self.appended = 0
+        self.shared_template_appends = 0
+
+    @staticmethod
+    def _load(file_name: str, with_signature: bool) -> Tuple[aw.Document, Optional[Tuple], float]:
+
+        start = time.perf_counter()
+        doc = aw.Document(file_name)
+        signature = style_signature(doc) if with_signature else None
+        return doc, signature, time.perf_counter() - start
+
+    def merge(self, dst_doc: aw.Document, file_names: Iterable[str], load_filter=None) -> aw.Document:
+        """Appends the documents from "file_names" to "dst_doc" in order and returns "dst_doc".
+
+        "load_filter", if given, is called with each file name and can return False to skip the file
+        (for example, to skip encrypted documents)."""
+
+        start = time.perf_counter()
+        compare_styles = self.import_format_mode == aw.ImportFormatMode.KEEP_SOURCE_FORMATTING
+        dst_signature = style_signature(dst_doc) if compare_styles else None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.prefetch)) as executor:
+            in_flight = collections.deque()
+            file_names = iter(file_names)
+
+            def fill():
+                # Keep "prefetch" sources loading ahead of the one being appended.
+                while len(in_flight) < self.prefetch + 1:
+                    file_name = next(file_names, None)
+                    if file_name is None:
+                        return
+                    if load_filter is None or load_filter(file_name):
+                        in_flight.append(executor.submit(DocumentMergePipeline._load, file_name, compare_styles))
+
+            fill()
+            while in_flight:
+                wait_start = time.perf_counter()
+                src_doc, signature, load_seconds = in_flight.popleft().result()
+                self.timings["wait"] += time.perf_counter() - wait_start
+                self.timings["load"] += load_seconds
+
+                fill()
+
+                mode = self.import_format_mode
+                shared_template = compare_styles and signature == dst_signature
+                if shared_template:
+                    # Every style of the source already exists in the destination with the same definition,
+                    # so using the destination's styles keeps the source formatting as well.
+                    mode = aw.ImportFormatMode.USE_DESTINATION_STYLES
+                    self.shared_template_appends += 1
+
+                append_start = time.perf_counter()
+                dst_doc.append_document(src_doc, mode)
+                self.timings["append"] += time.perf_counter() - append_start
+                self.appended += 1
+
+                if compare_styles and not shared_template:
+                    # The append may have copied styles of the source into the destination.
+                    dst_signature = style_signature(dst_doc)
+
+        self.timings["total"] += time.perf_counter() - start
+        return dst_doc
+
+    def report(self) -> str:
+
+        lines = ["Appended {} document(s), {} with the destination's styles.".format(self.appended, self.shared_template_appends)]
+        for stage in ("load", "wait", "append", "total"):
+            lines.append("{}: {:.3f} s".format(stage, self.timings[stage]))
+
+        return "\n".join(lines)
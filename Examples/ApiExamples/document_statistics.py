@@ -0,0 +1,199 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Single-pass document statistics.
+
+"MultiVisitor" is a document visitor that forwards every visited node to any number of collectors,
+so several kinds of statistics are gathered with one "doc.accept" traversal instead of one traversal each.
+A collector is a plain object that defines only the "visit_*" methods it needs; their signatures are the same
+as those of "DocumentVisitor". Collectors accumulate text in lists and join them once at the end."""
+
+import collections
+from typing import Dict, List
+
+import aspose.words as aw
+
+# Every callback of DocumentVisitor.
+VISIT_METHODS = (
+    "visit_absolute_position_tab",
+    "visit_body_start", "visit_body_end",
+    "visit_bookmark_start", "visit_bookmark_end",
+    "visit_building_block_start", "visit_building_block_end",
+    "visit_cell_start", "visit_cell_end",
+    "visit_comment_start", "visit_comment_end",
+    "visit_comment_range_start", "visit_comment_range_end",
+    "visit_document_start", "visit_document_end",
+    "visit_editable_range_start", "visit_editable_range_end",
+    "visit_field_start", "visit_field_separator", "visit_field_end",
+    "visit_footnote_start", "visit_footnote_end",
+    "visit_form_field",
+    "visit_glossary_document_start", "visit_glossary_document_end",
+    "visit_group_shape_start", "visit_group_shape_end",
+    "visit_header_footer_start", "visit_header_footer_end",
+    "visit_office_math_start", "visit_office_math_end",
+    "visit_paragraph_start", "visit_paragraph_end",
+    "visit_row_start", "visit_row_end",
+    "visit_run",
+    "visit_section_start", "visit_section_end",
+    "visit_shape_start", "visit_shape_end",
+    "visit_smart_tag_start", "visit_smart_tag_end",
+    "visit_special_char",
+    "visit_structured_document_tag_start", "visit_structured_document_tag_end",
+    "visit_sub_document",
+    "visit_table_start", "visit_table_end",
+)
+
+
+class MultiVisitor(aw.DocumentVisitor):
+    """Fans one document traversal out to many collectors.
+
+    The traversal always continues into child nodes. A collector that returns "VisitorAction.STOP"
+    is not called again; the traversal stops when every collector has stopped."""
+
+    def __init__(self, *collectors):
+
+        aw.DocumentVisitor.__init__(self)
+
+        self.collectors = []
+        self.handlers = collections.defaultdict(list)  # type: Dict[str, List]
+        for collector in collectors:
+            self.register(collector)
+
+    def register(self, collector):
+        """Adds a collector. Only the callbacks it actually defines will be called."""
+
+        self.collectors.append(collector)
+        for name in VISIT_METHODS:
+            handler = getattr(collector, name, None)
+            if handler is not None:
+                self.handlers[name].append(handler)
+
+        return collector
+
+    def dispatch(self, name: str, node) -> aw.VisitorAction:
+
+        handlers = self.handlers.get(name)
+        if handlers:
+            for handler in list(handlers):
+                if handler(node) == aw.VisitorAction.STOP:
+                    self._unregister(handler.__self__)
+
+            if not self.collectors:
+                return aw.VisitorAction.STOP
+
+        return aw.VisitorAction.CONTINUE
+
+    def _unregister(self, collector):
+
+        if collector in self.collectors:
+            self.collectors.remove(collector)
+        for handlers in self.handlers.values():
+            handlers[:] = [handler for handler in handlers if handler.__self__ is not collector]
+
+
+def _make_visit_method(name: str):
+
+    def visit(self, node) -> aw.VisitorAction:
+        return self.dispatch(name, node)
+
+    visit.__name__ = name
+    return visit
+
+
+for _name in VISIT_METHODS:
+    setattr(MultiVisitor, _name, _make_visit_method(_name))
+
+
+class NodeCountCollector:
+    """Counts the nodes of each type."""
+
+    def __init__(self):
+
+        self.counts = collections.Counter()  # type: Dict[str, int]
+
+    def visit_section_start(self, section: aw.Section):
+        self.counts["sections"] += 1
+
+    def visit_paragraph_start(self, paragraph: aw.Paragraph):
+        self.counts["paragraphs"] += 1
+
+    def visit_run(self, run: aw.Run):
+        self.counts["runs"] += 1
+
+    def visit_table_start(self, table: aw.tables.Table):
+        self.counts["tables"] += 1
+
+    def visit_row_start(self, row: aw.tables.Row):
+        self.counts["rows"] += 1
+
+    def visit_cell_start(self, cell: aw.tables.Cell):
+        self.counts["cells"] += 1
+
+    def visit_shape_start(self, shape: aw.drawing.Shape):
+        self.counts["shapes"] += 1
+
+    def visit_comment_start(self, comment: aw.Comment):
+        self.counts["comments"] += 1
+
+    def visit_footnote_start(self, footnote: aw.notes.Footnote):
+        self.counts["footnotes"] += 1
+
+    def visit_field_start(self, field_start: aw.fields.FieldStart):
+        self.counts["fields"] += 1
+
+
+class WordCountCollector:
+    """Counts words and characters of the text of every paragraph.
+
+    Run texts are buffered per paragraph, so that words split between runs are counted once."""
+
+    def __init__(self):
+
+        self.words = 0
+        self.characters = 0
+        self._buffers = []  # type: List[List[str]]
+
+    def visit_paragraph_start(self, paragraph: aw.Paragraph):
+        # Paragraphs can nest (for example, inside comments and footnotes), so keep one buffer per level.
+        self._buffers.append([])
+
+    def visit_run(self, run: aw.Run):
+        if self._buffers:
+            self._buffers[-1].append(run.text)
+
+    def visit_paragraph_end(self, paragraph: aw.Paragraph):
+        text = "".join(self._buffers.pop())
+        self.words += len(text.split())
+        self.characters += len(text)
+
+
+class FieldInventoryCollector:
+    """Lists every field with its type and field code."""
+
+    def __init__(self):
+
+        self.fields = []  # type: List[tuple]
+
+    def visit_field_start(self, field_start: aw.fields.FieldStart):
+        field = field_start.get_field()
+        self.fields.append((field.type, field.get_field_code()))
+
+    def types(self) -> Dict[aw.fields.FieldType, int]:
+        return collections.Counter(field_type for field_type, _ in self.fields)
+
+
+class CommentCollector:
+    """Extracts the author, date and text of every comment."""
+
+    def __init__(self):
+
+        self.comments = []  # type: List[tuple]
+
+    def visit_comment_start(self, comment: aw.Comment):
+        self.comments.append((comment.author, comment.date_time, comment.to_string(aw.SaveFormat.TEXT).strip()))
+
+    def get_text(self) -> str:
+        return "\n".join("{}: {}".format(author, text) for author, _, text in self.comments)
@@ -0,0 +1,205 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Text index of a document for repeated text queries.
+
+Every call of "Document.get_text" or "Range.text" builds the text of the document again.
+"DocumentTextIndex" builds the text once, with one traversal of the document, and remembers where
+the text of every node starts. It answers substring searches, finds the offset of a paragraph,
+and maps any slice of the text back to the nodes (and the offsets inside them) that hold it.
+
+The index does not notice changes of the document by itself: call "invalidate" after changing the
+document, and the index is built again on the next query."""
+
+import bisect
+from typing import Dict, List, NamedTuple, Optional, Union
+
+import aspose.words as aw
+
+
+class TextSpan(NamedTuple):
+    node: aw.Node   # Node that holds the text.
+    start: int      # Offset of the first character, relative to the text of the node.
+    end: int        # Offset after the last character, relative to the text of the node.
+
+
+class _TextCollector(aw.DocumentVisitor):
+    """Builds the text of a document in the same form as "Document.get_text",
+    together with the offset of every node that contributes characters to it."""
+
+    def __init__(self):
+
+        aw.DocumentVisitor.__init__(self)
+
+        self.parts = []  # type: List[str]
+        self.length = 0
+
+        self.nodes = []  # type: List[aw.Node]
+        self.starts = []  # type: List[int]
+
+        self.paragraphs = []  # type: List[aw.Paragraph]
+        self.paragraph_starts = []  # type: List[int]
+        self.paragraph_ends = []  # type: List[int]
+        self._open_paragraphs = []  # type: List[int]
+
+    def _add(self, node: aw.Node, text: str):
+
+        if text:
+            self.nodes.append(node)
+            self.starts.append(self.length)
+            self.parts.append(text)
+            self.length += len(text)
+
+    def visit_run(self, run: aw.Run) -> aw.VisitorAction:
+        self._add(run, run.text)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_start(self, field_start: aw.fields.FieldStart) -> aw.VisitorAction:
+        self._add(field_start, aw.ControlChar.FIELD_START_CHAR)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_separator(self, field_separator: aw.fields.FieldSeparator) -> aw.VisitorAction:
+        self._add(field_separator, aw.ControlChar.FIELD_SEPARATOR_CHAR)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_end(self, field_end: aw.fields.FieldEnd) -> aw.VisitorAction:
+        self._add(field_end, aw.ControlChar.FIELD_END_CHAR)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_special_char(self, special_char: aw.SpecialChar) -> aw.VisitorAction:
+        self._add(special_char, special_char.get_text())
+        return aw.VisitorAction.CONTINUE
+
+    def visit_form_field(self, form_field: aw.fields.FormField) -> aw.VisitorAction:
+        self._add(form_field, form_field.get_text())
+        return aw.VisitorAction.CONTINUE
+
+    def visit_absolute_position_tab(self, tab: aw.AbsolutePositionTab) -> aw.VisitorAction:
+        self._add(tab, tab.get_text())
+        return aw.VisitorAction.CONTINUE
+
+    def visit_paragraph_start(self, paragraph: aw.Paragraph) -> aw.VisitorAction:
+        # Paragraphs can nest (for example, inside comments and footnotes).
+        self._open_paragraphs.append(len(self.paragraph_starts))
+        self.paragraphs.append(paragraph)
+        self.paragraph_starts.append(self.length)
+        self.paragraph_ends.append(None)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_paragraph_end(self, paragraph: aw.Paragraph) -> aw.VisitorAction:
+        if paragraph.is_end_of_section:
+            self._add(paragraph, aw.ControlChar.SECTION_BREAK)
+        elif paragraph.is_end_of_cell:
+            self._add(paragraph, aw.ControlChar.CELL)
+        else:
+            self._add(paragraph, aw.ControlChar.PARAGRAPH_BREAK)
+
+        self.paragraph_ends[self._open_paragraphs.pop()] = self.length
+        return aw.VisitorAction.CONTINUE
+
+    def visit_row_end(self, row: aw.tables.Row) -> aw.VisitorAction:
+        self._add(row, aw.ControlChar.CELL)
+        return aw.VisitorAction.CONTINUE
+
+
+class DocumentTextIndex:
+    """Text of a document with a map from text offsets to nodes, built on the first query."""
+
+    def __init__(self, doc: aw.Document):
+
+        self.doc = doc
+        self.builds = 0
+        self._collector = None  # type: Optional[_TextCollector]
+        self._text = None  # type: Optional[str]
+        self._paragraph_indexes = None  # type: Optional[Dict[aw.Node, int]]
+
+    def invalidate(self):
+        """Discards the index. Call it after changing the document."""
+
+        self._collector = None
+        self._text = None
+        self._paragraph_indexes = None
+
+    def _build(self) -> _TextCollector:
+
+        if self._collector is None:
+            collector = _TextCollector()
+            self.doc.accept(collector)
+
+            self._text = "".join(collector.parts)
+            collector.parts = None
+            # Nodes compare and hash by the document node they wrap, so paragraphs are looked up without a scan.
+            self._paragraph_indexes = {paragraph: index for index, paragraph in enumerate(collector.paragraphs)}
+            collector.paragraphs = None
+            self._collector = collector
+            self.builds += 1
+
+        return self._collector
+
+    @property
+    def text(self) -> str:
+        """Text of the whole document, the same as "Document.get_text" returns."""
+
+        self._build()
+        return self._text
+
+    def find(self, substring: str, start: int = 0) -> int:
+        """Returns the offset of the first occurrence of a substring at or after "start", or -1."""
+
+        return self.text.find(substring, start)
+
+    def find_all(self, substring: str) -> List[int]:
+        """Returns the offsets of all non-overlapping occurrences of a substring."""
+
+        text = self.text
+        offsets = []
+        offset = text.find(substring)
+        while offset != -1 and substring:
+            offsets.append(offset)
+            offset = text.find(substring, offset + len(substring))
+
+        return offsets
+
+    def paragraph_offset(self, paragraph: Union[int, aw.Paragraph]) -> int:
+        """Returns the offset of the text of a paragraph, given the paragraph or its index
+        among all paragraphs of the document (in the order of "get_child_nodes")."""
+
+        collector = self._build()
+        if not isinstance(paragraph, int):
+            paragraph = self._paragraph_indexes.get(paragraph)
+            if paragraph is None:
+                raise ValueError("The paragraph does not belong to the document.")
+
+        return collector.paragraph_starts[paragraph]
+
+    def paragraph_at(self, offset: int) -> int:
+        """Returns the index of the innermost paragraph whose text contains the offset, or -1."""
+
+        collector = self._build()
+
+        index = bisect.bisect_right(collector.paragraph_starts, offset) - 1
+        while index >= 0 and collector.paragraph_ends[index] <= offset:
+            # The offset is past a nested paragraph; look at the paragraphs that enclose it.
+            index -= 1
+
+        return index
+
+    def map_slice(self, start: int, end: int) -> List[TextSpan]:
+        """Returns the nodes that hold the characters from "start" to "end", in document order,
+        with the part of the text of each node that falls inside the slice."""
+
+        collector = self._build()
+
+        spans = []
+        index = max(0, bisect.bisect_right(collector.starts, start) - 1)
+        while index < len(collector.nodes) and collector.starts[index] < end:
+            node_start = collector.starts[index]
+            node_end = collector.starts[index + 1] if index + 1 < len(collector.starts) else len(self._text)
+            if node_end > start:
+                spans.append(TextSpan(collector.nodes[index], max(start, node_start) - node_start, min(end, node_end) - node_start))
+            index += 1
+
+        return spans
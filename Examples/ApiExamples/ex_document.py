@@ -16,6 +16,8 @@ import aspose.pydrawing as drawing
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, IMAGE_DIR, FONTS_DIR, GOLDS_DIR
 from document_helper import DocumentHelper
+from document_merge_pipeline import DocumentMergePipeline
+from document_fingerprint import DocumentFingerprint
 
 class ExDocument(ApiExampleBase):
 
@@ -646,6 +648,62 @@ class ExDocument(ApiExampleBase):
         self.assertEqual(7, dst_doc.styles.count)
         self.assertEqual(9, dst_doc.sections.count)
 
+    def test_append_all_documents_in_folder_pipeline(self):
+
+        dst_doc = aw.Document()
+
+        builder = aw.DocumentBuilder(dst_doc)
+        builder.paragraph_format.style_identifier = aw.StyleIdentifier.HEADING1
+        builder.writeln("Template Document")
+        builder.paragraph_format.style_identifier = aw.StyleIdentifier.NORMAL
+        builder.writeln("Some content here")
+
+        # Load the next documents on background threads while the current one is being appended.
+        pipeline = DocumentMergePipeline(prefetch=4, import_format_mode=aw.ImportFormatMode.USE_DESTINATION_STYLES)
+        pipeline.merge(dst_doc, sorted(glob.glob(MY_DIR + "*.doc")),
+                       lambda file_name: not aw.FileFormatUtil.detect_file_format(file_name).is_encrypted)
+
+        dst_doc.save(ARTIFACTS_DIR + "Document.append_all_documents_in_folder_pipeline.doc")
+
+        self.assertEqual(7, dst_doc.styles.count)
+        self.assertEqual(9, dst_doc.sections.count)
+        self.assertLess(0, pipeline.appended)
+        self.assertEqual(0, pipeline.shared_template_appends)
+
+    def test_append_documents_from_shared_template_pipeline(self):
+
+        def create_document(text: str) -> aw.Document:
+            doc = aw.Document()
+            builder = aw.DocumentBuilder(doc)
+            builder.paragraph_format.style_identifier = aw.StyleIdentifier.HEADING1
+            builder.writeln(text)
+            builder.paragraph_format.style_identifier = aw.StyleIdentifier.NORMAL
+            builder.writeln("Some content here")
+            return doc
+
+        file_names = []
+        for i in range(3):
+            file_names.append(ARTIFACTS_DIR + f"Document.append_documents_from_shared_template_pipeline.{i}.docx")
+            create_document(f"Chapter {i}").save(file_names[-1])
+
+        # A source that defines "Heading 1" differently is appended with the source formatting.
+        other_doc = create_document("Appendix")
+        other_doc.styles.get_by_style_identifier(aw.StyleIdentifier.HEADING1).font.size = 30
+        file_names.append(ARTIFACTS_DIR + "Document.append_documents_from_shared_template_pipeline.other.docx")
+        other_doc.save(file_names[-1])
+
+        dst_doc = create_document("Binder")
+        pipeline = DocumentMergePipeline(prefetch=2, import_format_mode=aw.ImportFormatMode.KEEP_SOURCE_FORMATTING)
+        pipeline.merge(dst_doc, file_names)
+
+        self.assertEqual(4, pipeline.appended)
+        self.assertEqual(3, pipeline.shared_template_appends)
+        self.assertEqual(5, dst_doc.sections.count)
+
+        paragraphs = dst_doc.get_child_nodes(aw.NodeType.PARAGRAPH, True)
+        appendix = [p.as_paragraph() for p in paragraphs if p.get_text().strip() == "Appendix"][0]
+        self.assertEqual(30, appendix.runs[0].font.size)
+
     def test_join_runs_with_same_formatting(self):
 
         #ExStart
@@ -1016,6 +1074,41 @@ class ExDocument(ApiExampleBase):
         with self.assertRaises(Exception):
             doc_with_revision.compare(doc1, "John Doe", datetime.now())
 
+    def test_document_fingerprint(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+        for i in range(10):
+            builder.writeln(f"Paragraph {i}.")
+        DocumentHelper.insert_table(builder)
+
+        fingerprint = DocumentFingerprint.of(doc, with_formatting=True)
+
+        # Fingerprints of equal documents are equal, and survive a round trip through JSON.
+        clone = doc.clone().as_document()
+        self.assertTrue(fingerprint.equals(DocumentFingerprint.of(clone, with_formatting=True), compare_formatting=True))
+        self.assertTrue(fingerprint.matches(clone, compare_formatting=True))
+        self.assertTrue(fingerprint.equals(DocumentFingerprint.from_json(fingerprint.to_json()), compare_formatting=True))
+
+        # A formatting change is noticed only when formatting is compared.
+        clone.first_section.body.paragraphs[3].runs[0].font.bold = True
+        self.assertTrue(fingerprint.matches(clone))
+        self.assertFalse(fingerprint.matches(clone, compare_formatting=True))
+        self.assertEqual([(0, "replace", 3, 4, 3, 4)],
+                         fingerprint.changes(DocumentFingerprint.of(clone, with_formatting=True), compare_formatting=True))
+
+        # Text changes are summarized as runs of changed blocks.
+        clone.first_section.body.paragraphs[5].runs[0].text = "Changed paragraph."
+        clone.first_section.body.paragraphs[8].remove()
+        other = DocumentFingerprint.of(clone)
+
+        self.assertFalse(fingerprint.equals(other))
+        self.assertFalse(fingerprint.matches(clone))
+        self.assertEqual([(0, "replace", 5, 6, 5, 6), (0, "delete", 8, 9, 8, 8)], fingerprint.changes(other))
+
+        with self.assertRaises(ValueError):
+            other.equals(fingerprint, compare_formatting=True)
+
     def test_compare_options(self):
 
         #ExStart
@@ -9,6 +9,7 @@ import io
 import aspose.words as aw
 
 from api_example_base import ApiExampleBase, MY_DIR
+from document_statistics import MultiVisitor, NodeCountCollector, WordCountCollector, FieldInventoryCollector, CommentCollector
 
 class ExDocumentVisitor(ApiExampleBase):
 
@@ -1017,3 +1018,24 @@ class ExDocumentVisitor(ApiExampleBase):
 
         self.assertIn("[StructuredDocumentTag start]", visitor_text)
         self.assertIn("[StructuredDocumentTag end]", visitor_text)
+
+    def test_multi_visitor_statistics(self):
+
+        doc = aw.Document(MY_DIR + "DocumentVisitor-compatible features.docx")
+
+        # Gather several kinds of statistics with a single traversal of the document.
+        node_counts = NodeCountCollector()
+        word_count = WordCountCollector()
+        fields = FieldInventoryCollector()
+        comments = CommentCollector()
+
+        doc.accept(MultiVisitor(node_counts, word_count, fields, comments))
+
+        self.assertEqual(doc.get_child_nodes(aw.NodeType.PARAGRAPH, True).count, node_counts.counts["paragraphs"])
+        self.assertEqual(doc.get_child_nodes(aw.NodeType.RUN, True).count, node_counts.counts["runs"])
+        self.assertEqual(doc.get_child_nodes(aw.NodeType.TABLE, True).count, node_counts.counts["tables"])
+        self.assertEqual(doc.get_child_nodes(aw.NodeType.COMMENT, True).count, len(comments.comments))
+        self.assertEqual(doc.range.fields.count, len(fields.fields))
+        self.assertLess(0, word_count.words)
+
+        print(comments.get_text())
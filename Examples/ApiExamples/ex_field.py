@@ -14,6 +14,8 @@ import aspose.pydrawing as drawing
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, IMAGE_DIR
 from document_helper import DocumentHelper
+from field_update_scheduler import FieldUpdateScheduler
+from incremental_field_update import IncrementalFieldUpdater
 
 class ExField(ApiExampleBase):
 
@@ -335,6 +337,191 @@ class ExField(ApiExampleBase):
 
                 #ExEnd
 
+    def test_field_update_scheduler(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        # Insert fields with out of date results.
+        builder.write("Price: ")
+        builder.start_bookmark("Price")
+        builder.insert_field("= 2 * 5", "0")
+        builder.end_bookmark("Price")
+        builder.writeln()
+
+        for _ in range(3):
+            builder.write("Row ")
+            builder.insert_field("SEQ Row", "0")
+            builder.write(": ")
+            builder.insert_field("= 3 + 4", "0")
+            builder.write(", price ")
+            builder.insert_field("REF Price", "0")
+            builder.writeln()
+
+        builder.write("Page ")
+        builder.insert_field("PAGE", "0")
+        builder.write(" of ")
+        builder.insert_field("NUMPAGES", "0")
+
+        expected_doc = doc.clone()
+        expected_doc.update_fields()
+
+        scheduler = FieldUpdateScheduler(doc)
+
+        # Each REF field is updated after the formula inside its bookmark, and each SEQ field after the previous one.
+        formula, seq, ref = 0, 1, 3
+        self.assertIn(formula, scheduler.dependencies[ref])
+        self.assertIn(seq, scheduler.dependencies[seq + 3])
+
+        statistics = scheduler.update()
+
+        # The repeated "= 3 + 4" formula is evaluated once, and PAGE and NUMPAGES are updated after the layout.
+        self.assertEqual(12, statistics.fields)
+        self.assertEqual(2, statistics.memoized)
+        self.assertEqual(2, statistics.layout_fields)
+
+        self.assertEqual([field.result for field in expected_doc.range.fields], [field.result for field in doc.range.fields])
+        self.assertEqual(["1", "2", "3"], [field.result for field in doc.range.fields if field.type == aw.fields.FieldType.FIELD_SEQUENCE])
+        self.assertEqual("10", doc.range.fields[ref].result)
+
+    def test_field_update_scheduler_table_formulas(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        # The same formula sums a different row in each cell.
+        builder.start_table()
+        for first, second in (("1", "2"), ("3", "4")):
+            builder.insert_cell()
+            builder.write(first)
+            builder.insert_cell()
+            builder.write(second)
+            builder.insert_cell()
+            builder.insert_field("= SUM(LEFT)", "0")
+            builder.end_row()
+        builder.end_table()
+
+        scheduler = FieldUpdateScheduler(doc)
+        self.assertEqual([None, None], scheduler.memo_keys)
+
+        statistics = scheduler.update()
+
+        self.assertEqual(0, statistics.memoized)
+        self.assertEqual(["3", "7"], [field.result for field in doc.range.fields])
+
+    def test_field_update_scheduler_formatted_results(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.font.bold = True
+        builder.insert_field("= 3 + 4", "0")
+        builder.writeln()
+        builder.font.bold = False
+
+        # A result in runs with different formatting cannot be replaced by a stored plain text result.
+        field = builder.insert_field("= 3 + 4", "0")
+        italic_run = aw.Run(doc, "0")
+        italic_run.font.italic = True
+        field.separator.parent_node.insert_after(italic_run, field.separator)
+        builder.writeln()
+
+        builder.font.underline = aw.Underline.SINGLE
+        builder.insert_field("= 3 + 4", "0")
+
+        statistics = FieldUpdateScheduler(doc).update()
+
+        # Only the last formula gets the stored result; the one with two result runs is evaluated.
+        self.assertEqual(1, statistics.memoized)
+
+        formulas = [field for field in doc.range.fields if field.type == aw.fields.FieldType.FIELD_FORMULA]
+        self.assertEqual(["7", "7", "7"], [field.result for field in formulas])
+
+        # The memoized field keeps the formatting of its own result.
+        result_run = formulas[2].separator.next_sibling.as_run()
+        self.assertEqual(aw.Underline.SINGLE, result_run.font.underline)
+        self.assertFalse(result_run.font.bold)
+
+    def test_incremental_field_update(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        doc.built_in_document_properties.author = "John Doe"
+        doc.variables.add("Price", "5")
+
+        builder.write("Author: ")
+        builder.insert_field("AUTHOR")
+        builder.write(", price: ")
+        builder.start_bookmark("Total")
+        builder.insert_field("DOCVARIABLE Price")
+        builder.end_bookmark("Total")
+        builder.write(", price again: ")
+        builder.insert_field("REF Total")
+        builder.writeln()
+
+        for _ in range(3):
+            builder.insert_field("SEQ Row")
+            builder.writeln()
+
+        doc.update_fields()
+        updater = IncrementalFieldUpdater(doc)
+
+        # Field arguments are read for fields of all types.
+        self.assertEqual(["Price", "Total", "Row"], [updater.scheduler.argument(index) for index in (1, 2, 3)])
+
+        # Nothing changed, so no field is recomputed.
+        self.assertEqual(0, updater.update())
+
+        # The variable changed: the DOCVARIABLE field and the REF field to the bookmark around it are recomputed.
+        doc.variables.add("Price", "7")
+
+        self.assertEqual(2, updater.update())
+        self.assertEqual(["7", "7"], [doc.range.fields[1].result, doc.range.fields[2].result])
+
+        doc.built_in_document_properties.author = "Jane Doe"
+
+        self.assertEqual(1, updater.update())
+        self.assertEqual("Jane Doe", doc.range.fields[0].result)
+
+        # After a field is inserted, all fields are recomputed once.
+        builder.insert_field("SEQ Row")
+
+        self.assertEqual(7, updater.update())
+        self.assertEqual("4", doc.range.fields[6].result)
+
+        # Removing one field and inserting another is noticed too, although the number of fields stays the same.
+        doc.range.fields[0].remove()
+        builder.insert_field("SEQ Row")
+
+        self.assertEqual(7, updater.update())
+        self.assertEqual("5", doc.range.fields[6].result)
+
+    def test_incremental_merge_field_update(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.insert_field("MERGEFIELD Name \\b \"Dear \" \\f \",\" \\* Upper")
+        builder.writeln()
+        builder.insert_field("MERGEFIELD Price \\# \"0.00\"")
+        builder.writeln()
+        builder.insert_field("MERGEFIELD Date \\@ \"d MMMM yyyy\"")
+
+        updater = IncrementalFieldUpdater(doc)
+
+        # Merge data is formatted by the switches of each merge field.
+        self.assertEqual(3, updater.update({"Name": "john doe", "Price": 1234.5, "Date": "2024-03-05"}))
+        self.assertEqual(["Dear JOHN DOE,", "1234.50", "5 March 2024"], [field.result for field in doc.range.fields])
+
+        # A field replaced by one with the same code is looked up again, so the new field gets the merge data.
+        doc.range.fields[1].remove()
+        builder.move_to_paragraph(1, 0)
+        builder.insert_field("MERGEFIELD Price \\# \"0.00\"")
+
+        self.assertEqual(1, updater.update({"Price": 7}))
+        self.assertEqual(["Dear JOHN DOE,", "7.00", "5 March 2024"], [field.result for field in doc.range.fields])
+
     def test_insert_field_with_field_builder_exception(self):
 
         doc = aw.Document()
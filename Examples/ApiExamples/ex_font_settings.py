@@ -5,12 +5,16 @@
 # "as is", without warranty of any kind, either expressed or implied.
 
 import io
+import os
+import shutil
 import platform
 import xml.etree.ElementTree as ET
 
 import aspose.words as aw
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, FONTS_DIR
+from font_cache import FontCacheManager
+from font_pool import FontPool
 
 class ExFontSettings(ApiExampleBase):
 
@@ -652,6 +656,63 @@ class ExFontSettings(ApiExampleBase):
         self.assertEqual(0, memory_font_source.priority)
         #ExEnd
 
+    def test_persistent_font_search_cache(self):
+
+        cache_dir = ARTIFACTS_DIR + "FontSettings.persistent_font_search_cache"
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+        # The first process parses every font and saves the search cache and the font manifest.
+        manager = FontCacheManager(cache_dir, [FONTS_DIR])
+        manager.create_font_settings()
+
+        self.assertLess(0, manager.hashed)
+        self.assertTrue(os.path.exists(manager.search_cache_file_name))
+
+        # Any later process reuses both, so unchanged fonts are neither hashed nor parsed again.
+        # With a font pool, the font sources are shared with every other user of the pool.
+        pool = FontPool()
+        manager = FontCacheManager(cache_dir, [FONTS_DIR], pool=pool)
+        font_settings = manager.create_font_settings()
+
+        self.assertEqual(0, manager.hashed)
+        self.assertEqual(len(manager.manifest), manager.reused)
+
+        doc = aw.Document()
+        doc.font_settings = font_settings
+        builder = aw.DocumentBuilder(doc)
+        builder.font.name = "Kreon"
+        builder.writeln("Hello world!")
+
+        doc.save(ARTIFACTS_DIR + "FontSettings.persistent_font_search_cache.pdf")
+
+        self.assertLess(0, len(pool))
+
+    def test_font_pool(self):
+
+        pool = FontPool(memory_budget=64 * 1024 * 1024)
+
+        # Both documents use the same font source instead of holding their own copy of the font bytes.
+        for i in range(2):
+            doc = aw.Document()
+            doc.font_settings = pool.create_font_settings([MY_DIR + "Alte DIN 1451 Mittelschrift.ttf"])
+
+            builder = aw.DocumentBuilder(doc)
+            builder.font.name = "Alte DIN 1451 Mittelschrift"
+            builder.writeln("Hello world!")
+
+            doc.save(ARTIFACTS_DIR + "FontSettings.font_pool.{}.pdf".format(i))
+
+        self.assertEqual(1, len(pool))
+        self.assertEqual(os.path.getsize(MY_DIR + "Alte DIN 1451 Mittelschrift.ttf"), pool.loaded_bytes)
+        self.assertEqual(aw.fonts.FontSourceType.MEMORY_FONT, pool.get_font_source(MY_DIR + "Alte DIN 1451 Mittelschrift.ttf").type)
+
+        # Fonts beyond the memory budget are read from disk only when they are needed.
+        pool = FontPool(memory_budget=0)
+        font_source = pool.get_font_source(MY_DIR + "Alte DIN 1451 Mittelschrift.ttf")
+
+        self.assertEqual(aw.fonts.FontSourceType.FONT_FILE, font_source.type)
+        self.assertEqual(0, pool.loaded_bytes)
+
     def test_font_source_system(self):
 
         #ExStart
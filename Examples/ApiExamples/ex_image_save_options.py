@@ -4,6 +4,7 @@
 # is only intended as a supplement to the documentation, and is provided
 # "as is", without warranty of any kind, either expressed or implied.
 
+import io
 import os
 import glob
 import unittest
@@ -11,7 +12,8 @@ import unittest
 import aspose.words as aw
 import aspose.pydrawing as drawing
 
-from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, IMAGE_DIR
+from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, IMAGE_DIR, GOLDS_DIR
+from page_rasterizer import PageRasterizer
 
 class ExImageSaveOptions(ApiExampleBase):
 
@@ -228,6 +230,75 @@ class ExImageSaveOptions(ApiExampleBase):
         for image_file_name in image_file_names:
             self.verify_image(816, 1056, filename=image_file_name)
 
+    def test_page_by_page_single_layout(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.writeln("Page 1.")
+        builder.insert_break(aw.BreakType.PAGE_BREAK)
+        builder.writeln("Page 2.")
+        builder.insert_image(IMAGE_DIR + "Logo.jpg")
+        builder.insert_break(aw.BreakType.PAGE_BREAK)
+        builder.writeln("Page 3.")
+
+        # Lay the document out once and render its pages on two threads.
+        rasterizer = PageRasterizer(doc, aw.SaveFormat.TIFF, max_workers=2)
+        image_file_names = rasterizer.save(ARTIFACTS_DIR + "ImageSaveOptions.page_by_page_single_layout.{}.tiff")
+
+        self.assertEqual(3, len(image_file_names))
+
+        for image_file_name in image_file_names:
+            self.verify_image(816, 1056, filename=image_file_name)
+
+        # Pages can also be rendered into memory, in the requested order.
+        pages = list(PageRasterizer(doc, aw.SaveFormat.PNG).render([2, 0]))
+
+        self.assertEqual([2, 0], [page_index for page_index, _ in pages])
+        for _, data in pages:
+            self.verify_image(816, 1056, image_stream=io.BytesIO(data))
+
+    def test_verify_rendered_pixels(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.writeln("Hello world!")
+        builder.insert_image(IMAGE_DIR + "Logo.jpg")
+        builder.insert_break(aw.BreakType.PAGE_BREAK)
+
+        options = aw.saving.ImageSaveOptions(aw.SaveFormat.PNG)
+        options.resolution = 300
+
+        options.page_set = aw.saving.PageSet(0)
+        doc.save(ARTIFACTS_DIR + "ImageSaveOptions.verify_rendered_pixels.1.png", options)
+        options.page_set = aw.saving.PageSet(1)
+        doc.save(ARTIFACTS_DIR + "ImageSaveOptions.verify_rendered_pixels.2.png", options)
+
+        # The first page has text and an image, the second page is empty.
+        self.verify_image_is_blank(False, filename=ARTIFACTS_DIR + "ImageSaveOptions.verify_rendered_pixels.1.png")
+        self.verify_image_is_blank(True, filename=ARTIFACTS_DIR + "ImageSaveOptions.verify_rendered_pixels.2.png")
+
+        # A freshly rendered page matches the reference pixels of the part of the page that holds the image.
+        # The image is placed at fixed page coordinates, so the text above it does not move it.
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+        builder.page_setup.page_width = aw.ConvertUtil.pixel_to_point(816)
+        builder.page_setup.page_height = aw.ConvertUtil.pixel_to_point(1056)
+
+        builder.writeln("Hello world!")
+        builder.insert_image(IMAGE_DIR + "Logo.jpg",
+                             aw.drawing.RelativeHorizontalPosition.PAGE, aw.ConvertUtil.pixel_to_point(96),
+                             aw.drawing.RelativeVerticalPosition.PAGE, aw.ConvertUtil.pixel_to_point(384),
+                             aw.ConvertUtil.pixel_to_point(288), aw.ConvertUtil.pixel_to_point(288), aw.drawing.WrapType.NONE)
+
+        options = aw.saving.ImageSaveOptions(aw.SaveFormat.PNG)
+        options.image_color_mode = aw.saving.ImageColorMode.BLACK_AND_WHITE
+        doc.save(ARTIFACTS_DIR + "ImageSaveOptions.verify_rendered_pixels.gold.png", options)
+
+        self.verify_image_matches_gold(ARTIFACTS_DIR + "ImageSaveOptions.verify_rendered_pixels.gold.png",
+                                       GOLDS_DIR + "ImageSaveOptions.VerifyRenderedPixels Gold.png", region=(96, 384, 288, 288))
+
     def test_color_mode(self):
 
         for image_color_mode in (aw.saving.ImageColorMode.BLACK_AND_WHITE,
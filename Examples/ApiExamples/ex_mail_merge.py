@@ -10,6 +10,8 @@ import aspose.words as aw
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, GOLDS_DIR, DATABASE_DIR
 from document_helper import DocumentHelper
+import sharded_mail_merge
+from mail_merge_data_sources import RowsMailMergeDataSource
 
 class ExMailMerge(ApiExampleBase):
 
@@ -1746,3 +1748,69 @@ class ExMailMerge(ApiExampleBase):
         #ExEnd
 
         self.assertEqual(4, doc.first_section.body.paragraphs.count)
+
+    def test_execute_sharded(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.insert_field(" MERGEFIELD FullName ")
+        builder.insert_paragraph()
+        builder.insert_field(" MERGEFIELD City ")
+
+        doc.first_section.page_setup.section_start = aw.SectionStart.CONTINUOUS
+
+        rows = [("Person " + str(i), "City " + str(i)) for i in range(10)]
+
+        # Merge disjoint ranges of three records in two worker processes, and reassemble the results in record order.
+        merged = sharded_mail_merge.execute_sharded(doc, ["FullName", "City"], rows, max_workers=2, chunk_size=3,
+                                                    retain_first_section_start=True)
+
+        self.assertEqual(len(rows), merged.sections.count)
+        for section in merged.sections:
+            self.assertEqual(aw.SectionStart.CONTINUOUS, section.page_setup.section_start)
+
+        text = merged.get_text()
+        positions = [text.index(full_name) for full_name, _ in rows]
+        self.assertEqual(sorted(positions), positions)
+
+        # Alternatively, save every record as a separate document.
+        file_names = sharded_mail_merge.execute_per_record(doc, ["FullName", "City"], rows,
+                                                           ARTIFACTS_DIR + "MailMerge.execute_sharded.{}.docx", max_workers=2)
+
+        self.assertEqual(len(rows), len(file_names))
+        for (full_name, city), file_name in zip(rows, file_names):
+            record = aw.Document(file_name)
+            self.assertEqual(full_name + "\r" + city, record.get_text().strip())
+
+    def test_execute_sharded_section_starts(self):
+
+        def create_template() -> aw.Document:
+            doc = aw.Document()
+            builder = aw.DocumentBuilder(doc)
+
+            builder.insert_field(" MERGEFIELD Name ")
+            builder.insert_paragraph()
+            builder.insert_field(" MERGEFIELD City ")
+
+            doc.first_section.page_setup.section_start = aw.SectionStart.CONTINUOUS
+
+            # Mail merge settings of the template are used by every worker.
+            doc.mail_merge.mapped_data_fields.add("Name", "FullName")
+            doc.mail_merge.cleanup_options = aw.mailmerging.MailMergeCleanupOptions.REMOVE_EMPTY_PARAGRAPHS
+            return doc
+
+        columns = ["FullName", "City"]
+        rows = [("Person " + str(i), "City " + str(i) if i % 2 else "") for i in range(7)]
+
+        merged = sharded_mail_merge.execute_sharded(create_template(), columns, rows, max_workers=2, chunk_size=3)
+
+        single = create_template()
+        single.mail_merge.retain_first_section_start = False
+        single.mail_merge.execute(RowsMailMergeDataSource(columns, rows))
+
+        # Records after the first start on a new page, including the first record of every chunk after the first.
+        self.assertEqual([section.as_section().page_setup.section_start for section in single.sections],
+                         [section.as_section().page_setup.section_start for section in merged.sections])
+        self.assertEqual(aw.SectionStart.NEW_PAGE, merged.sections[3].page_setup.section_start)
+        self.assertEqual(single.get_text(), merged.get_text())
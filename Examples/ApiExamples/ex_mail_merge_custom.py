@@ -4,11 +4,15 @@
 # is only intended as a supplement to the documentation, and is provided
 # "as is", without warranty of any kind, either expressed or implied.
 
+import csv
+import json
+import sqlite3
 from typing import Dict, List
 
 import aspose.words as aw
 
 from api_example_base import ApiExampleBase, ARTIFACTS_DIR
+from mail_merge_data_sources import CsvMailMergeDataSource, NdjsonMailMergeDataSource, SqliteMailMergeDataSource
 
 class ExMailMergeCustom(ApiExampleBase):
 
@@ -252,3 +256,49 @@ class ExMailMergeCustom(ApiExampleBase):
                 data_table.rows.add([full_name, department])
 
         self.mail_merge_matches_data_table(data_table, doc, False)
+
+    def test_streaming_data_sources(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+        builder.insert_field(" MERGEFIELD FullName ")
+        builder.insert_paragraph()
+        builder.insert_field(" MERGEFIELD Address ")
+
+        customers = [ExMailMergeCustom.Customer("Thomas Hardy", "120 Hanover Sq., London"),
+                     ExMailMergeCustom.Customer("Paolo Accorti", "Via Monte Bianco 34, Torino")]
+
+        with open(ARTIFACTS_DIR + "MailMergeCustom.streaming_data_sources.csv", "wt", encoding="utf-8", newline="") as stream:
+            writer = csv.writer(stream)
+            writer.writerow(["FullName", "Address"])
+            for customer in customers:
+                writer.writerow([customer.full_name, customer.address])
+
+        with open(ARTIFACTS_DIR + "MailMergeCustom.streaming_data_sources.ndjson", "wt", encoding="utf-8") as stream:
+            for customer in customers:
+                stream.write(json.dumps({"FullName": customer.full_name, "Address": customer.address}) + "\n")
+
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE Customers (FullName TEXT, Address TEXT)")
+        connection.executemany("INSERT INTO Customers VALUES (?, ?)", [(c.full_name, c.address) for c in customers])
+
+        # Each data source reads its records one at a time, so none of them holds the whole data set in memory.
+        data_sources = [
+            CsvMailMergeDataSource(ARTIFACTS_DIR + "MailMergeCustom.streaming_data_sources.csv", "Customer"),
+            NdjsonMailMergeDataSource(ARTIFACTS_DIR + "MailMergeCustom.streaming_data_sources.ndjson", "Customer"),
+            SqliteMailMergeDataSource(connection, "SELECT FullName, Address FROM Customers", table_name="Customer", chunk_size=1),
+        ]
+
+        merge_data = [[customer.full_name, customer.address] for customer in customers]
+
+        for data_source in data_sources:
+            self.assertEqual(["FullName", "Address"], data_source.columns)
+
+            merged = doc.clone()
+            merged.mail_merge.execute(data_source)
+            data_source.close()
+
+            self.assertTrue(data_source.is_eof)
+            self.mail_merge_matches_array(merge_data, merged, True)
+
+        connection.close()
@@ -0,0 +1,359 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Resident document conversion service for SharePoint.
+
+The one-shot converters (ex_moss_doc2pdf.py, ex_moss_rtf2docx.py) pay for the runtime bootstrap,
+the license load and the font scan on every call. This service does that work once and then serves
+conversion requests over a local UNIX socket or over stdin/stdout, one JSON object per line:
+
+    {"id": 1, "op": "doc2pdf", "in": "in.docx", "out": "out.pdf"}
+    {"id": 1, "ok": true, "ms": 41.7}
+
+Supported operations are "doc2pdf", "rtf2docx", "convert" (the output format is taken from the output file extension),
+"stats" (p50/p99 latency per operation) and "shutdown".
+
+Start the service:
+
+    python ex_moss_conversion_service.py serve -socket /tmp/aw-convert.sock [-license <file>] [-fonts <folder>]
+
+The client shim keeps the "-in/-out/-config/-log" command line contract of the one-shot converters,
+and falls back to an in-process conversion when it cannot connect to the service. A failure after the request
+was sent is reported instead, since the service may have converted the document already:
+
+    python ex_moss_conversion_service.py doc2pdf -socket /tmp/aw-convert.sock -in in.docx -out out.pdf -log log.txt
+
+Only the service and the in-process fallback import Aspose.Words, so a client call that reaches the service
+does not pay for loading it."""
+
+import io
+import os
+import sys
+import json
+import time
+import socket
+import logging
+import collections
+import socketserver
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional
+
+# Default location of the service socket.
+DEFAULT_SOCKET_PATH = "/tmp/aspose-words-conversion.sock"
+
+# Number of recent requests per operation the latency percentiles are computed over.
+LATENCY_WINDOW = 10000
+
+
+# Conversion operations, besides "stats" and "shutdown".
+OPERATION_NAMES = ("doc2pdf", "rtf2docx", "convert")
+
+
+class ServiceUnavailableError(Exception):
+    """Raised by the client when no service accepts connections at the socket path."""
+
+
+class ClientOptions(NamedTuple):
+    in_file_name: str
+    out_file_name: str
+    log_file_name: Optional[str] = None
+
+
+def convert_any(in_file_name: str, out_file_name: str):
+    import aspose.words as aw
+
+    # The output format is chosen from the extension of the output file name.
+    doc = aw.Document(in_file_name)
+
+    doc.save(out_file_name)
+
+
+def load_operations() -> Dict[str, Callable[[str, str], None]]:
+    """Imports the converters, and with them Aspose.Words, and returns them by operation name."""
+
+    from ex_moss_doc2pdf import convert_doc2pdf
+    from ex_moss_rtf2docx import ExMossRtf2Docx
+
+    return {
+        "doc2pdf": convert_doc2pdf,
+        "rtf2docx": ExMossRtf2Docx.convert_rtf_to_docx,
+        "convert": convert_any,
+    }
+
+
+class ConversionService:
+    """Keeps Aspose.Words loaded, licensed and its font settings warm between conversion requests."""
+
+    def __init__(self, license_path: Optional[str] = None, fonts_folders: Optional[List[str]] = None):
+        import aspose.words as aw
+
+        self.logger = logging.getLogger("conversion_service")
+        self.latencies = {}  # type: Dict[str, Deque[float]]
+        self.operations = load_operations()
+
+        if license_path is not None:
+            words_license = aw.License()
+            words_license.set_license(license_path)
+
+        # Every document created in this process uses the default font settings instance,
+        # so configuring it once makes all conversions share the same font search cache.
+        if fonts_folders:
+            aw.fonts.FontSettings.default_instance.set_fonts_folders(fonts_folders, True)
+
+        self.warm_up()
+
+    @staticmethod
+    def warm_up():
+        """Renders a small document once, so that the font scan happens before the first real request."""
+        import aspose.words as aw
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+        builder.writeln("Warm-up")
+        doc.save(io.BytesIO(), aw.SaveFormat.PDF)
+
+    def handle(self, request: dict) -> dict:
+        """Executes one request and returns its response. Never raises."""
+
+        op = request.get("op")
+        response = {"id": request.get("id")}
+
+        if op == "stats":
+            response["ok"] = True
+            response["stats"] = self.stats()
+            return response
+
+        if op not in self.operations:
+            response["ok"] = False
+            response["error"] = "Unknown operation: " + str(op)
+            return response
+
+        start = time.perf_counter()
+        try:
+            self.operations[op](request["in"], request["out"])
+            response["ok"] = True
+        except Exception as e:
+            self.logger.exception("%s failed for %s", op, request.get("in"))
+            response["ok"] = False
+            response["error"] = str(e)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.latencies.setdefault(op, collections.deque(maxlen=LATENCY_WINDOW)).append(elapsed_ms)
+        response["ms"] = round(elapsed_ms, 3)
+        return response
+
+    def stats(self) -> Dict[str, dict]:
+        """Returns request count and p50/p99 latency, in milliseconds, per operation."""
+
+        result = {}
+        for op, latencies in self.latencies.items():
+            ordered = sorted(latencies)
+            result[op] = {
+                "count": len(ordered),
+                "p50": ConversionService.percentile(ordered, 50),
+                "p99": ConversionService.percentile(ordered, 99),
+            }
+        return result
+
+    @staticmethod
+    def percentile(ordered: List[float], percent: float) -> float:
+        """Nearest-rank percentile of an already sorted list."""
+
+        if not ordered:
+            return 0.0
+
+        rank = max(1, -(-len(ordered) * percent // 100))
+        return round(ordered[int(rank) - 1], 3)
+
+    def serve_lines(self, reader, writer) -> bool:
+        """Serves line-delimited JSON requests until the input ends.
+        Returns True when a "shutdown" request was received."""
+
+        for line in reader:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"ok": False, "error": "Malformed request: " + str(e)}
+            else:
+                if request.get("op") == "shutdown":
+                    writer.write(json.dumps({"id": request.get("id"), "ok": True}) + "\n")
+                    writer.flush()
+                    return True
+                response = self.handle(request)
+
+            writer.write(json.dumps(response) + "\n")
+            writer.flush()
+
+        return False
+
+    def serve_stdio(self):
+        self.serve_lines(sys.stdin, sys.stdout)
+
+    def serve_unix_socket(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        """Serves connections one at a time. Each connection may send any number of requests."""
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+
+            def handle(self):
+                reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+                writer = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+                if service.serve_lines(reader, writer):
+                    self.server.stop_requested = True
+
+        with socketserver.UnixStreamServer(socket_path, Handler) as server:
+            server.stop_requested = False
+            self.logger.info("Listening on %s", socket_path)
+            while not server.stop_requested:
+                server.handle_request()
+
+        os.remove(socket_path)
+
+
+def send_request(request: dict, socket_path: str = DEFAULT_SOCKET_PATH) -> dict:
+    """Sends a single request to a running service and returns its response.
+
+    Raises "ServiceUnavailableError" if the service cannot be reached. Errors after the connection was made,
+    including an empty or malformed response, are raised as other exceptions."""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ServiceUnavailableError("Conversion service is not available at {}: {}".format(socket_path, e)) from e
+
+        with client.makefile("rw", encoding="utf-8") as stream:
+            stream.write(json.dumps(request) + "\n")
+            stream.flush()
+            line = stream.readline()
+
+    if not line:
+        raise Exception("Conversion service closed the connection without a response.")
+
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        raise Exception("Conversion service sent a malformed response: " + line.strip()) from e
+    if not isinstance(response, dict):
+        raise Exception("Conversion service sent a malformed response: " + line.strip())
+
+    return response
+
+
+def parse_client_command_line(args: List[str]) -> ClientOptions:
+    """Parses the "-in/-out/-config/-log" command line of the one-shot converters."""
+
+    in_file_name = None
+    out_file_name = None
+    log_file_name = None
+
+    i = 0
+    while i < len(args):
+        token = args[i].lower()
+        if token == "-in":
+            i += 1
+            in_file_name = args[i]
+
+        elif token == "-out":
+            i += 1
+            out_file_name = args[i]
+
+        elif token == "-log":
+            i += 1
+            log_file_name = args[i]
+
+        elif token == "-config":
+            # Skip the name of the config file and do nothing.
+            i += 1
+
+        else:
+            raise Exception("Unknown command line argument: " + token)
+
+        i += 1
+
+    if in_file_name is None or out_file_name is None:
+        raise Exception("Both -in and -out are required.")
+
+    return ClientOptions(in_file_name, out_file_name, log_file_name)
+
+
+def main():
+
+    args = sys.argv[1:]
+    if not args:
+        raise Exception("Usage: ex_moss_conversion_service.py serve|stdio|doc2pdf|rtf2docx|convert [options]")
+
+    command = args[0].lower()
+    socket_path = DEFAULT_SOCKET_PATH
+    license_path = None
+    fonts_folders = []
+    rest = []
+
+    i = 1
+    while i < len(args):
+        token = args[i].lower()
+        if token == "-socket":
+            i += 1
+            socket_path = args[i]
+
+        elif token == "-license":
+            i += 1
+            license_path = args[i]
+
+        elif token == "-fonts":
+            i += 1
+            fonts_folders.append(args[i])
+
+        else:
+            rest.append(args[i])
+
+        i += 1
+
+    if command in ("serve", "stdio"):
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        service = ConversionService(license_path, fonts_folders)
+        if command == "serve":
+            service.serve_unix_socket(socket_path)
+        else:
+            service.serve_stdio()
+        return
+
+    if command not in OPERATION_NAMES:
+        raise Exception("Unknown command: " + command)
+
+    # Client mode: the remaining arguments follow the "-in/-out/-config/-log" contract of the one-shot converters.
+    options = parse_client_command_line(rest)
+    if options.log_file_name is not None:
+        logging.basicConfig(filename=options.log_file_name, level=logging.INFO)
+
+    logger = logging.getLogger(command)
+    logger.info('Command line: ' + ' '.join(args))
+
+    # The service runs in another working directory, so it gets absolute file names.
+    request = {"id": os.getpid(), "op": command,
+               "in": os.path.abspath(options.in_file_name), "out": os.path.abspath(options.out_file_name)}
+
+    try:
+        response = send_request(request, socket_path)
+    except ServiceUnavailableError:
+        # The service is not running, so convert in this process.
+        logger.warning("Conversion service is not available at %s, converting in-process", socket_path)
+        load_operations()[command](options.in_file_name, options.out_file_name)
+        return
+
+    if not response.get("ok"):
+        raise Exception(response.get("error"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+import socketserver
+
+from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR
+from ex_moss_conversion_service import ServiceUnavailableError, send_request
+
+SERVICE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ex_moss_conversion_service.py")
+
+
+class ExMossConversionServiceRoundTrip(ApiExampleBase):
+
+    def test_stdio_round_trip(self):
+
+        requests = [
+            json.dumps({"id": 1, "op": "doc2pdf", "in": MY_DIR + "Document.docx", "out": ARTIFACTS_DIR + "MossConversionService.stdio.pdf"}),
+            json.dumps({"id": 2, "op": "resize"}),
+            "not a request",
+            json.dumps({"id": 3, "op": "stats"}),
+            json.dumps({"id": 4, "op": "shutdown"}),
+        ]
+
+        completed = subprocess.run([sys.executable, SERVICE_SCRIPT, "stdio"], input="\n".join(requests) + "\n",
+                                   capture_output=True, text=True, cwd=os.path.dirname(SERVICE_SCRIPT), timeout=300)
+        self.assertEqual(0, completed.returncode, completed.stderr)
+
+        responses = [json.loads(line) for line in completed.stdout.splitlines()]
+        self.assertEqual([1, 2, None, 3, 4], [response.get("id") for response in responses])
+        self.assertEqual([True, False, False, True, True], [response["ok"] for response in responses])
+        self.assertTrue(os.path.exists(ARTIFACTS_DIR + "MossConversionService.stdio.pdf"))
+        self.assertEqual(1, responses[3]["stats"]["doc2pdf"]["count"])
+
+    def test_client_round_trip(self):
+
+        socket_path = os.path.join(tempfile.mkdtemp(), "service.sock")
+        service = subprocess.Popen([sys.executable, SERVICE_SCRIPT, "serve", "-socket", socket_path],
+                                   cwd=os.path.dirname(SERVICE_SCRIPT), stderr=subprocess.DEVNULL)
+        try:
+            deadline = time.monotonic() + 300
+            while not os.path.exists(socket_path):
+                self.assertIsNone(service.poll(), "The service exited before it started listening.")
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.1)
+
+            # The client shim keeps the command line of the one-shot converter, and the service converts the document.
+            completed = subprocess.run([sys.executable, SERVICE_SCRIPT, "doc2pdf", "-socket", socket_path,
+                                        "-in", MY_DIR + "Document.docx", "-out", ARTIFACTS_DIR + "MossConversionService.client.pdf"],
+                                       capture_output=True, text=True, cwd=os.path.dirname(SERVICE_SCRIPT), timeout=300)
+            self.assertEqual(0, completed.returncode, completed.stderr)
+            self.assertTrue(os.path.exists(ARTIFACTS_DIR + "MossConversionService.client.pdf"))
+
+            self.assertEqual(1, send_request({"id": 1, "op": "stats"}, socket_path)["stats"]["doc2pdf"]["count"])
+            self.assertTrue(send_request({"id": 2, "op": "shutdown"}, socket_path)["ok"])
+            self.assertEqual(0, service.wait(timeout=60))
+        finally:
+            if service.poll() is None:
+                service.kill()
+                service.wait()
+
+    def test_client_fallback(self):
+
+        socket_path = os.path.join(tempfile.mkdtemp(), "missing.sock")
+
+        with self.assertRaises(ServiceUnavailableError):
+            send_request({"id": 1, "op": "stats"}, socket_path)
+
+        # Without a service, the client shim converts the document in its own process.
+        completed = subprocess.run([sys.executable, SERVICE_SCRIPT, "doc2pdf", "-socket", socket_path,
+                                    "-in", MY_DIR + "Document.docx", "-out", ARTIFACTS_DIR + "MossConversionService.fallback.pdf"],
+                                   capture_output=True, text=True, cwd=os.path.dirname(SERVICE_SCRIPT), timeout=300)
+        self.assertEqual(0, completed.returncode, completed.stderr)
+        self.assertTrue(os.path.exists(ARTIFACTS_DIR + "MossConversionService.fallback.pdf"))
+
+    def test_client_invalid_response(self):
+
+        for reply, message in ((b"", "without a response"), (b"<html>\n", "malformed response")):
+            with self.subTest(reply=reply):
+
+                class Handler(socketserver.StreamRequestHandler):
+
+                    def handle(self):
+                        self.rfile.readline()
+                        self.wfile.write(reply)
+
+                socket_path = os.path.join(tempfile.mkdtemp(), "broken.sock")
+                with socketserver.UnixStreamServer(socket_path, Handler) as server:
+                    thread = threading.Thread(target=server.handle_request)
+                    thread.start()
+
+                    # The request reached the service, so the client reports the error instead of converting again.
+                    with self.assertRaises(Exception) as context:
+                        send_request({"id": 1, "op": "doc2pdf"}, socket_path)
+                    thread.join()
+
+                self.assertNotIsInstance(context.exception, ServiceUnavailableError)
+                self.assertIn(message, str(context.exception))
@@ -5,11 +5,21 @@
 # "as is", without warranty of any kind, either expressed or implied.
 
 """DOC2PDF document converter for SharePoint.
-Uses Aspose.Words to perform the conversion."""
+Uses Aspose.Words to perform the conversion.
 
+Besides the single "-in/-out" conversion, the converter can process a whole batch of files
+("-batch <document|folder|glob|manifest> -outdir <folder>") on a pool of long-lived worker processes,
+so that the interpreter start and the "aspose.words" import are paid once per worker instead of once per file."""
+
+import csv
+import glob
+import collections
+import os
 import sys
+import time
 import logging
-from typing import List, NamedTuple
+import multiprocessing
+from typing import List, NamedTuple, Optional, Tuple
 
 import aspose.words as aw
 
@@ -17,6 +27,26 @@ import aspose.words as aw
 class Options(NamedTuple):
     in_file_name: str
     out_file_name: str
+    batch_source: Optional[str] = None
+    out_dir: Optional[str] = None
+    report_file_name: Optional[str] = None
+    max_workers: Optional[int] = None
+    timeout: Optional[float] = None
+
+
+class ConversionResult(NamedTuple):
+    in_file_name: str
+    out_file_name: str
+    status: str
+    seconds: float
+    error: str = ""
+
+
+# Extensions picked up when the batch source is a folder.
+BATCH_EXTENSIONS = (".doc", ".docx", ".docm", ".dot", ".dotx", ".rtf", ".odt", ".wml", ".html", ".htm", ".mht", ".mhtml", ".txt")
+
+# Default time limit for a single file, in seconds.
+DEFAULT_TIMEOUT = 300.0
 
 
 def convert_doc2pdf(in_file_name: str, out_file_name: str):
@@ -55,13 +85,165 @@ def main():
     # words_license = aw.License()
     # words_license.set_license("Aspose.Total.lic");
 
+    if options.batch_source is not None:
+        jobs = collect_batch_jobs(options.batch_source, options.out_dir)
+        results = convert_batch(jobs, options.max_workers, options.timeout or DEFAULT_TIMEOUT)
+        write_report(options.report_file_name or os.path.join(options.out_dir or ".", "doc2pdf_report.csv"), results)
+
+        failed = [result for result in results if result.status != "OK"]
+        logger.info("Converted %d file(s), %d failed", len(results) - len(failed), len(failed))
+        if failed:
+            sys.exit(1)
+        return
+
     convert_doc2pdf(options.in_file_name, options.out_file_name)
 
 
+def collect_batch_jobs(source: str, out_dir: Optional[str]) -> List[Tuple[str, str]]:
+    """Expands a batch source into a list of (input, output) file name pairs.
+
+    The source can be a single document, a folder (all supported documents in it), a glob pattern or a manifest file.
+    A file with one of the "BATCH_EXTENSIONS" (including ".txt") is a document; any other file is a manifest.
+    Each manifest line holds an input file name, optionally followed by a tab and an output file name.
+    Inputs without an explicit output are converted into "out_dir" (or next to the input) with a ".pdf" extension;
+    inputs that would get the same output name ("a.doc" and "a.docx") keep their extension ("a.doc.pdf", "a.docx.pdf")."""
+
+    if os.path.isdir(source):
+        in_file_names = sorted(os.path.join(source, name) for name in os.listdir(source)
+                               if os.path.splitext(name)[1].lower() in BATCH_EXTENSIONS)
+        return _pdf_jobs(in_file_names, out_dir)
+
+    if os.path.isfile(source):
+        if os.path.splitext(source)[1].lower() in BATCH_EXTENSIONS:
+            return _pdf_jobs([source], out_dir)
+
+        in_file_names = []
+        explicit_out_file_names = {}
+        with open(source, "rt", encoding="utf-8") as manifest:
+            for line in manifest:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                parts = line.split("\t")
+                in_file_names.append(parts[0])
+                if len(parts) > 1:
+                    explicit_out_file_names[len(in_file_names) - 1] = parts[1]
+
+        jobs = _pdf_jobs(in_file_names, out_dir)
+        for index, out_file_name in explicit_out_file_names.items():
+            jobs[index] = (in_file_names[index], out_file_name)
+        return jobs
+
+    return _pdf_jobs(sorted(glob.glob(source, recursive=True)), out_dir)
+
+
+def _pdf_jobs(in_file_names: List[str], out_dir: Optional[str]) -> List[Tuple[str, str]]:
+    """Pairs every input with a PDF file name, keeping the extension of inputs whose output names would collide."""
+
+    out_file_names = [_pdf_file_name(name, out_dir) for name in in_file_names]
+    counts = collections.Counter(os.path.normcase(name) for name in out_file_names)
+
+    return [(in_file_name, _pdf_file_name(in_file_name, out_dir, True) if counts[os.path.normcase(out_file_name)] > 1 else out_file_name)
+            for in_file_name, out_file_name in zip(in_file_names, out_file_names)]
+
+
+def _pdf_file_name(in_file_name: str, out_dir: Optional[str], keep_extension: bool = False) -> str:
+    base_name = os.path.basename(in_file_name)
+    if not keep_extension:
+        base_name = os.path.splitext(base_name)[0]
+    return os.path.join(out_dir if out_dir is not None else os.path.dirname(in_file_name), base_name + ".pdf")
+
+
+def _convert_job(job: Tuple[str, str]) -> ConversionResult:
+    """Runs in a worker process. Never raises, so that one broken file does not stop the batch."""
+
+    in_file_name, out_file_name = job
+    start = time.perf_counter()
+    try:
+        out_dir = os.path.dirname(out_file_name)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        convert_doc2pdf(in_file_name, out_file_name)
+        return ConversionResult(in_file_name, out_file_name, "OK", time.perf_counter() - start)
+    except Exception as e:
+        return ConversionResult(in_file_name, out_file_name, "FAILED", time.perf_counter() - start, str(e))
+
+
+def convert_batch(jobs: List[Tuple[str, str]], max_workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT) -> List[ConversionResult]:
+    """Converts a list of (input, output) pairs on a pool of worker processes.
+
+    At most "max_workers" files are converted at once. A file that takes longer than "timeout" seconds
+    is reported as timed out; the pool is then terminated (the worker cannot be interrupted otherwise)
+    and a fresh one continues with the remaining files. Results are returned in the order of "jobs".
+
+    The workers are started with the "spawn" method: this process has the .NET runtime loaded already,
+    and forking a process with a running runtime can deadlock the child."""
+
+    max_workers = max_workers or os.cpu_count() or 1
+    results = [None] * len(jobs)  # type: List[Optional[ConversionResult]]
+    pending = list(range(len(jobs)))
+    pending.reverse()
+
+    context = multiprocessing.get_context("spawn")
+    while pending:
+        pool = context.Pool(processes=min(max_workers, len(pending)))
+        in_flight = {}  # index -> (async result, deadline)
+        timed_out = False
+
+        try:
+            while (pending or in_flight) and not timed_out:
+                # Only keep as many files in flight as there are workers, so that a deadline
+                # starts counting when the file is actually picked up by a worker.
+                while pending and len(in_flight) < max_workers:
+                    index = pending.pop()
+                    in_flight[index] = (pool.apply_async(_convert_job, (jobs[index],)), time.monotonic() + timeout)
+
+                time.sleep(0.01)
+                now = time.monotonic()
+                for index, (async_result, deadline) in list(in_flight.items()):
+                    if async_result.ready():
+                        results[index] = async_result.get()
+                        del in_flight[index]
+                    elif now > deadline:
+                        in_file_name, out_file_name = jobs[index]
+                        results[index] = ConversionResult(in_file_name, out_file_name, "TIMEOUT", timeout,
+                                                          "Conversion took longer than {} seconds.".format(timeout))
+                        del in_flight[index]
+                        timed_out = True
+        finally:
+            pool.terminate()
+            pool.join()
+
+        # Files interrupted together with the hung worker are retried on the next pool.
+        pending.extend(sorted(in_flight, reverse=True))
+
+    return results
+
+
+def write_report(report_file_name: str, results: List[ConversionResult]):
+    """Writes a per-file CSV report of a batch conversion."""
+
+    report_dir = os.path.dirname(report_file_name)
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+
+    with open(report_file_name, "wt", encoding="utf-8", newline="") as report:
+        writer = csv.writer(report)
+        writer.writerow(ConversionResult._fields)
+        for result in results:
+            writer.writerow(["{:.3f}".format(value) if isinstance(value, float) else value for value in result])
+
+
 def parse_command_line(args: List[str]) -> Options:
 
     in_file_name = None
     out_file_name = None
+    batch_source = None
+    out_dir = None
+    report_file_name = None
+    max_workers = None
+    timeout = None
 
     i = 0
     while i < len(args):
@@ -74,6 +256,26 @@ def parse_command_line(args: List[str]) -> Options:
             i += 1
             out_file_name = args[i]
 
+        elif token == "-batch":
+            i += 1
+            batch_source = args[i]
+
+        elif token == "-outdir":
+            i += 1
+            out_dir = args[i]
+
+        elif token == "-report":
+            i += 1
+            report_file_name = args[i]
+
+        elif token == "-workers":
+            i += 1
+            max_workers = int(args[i])
+
+        elif token == "-timeout":
+            i += 1
+            timeout = float(args[i])
+
         elif token == "-config":
             # Skip the name of the config file and do nothing.
             i += 1
@@ -87,7 +289,7 @@ def parse_command_line(args: List[str]) -> Options:
 
         i += 1
 
-    return Options(in_file_name, out_file_name)
+    return Options(in_file_name, out_file_name, batch_source, out_dir, report_file_name, max_workers, timeout)
 
 
 if __name__ == '__main__':
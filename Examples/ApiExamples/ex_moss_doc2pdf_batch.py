@@ -0,0 +1,50 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+import os
+
+from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR
+from ex_moss_doc2pdf import collect_batch_jobs, convert_batch
+
+
+class ExMossDoc2PdfBatch(ApiExampleBase):
+
+    def test_collect_batch_jobs(self):
+
+        folder = ARTIFACTS_DIR + "MossDoc2Pdf.batch/"
+        os.makedirs(folder, exist_ok=True)
+        for name in ("a.doc", "a.docx", "b.rtf", "notes.xyz"):
+            open(folder + name, "wb").close()
+
+        # "a.doc" and "a.docx" would both be converted into "a.pdf", so they keep their extensions.
+        jobs = collect_batch_jobs(folder, ARTIFACTS_DIR)
+        self.assertEqual([(folder + "a.doc", ARTIFACTS_DIR + "a.doc.pdf"),
+                          (folder + "a.docx", ARTIFACTS_DIR + "a.docx.pdf"),
+                          (folder + "b.rtf", ARTIFACTS_DIR + "b.pdf")], jobs)
+
+        # A single document is converted as is, not read as a manifest.
+        self.assertEqual([(MY_DIR + "Document.docx", ARTIFACTS_DIR + "Document.pdf")],
+                         collect_batch_jobs(MY_DIR + "Document.docx", ARTIFACTS_DIR))
+
+        with open(ARTIFACTS_DIR + "MossDoc2Pdf.manifest.lst", "wt", encoding="utf-8") as manifest:
+            manifest.write("# Documents to convert.\n")
+            manifest.write(MY_DIR + "Document.docx\n")
+            manifest.write(MY_DIR + "Rendering.docx\t" + ARTIFACTS_DIR + "MossDoc2Pdf.rendering.pdf\n")
+
+        self.assertEqual([(MY_DIR + "Document.docx", ARTIFACTS_DIR + "Document.pdf"),
+                          (MY_DIR + "Rendering.docx", ARTIFACTS_DIR + "MossDoc2Pdf.rendering.pdf")],
+                         collect_batch_jobs(ARTIFACTS_DIR + "MossDoc2Pdf.manifest.lst", ARTIFACTS_DIR))
+
+    def test_convert_batch(self):
+
+        jobs = [(MY_DIR + "Document.docx", ARTIFACTS_DIR + "MossDoc2Pdf.convert_batch.pdf"),
+                (MY_DIR + "Corrupted document.docx", ARTIFACTS_DIR + "MossDoc2Pdf.corrupted.pdf")]
+
+        results = convert_batch(jobs, max_workers=2)
+
+        self.assertEqual(["OK", "FAILED"], [result.status for result in results])
+        self.assertTrue(os.path.exists(ARTIFACTS_DIR + "MossDoc2Pdf.convert_batch.pdf"))
+        self.assertNotEqual("", results[1].error)
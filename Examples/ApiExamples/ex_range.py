@@ -10,6 +10,8 @@ from typing import List
 import aspose.words as aw
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR
+from batch_replace import MultiReplacer, Replacement
+from document_text_index import DocumentTextIndex
 
 class ExRange(ApiExampleBase):
 
@@ -192,6 +194,113 @@ class ExRange(ApiExampleBase):
                         doc.get_text().strip())
                 #ExEnd
 
+    def test_multi_pattern_replace(self):
+
+        for ignore_fields in (True, False):
+            with self.subTest(ignore_fields=ignore_fields):
+                doc = aw.Document()
+                builder = aw.DocumentBuilder(doc)
+
+                builder.writeln("Dear _FullName_, your order 1234 ships today.")
+                builder.writeln("Nothing to replace here.")
+                builder.insert_field("QUOTE", "Call _FullName_ at 555-0100.")
+                builder.writeln()
+
+                doc.start_track_revisions("John Doe", datetime.now())
+                builder.writeln("Order 5678 was added later.")
+                doc.stop_track_revisions()
+
+                replacements = [
+                    Replacement("_FullName_", "John Doe"),
+                    Replacement(r"\d{3}-\d{4}", "[phone]", is_regex=True),
+                    Replacement(r"\b\d{4}\b", "[number]", is_regex=True),
+                    Replacement("Unused", "Never"),
+                ]
+
+                options = aw.replacing.FindReplaceOptions()
+                options.ignore_fields = ignore_fields
+                options.ignore_inserted = True
+
+                # Replacing pattern by pattern with "Range.replace" gives the same document and counts.
+                expected_doc = doc.clone()
+                expected_counts = [expected_doc.range.replace_regex(replacement.pattern, replacement.replacement, options)
+                                   if replacement.is_regex else
+                                   expected_doc.range.replace(replacement.pattern, replacement.replacement, options)
+                                   for replacement in replacements]
+
+                counts = MultiReplacer(replacements, options).replace(doc)
+
+                self.assertEqual(expected_counts, counts)
+                self.assertEqual([1, 0, 1, 0] if ignore_fields else [2, 1, 1, 0], counts)
+                self.assertEqual(expected_doc.get_text(), doc.get_text())
+                self.assertIn("Order 5678 was added later.", doc.get_text())
+
+    def test_multi_pattern_replace_in_order(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.writeln("foo and bar")
+        builder.writeln("First")
+        builder.writeln("Second foo")
+
+        # Later patterns find text inserted by earlier replacements,
+        # and a pattern that spans paragraphs is applied in its place in the list.
+        replacements = [
+            Replacement("foo", "bar"),
+            Replacement("First&pSecond", "Joined"),
+            Replacement("bar", "baz"),
+            Replacement("Joined baz", "Done"),
+        ]
+
+        options = aw.replacing.FindReplaceOptions()
+
+        expected_doc = doc.clone()
+        expected_counts = [expected_doc.range.replace(replacement.pattern, replacement.replacement, options)
+                           for replacement in replacements]
+
+        counts = MultiReplacer(replacements, options).replace(doc)
+
+        self.assertEqual(expected_counts, counts)
+        self.assertEqual([2, 1, 3, 1], counts)
+        self.assertEqual(expected_doc.get_text(), doc.get_text())
+        self.assertEqual("baz and baz\rDone\r\x0c", doc.get_text())
+
+    def test_multi_pattern_replace_nested_stories(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        # A paragraph that matches, with a comment and a footnote that match too.
+        builder.write("Plan a ")
+        comment = aw.Comment(doc, "John Doe", "JD", datetime.now())
+        comment.set_text("a comment")
+        builder.current_paragraph.append_child(comment)
+        builder.insert_footnote(aw.notes.FootnoteType.FOOTNOTE, "a footnote")
+        builder.writeln()
+
+        # A paragraph where only the comment matches.
+        builder.write("Nothing ")
+        comment = aw.Comment(doc, "John Doe", "JD", datetime.now())
+        comment.set_text("only a comment")
+        builder.current_paragraph.append_child(comment)
+        builder.writeln()
+
+        # Replacing "a" with "aa" twice in the same text would give "aaa".
+        replacements = [Replacement("a", "aa"), Replacement("comment", "remark")]
+        options = aw.replacing.FindReplaceOptions()
+
+        expected_doc = doc.clone()
+        expected_counts = [expected_doc.range.replace(replacement.pattern, replacement.replacement, options)
+                           for replacement in replacements]
+
+        counts = MultiReplacer(replacements, options).replace(doc)
+
+        self.assertEqual(expected_counts, counts)
+        self.assertEqual([5, 2], counts)
+        self.assertEqual(expected_doc.get_text(), doc.get_text())
+        self.assertNotIn("aaa", doc.get_text())
+
     def test_ignore_field_codes(self):
 
         for ignore_field_codes in (True, False):
@@ -510,6 +619,43 @@ class ExRange(ApiExampleBase):
         self.assertEqual("Hello world!", doc.range.text.strip())
         #ExEnd
 
+    def test_document_text_index(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+
+        builder.writeln("Hello world!")
+        builder.write("Today is ")
+        builder.insert_field("QUOTE", "Monday")
+        builder.writeln(".")
+        builder.write("Hello again!")
+
+        index = DocumentTextIndex(doc)
+
+        # The index holds the same text as the document, built once for any number of queries.
+        self.assertEqual(doc.get_text(), index.text)
+        self.assertEqual([0, index.paragraph_offset(2)], index.find_all("Hello"))
+        self.assertEqual(2, index.paragraph_at(index.find("again")))
+        self.assertEqual(index.paragraph_offset(1), index.paragraph_offset(doc.first_section.body.paragraphs[1]))
+        self.assertEqual(1, index.builds)
+
+        with self.assertRaises(ValueError):
+            index.paragraph_offset(aw.Paragraph(doc))
+
+        # A slice of the text maps back to the nodes that hold it.
+        spans = index.map_slice(index.find("is "), index.find("Monday") + len("Monday"))
+
+        self.assertEqual("is ", spans[0].node.get_text()[spans[0].start:spans[0].end])
+        self.assertEqual(aw.NodeType.FIELD_START, spans[1].node.node_type)
+        self.assertEqual("Monday", spans[-1].node.get_text()[spans[-1].start:spans[-1].end])
+
+        # After changing the document, the index is built again.
+        builder.write(" Goodbye!")
+        index.invalidate()
+
+        self.assertEqual(doc.get_text(), index.text)
+        self.assertEqual(2, index.builds)
+
     ##ExStart
     ##ExFor:FindReplaceOptions.use_legacy_order
     ##ExSummary:Shows how to change the searching order of nodes when performing a find-and-replace text operation.
@@ -4,12 +4,15 @@
 # is only intended as a supplement to the documentation, and is provided
 # "as is", without warranty of any kind, either expressed or implied.
 
+import os
 from typing import Dict, List, Tuple
 
 import aspose.words as aw
 import aspose.pydrawing as drawing
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR
+from thumbnail_sheet import ThumbnailSheetService, page_fingerprints
+import render_benchmark
 
 class ExRendering(ApiExampleBase):
 
@@ -205,3 +208,84 @@ class ExRendering(ApiExampleBase):
                 img.save(ARTIFACTS_DIR + "Rendering.thumbnails.png")
 
         #ExEnd
+
+    def test_thumbnail_sheet_service(self):
+
+        doc = aw.Document(MY_DIR + "Rendering.docx")
+        service = ThumbnailSheetService(columns=2, scale=0.25, max_workers=2)
+
+        # The first sheet renders every page to a cached tile.
+        service.render_sheet(doc, ARTIFACTS_DIR + "Rendering.thumbnail_sheet_service.png")
+        self.assertEqual(doc.page_count, service.rendered_pages)
+
+        # Nothing changed, so all tiles come from the cache.
+        service.render_sheet(doc, ARTIFACTS_DIR + "Rendering.thumbnail_sheet_service.png")
+        self.assertEqual(doc.page_count, service.rendered_pages)
+
+        # After editing the last page, only that page is rendered again.
+        builder = aw.DocumentBuilder(doc)
+        builder.move_to_document_end()
+        builder.write("Edited.")
+
+        service.render_sheet(doc, ARTIFACTS_DIR + "Rendering.thumbnail_sheet_service.png")
+        self.assertEqual(doc.page_count + 1, service.rendered_pages)
+
+    def test_page_fingerprints_layout(self):
+
+        doc = aw.Document()
+        builder = aw.DocumentBuilder(doc)
+        builder.writeln("Page 1")
+        table = builder.start_table()
+        builder.insert_cell()
+        builder.write("Moved by its table.")
+        builder.end_row()
+        builder.end_table()
+        builder.insert_break(aw.BreakType.PAGE_BREAK)
+        builder.write("Page 2")
+
+        layout_collector = aw.layout.LayoutCollector(doc)
+        doc.update_page_layout()
+        fingerprints = page_fingerprints(doc, layout_collector)
+
+        # The table indent is not held by paragraphs or runs, but it moves the text of the cell.
+        table.left_indent = 72
+        layout_collector = aw.layout.LayoutCollector(doc)
+        doc.update_page_layout()
+        moved = page_fingerprints(doc, layout_collector)
+
+        self.assertEqual(2, len(moved))
+        self.assertNotEqual(fingerprints[0], moved[0])
+        self.assertEqual(fingerprints[1], moved[1])
+
+    def test_render_benchmark(self):
+
+        out_dir = ARTIFACTS_DIR + "Rendering.render_benchmark/"
+        gold_dir = out_dir + "Golds/"
+
+        results = render_benchmark.run_benchmark([MY_DIR + "Rendering.docx"], ["pdf", "png"], out_dir, repeat=1)
+
+        self.assertEqual([("Rendering.docx", "pdf"), ("Rendering.docx", "png")], [(result.document, result.format) for result in results])
+        for result in results:
+            self.assertLess(0, result.seconds)
+            self.assertLess(0, result.output_size)
+
+        # Every page is rendered to its own PNG file.
+        self.assertEqual(aw.Document(MY_DIR + "Rendering.docx").page_count, results[1].pages)
+        for page in range(results[1].pages):
+            self.assertTrue(os.path.exists(out_dir + "Rendering.{}.png".format(page)))
+
+        render_benchmark.save_baseline(results, out_dir, gold_dir)
+        baseline = render_benchmark.load_baseline(gold_dir)
+
+        # The same renders match the baseline; the time threshold is generous, because renders this short are noisy.
+        regressions = render_benchmark.find_regressions(results, baseline, out_dir, gold_dir, render_benchmark.Thresholds(time=10.0))
+        self.assertEqual([], regressions)
+
+        # A run that is much slower and produces a much larger PDF is reported.
+        slower = [result._replace(seconds=result.seconds * 3, output_size=result.output_size * 2) if result.format == "pdf" else result
+                  for result in results]
+        regressions = render_benchmark.find_regressions(slower, baseline, out_dir, gold_dir)
+
+        self.assertEqual(2, len(regressions))
+        self.assertTrue(any("output size" in regression for regression in regressions))
+        self.assertTrue(any(regression.startswith("pdf: rendering took") for regression in regressions))
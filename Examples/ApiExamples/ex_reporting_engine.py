@@ -14,6 +14,7 @@ import aspose.pydrawing as drawing
 
 from api_example_base import ApiExampleBase, MY_DIR, ARTIFACTS_DIR, IMAGE_DIR, GOLDS_DIR
 from document_helper import DocumentHelper
+from report_template_cache import ReportTemplateCache
 from testdata import Common, ClientTestClass, ColorItemTestClass, DocumentTestClass, ImageTestClass, MessageTestClass, NumericTestClass
 
 class ExReportingEngine(ApiExampleBase):
@@ -70,6 +71,31 @@ class ExReportingEngine(ApiExampleBase):
 
         self.assertTrue(DocumentHelper.compare_docs(ARTIFACTS_DIR + "ReportingEngine.data_table.docx", GOLDS_DIR + "ReportingEngine.TestDataTable Gold.docx"))
 
+    def test_compiled_template_cache(self):
+
+        cache = ReportTemplateCache(max_entries=2)
+
+        # The template file is loaded once; every following report is built into a clone of it.
+        first = cache.render(self.document, self.create_json_data_source(Common.get_contracts()), "Contracts")
+        second = cache.render(self.document, self.create_json_data_source(Common.get_contracts()), "Contracts")
+
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(first.get_text(), second.get_text())
+
+        # The cached template itself keeps its tags.
+        self.assertIn("<<", cache.get(self.document).template.get_text())
+
+        # Entries beyond the limit are evicted in least recently used order.
+        cache.get(MY_DIR + "Reporting engine template - Total.docx")
+        cache.get(MY_DIR + "Reporting engine template - Chart.docx")
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(3, cache.misses)
+
+        cache.get(self.document)
+        self.assertEqual(4, cache.misses)
+
     def test_total(self):
 
         doc = aw.Document(MY_DIR + "Reporting engine template - Total.docx")
@@ -0,0 +1,338 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Field update scheduling for documents with many fields.
+
+"FieldUpdateScheduler" collects all fields of a document in one traversal and builds a dependency graph:
+a nested field is updated before the field that contains it, a REF field after the fields inside its bookmark
+(and the SET and ASK fields that define it), formulas after the bookmarks they use, and SEQ fields of one
+sequence in document order. The graph is split into batches of fields that do not depend on each other.
+
+Fields whose result depends only on their field code (formulas, comparisons, dates, document properties
+and the like) are evaluated once per distinct field code; other fields with the same code get the stored result.
+A stored result is plain text, so it is only shared between fields whose results are a single run, which keeps
+its formatting when the text is replaced; fields with results in several runs are always evaluated.
+Formulas that refer to table cells ("ABOVE", "LEFT", "A1", "R1C2" and so on) depend on the cell they are in,
+so they are always evaluated.
+Page-dependent fields (PAGE, NUMPAGES, PAGEREF, SECTIONPAGES and TOC), and fields that use their results,
+are left to a final pass that runs after the page layout has been built.
+
+A document must not be changed from several threads at once, so the batches are updated one after another."""
+
+import re
+import collections
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import aspose.words as aw
+
+# Fields whose result depends on the page layout.
+LAYOUT_FIELD_TYPES = {
+    aw.fields.FieldType.FIELD_PAGE,
+    aw.fields.FieldType.FIELD_NUM_PAGES,
+    aw.fields.FieldType.FIELD_PAGE_REF,
+    aw.fields.FieldType.FIELD_SECTION_PAGES,
+    aw.fields.FieldType.FIELD_TOC,
+}
+
+# Fields whose plain text result depends only on their field code and on document-wide values.
+MEMOIZABLE_FIELD_TYPES = {
+    aw.fields.FieldType.FIELD_FORMULA,
+    aw.fields.FieldType.FIELD_COMPARE,
+    aw.fields.FieldType.FIELD_DATE,
+    aw.fields.FieldType.FIELD_TIME,
+    aw.fields.FieldType.FIELD_CREATE_DATE,
+    aw.fields.FieldType.FIELD_SAVE_DATE,
+    aw.fields.FieldType.FIELD_DOC_PROPERTY,
+    aw.fields.FieldType.FIELD_DOC_VARIABLE,
+    aw.fields.FieldType.FIELD_AUTHOR,
+    aw.fields.FieldType.FIELD_TITLE,
+    aw.fields.FieldType.FIELD_SUBJECT,
+}
+
+# Arguments of formulas that refer to table cells relative to the field or by their address ("A1", "R2C3", "R1C").
+CELL_REFERENCE_PATTERN = re.compile(r"\b(?:ABOVE|BELOW|LEFT|RIGHT|[A-Z]{1,2}\d+|R\d*C\d*)\b", re.IGNORECASE)
+
+# Fields that refer to a bookmark with the first argument of their field code.
+BOOKMARK_REFERENCE_FIELD_TYPES = {
+    aw.fields.FieldType.FIELD_REF,
+    aw.fields.FieldType.FIELD_PAGE_REF,
+    aw.fields.FieldType.FIELD_NOTE_REF,
+}
+
+# Fields that assign a value to the bookmark named by the first argument of their field code.
+BOOKMARK_DEFINITION_FIELD_TYPES = {
+    aw.fields.FieldType.FIELD_SET,
+    aw.fields.FieldType.FIELD_ASK,
+}
+
+# Fields whose expressions can use bookmark names as variables.
+EXPRESSION_FIELD_TYPES = {
+    aw.fields.FieldType.FIELD_FORMULA,
+    aw.fields.FieldType.FIELD_IF,
+    aw.fields.FieldType.FIELD_COMPARE,
+}
+
+
+class FieldUpdateStatistics(NamedTuple):
+    fields: int         # Number of fields in the document.
+    batches: int        # Number of batches of independent fields, not counting the layout pass.
+    updated: int        # Fields evaluated with "Field.update".
+    memoized: int       # Fields that got the stored result of an identical field.
+    layout_fields: int  # Fields updated in the final pass, after the page layout was built.
+
+
+class _FieldCollector(aw.DocumentVisitor):
+    """Collects the fields of a document in document order, with the fields that each one contains
+    and the bookmarks that contain each one."""
+
+    def __init__(self):
+
+        aw.DocumentVisitor.__init__(self)
+
+        self.fields = []  # type: List[aw.fields.Field]
+        self.parents = []  # type: List[Optional[int]]
+        self.bookmark_fields = collections.defaultdict(list)  # type: Dict[str, List[int]]
+        self._open_fields = []  # type: List[int]
+        self._open_bookmarks = set()  # type: Set[str]
+
+    def visit_field_start(self, field_start: aw.fields.FieldStart) -> aw.VisitorAction:
+
+        index = len(self.fields)
+        self.fields.append(field_start.get_field())
+        self.parents.append(self._open_fields[-1] if self._open_fields else None)
+        self._open_fields.append(index)
+        for name in self._open_bookmarks:
+            self.bookmark_fields[name.lower()].append(index)
+
+        return aw.VisitorAction.CONTINUE
+
+    def visit_field_end(self, field_end: aw.fields.FieldEnd) -> aw.VisitorAction:
+        if self._open_fields:
+            self._open_fields.pop()
+        return aw.VisitorAction.CONTINUE
+
+    def visit_bookmark_start(self, bookmark_start: aw.BookmarkStart) -> aw.VisitorAction:
+        self._open_bookmarks.add(bookmark_start.name)
+        return aw.VisitorAction.CONTINUE
+
+    def visit_bookmark_end(self, bookmark_end: aw.BookmarkEnd) -> aw.VisitorAction:
+        self._open_bookmarks.discard(bookmark_end.name)
+        return aw.VisitorAction.CONTINUE
+
+
+class FieldUpdateScheduler:
+    """Updates all fields of a document in dependency order, evaluating identical expressions once."""
+
+    def __init__(self, doc: aw.Document):
+
+        self.doc = doc
+
+        collector = _FieldCollector()
+        doc.accept(collector)
+
+        self.fields = collector.fields
+        self.codes = [field.get_field_code() for field in self.fields]
+        self.types = [field.type for field in self.fields]
+        self.dependencies = self._build_dependencies(collector)
+        self.layout_fields = self._find_layout_fields()
+        self.memo_keys = self._find_memo_keys(collector)
+
+    def _build_dependencies(self, collector: _FieldCollector) -> List[Set[int]]:
+
+        # Fields that give a bookmark its value: the fields inside it, and the SET and ASK fields that name it.
+        definitions = collections.defaultdict(set)  # type: Dict[str, Set[int]]
+        for name, indexes in collector.bookmark_fields.items():
+            definitions[name].update(indexes)
+        for index, field_type in enumerate(self.types):
+            if field_type in BOOKMARK_DEFINITION_FIELD_TYPES:
+                name = self.argument(index)
+                if name:
+                    definitions[name.lower()].add(index)
+
+        dependencies = [set() for _ in self.fields]
+        last_in_sequence = {}  # type: Dict[str, int]
+
+        for index, field_type in enumerate(self.types):
+            parent = collector.parents[index]
+            if parent is not None:
+                dependencies[parent].add(index)
+
+            if field_type in BOOKMARK_REFERENCE_FIELD_TYPES:
+                name = self.argument(index)
+                if name:
+                    dependencies[index].update(definitions.get(name.lower(), ()))
+
+            elif field_type in EXPRESSION_FIELD_TYPES:
+                for word in set(re.findall(r"[A-Za-z_]\w*", self.codes[index])):
+                    dependencies[index].update(definitions.get(word.lower(), ()))
+
+            elif field_type == aw.fields.FieldType.FIELD_SEQUENCE:
+                identifier = (self.argument(index) or "").lower()
+                if identifier in last_in_sequence:
+                    dependencies[index].add(last_in_sequence[identifier])
+                last_in_sequence[identifier] = index
+
+        for index, indexes in enumerate(dependencies):
+            indexes.discard(index)
+
+        return dependencies
+
+    def argument(self, index: int) -> Optional[str]:
+        """Returns the first argument of a field code, for example, the bookmark name of "REF MyBookmark \\h",
+        or the variable name of "DOCVARIABLE Price". Works for fields of any type."""
+
+        words = self.codes[index].split()
+        # A REF field can be written as just the bookmark name. This is told by the field type, not by the first word,
+        # since the first word of every other field code is the name of its field type.
+        if self.types[index] == aw.fields.FieldType.FIELD_REF and words and words[0].upper() != "REF":
+            return words[0]
+
+        return words[1].strip('"') if len(words) > 1 else None
+
+    def _find_layout_fields(self) -> Set[int]:
+
+        layout_fields = {index for index, field_type in enumerate(self.types) if field_type in LAYOUT_FIELD_TYPES}
+
+        # Fields that use the result of a page-dependent field are page-dependent too.
+        dependents = collections.defaultdict(set)
+        for index, indexes in enumerate(self.dependencies):
+            for dependency in indexes:
+                dependents[dependency].add(index)
+
+        pending = list(layout_fields)
+        while pending:
+            for dependent in dependents[pending.pop()]:
+                if dependent not in layout_fields:
+                    layout_fields.add(dependent)
+                    pending.append(dependent)
+
+        return layout_fields
+
+    def _find_memo_keys(self, collector: _FieldCollector) -> List[Optional[str]]:
+        """Returns the key under which the result of each field is stored, or None if the result
+        depends on more than the field code."""
+
+        memoizable = [field_type in MEMOIZABLE_FIELD_TYPES for field_type in self.types]
+
+        # A field with nested fields is memoizable only if all of them are; bookmark values
+        # can differ between parts of the document, so expressions that use them are not.
+        for index in range(len(self.fields) - 1, -1, -1):
+            if self.dependencies[index] and not all(memoizable[dependency] for dependency in self.dependencies[index]):
+                memoizable[index] = False
+            if self.types[index] in EXPRESSION_FIELD_TYPES and any(
+                    collector.parents[dependency] != index for dependency in self.dependencies[index]):
+                memoizable[index] = False
+            # Identical formulas that refer to table cells give a different result in every cell.
+            if self.types[index] in EXPRESSION_FIELD_TYPES and CELL_REFERENCE_PATTERN.search(self.codes[index]):
+                memoizable[index] = False
+
+        return ["{}|{}".format(self.types[index], self.codes[index]) if memoizable[index] else None
+                for index in range(len(self.fields))]
+
+    def batches(self) -> List[List[int]]:
+        """Returns the fields outside the layout pass, grouped into batches. The fields of a batch depend only
+        on fields of earlier batches. Fields in a dependency cycle form the last batch, in document order."""
+
+        indexes = [index for index in range(len(self.fields)) if index not in self.layout_fields]
+
+        # Kahn's algorithm: a field joins the batch after the one in which the last of its dependencies was updated.
+        in_degree = {}  # type: Dict[int, int]
+        dependents = collections.defaultdict(list)  # type: Dict[int, List[int]]
+        for index in indexes:
+            dependencies = self.dependencies[index] - self.layout_fields
+            in_degree[index] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(index)
+
+        batches = []
+        batch = [index for index in indexes if not in_degree[index]]
+        while batch:
+            batches.append(batch)
+
+            next_batch = []
+            for index in batch:
+                for dependent in dependents[index]:
+                    in_degree[dependent] -= 1
+                    if not in_degree[dependent]:
+                        next_batch.append(dependent)
+
+            batch = sorted(next_batch)
+
+        # Fields left with dependencies are in a cycle, or depend on one.
+        cycle = [index for index in indexes if in_degree[index]]
+        if cycle:
+            batches.append(cycle)
+
+        return batches
+
+    def layout_order(self) -> List[int]:
+        """Returns the fields of the layout pass in an order in which each follows the fields it depends on."""
+
+        order = []
+        visited = set()
+
+        def visit(index: int):
+            if index in visited:
+                return
+            visited.add(index)
+            for dependency in sorted(self.dependencies[index]):
+                if dependency in self.layout_fields:
+                    visit(dependency)
+            order.append(index)
+
+        for index in sorted(self.layout_fields):
+            visit(index)
+
+        return order
+
+    def update(self, indexes: Optional[Set[int]] = None) -> FieldUpdateStatistics:
+        """Updates all fields of the document, or only the fields with the given indexes in "fields"."""
+
+        results = {}  # type: Dict[str, str]
+        updated = 0
+        memoized = 0
+
+        batches = [[index for index in batch if indexes is None or index in indexes] for batch in self.batches()]
+        batches = [batch for batch in batches if batch]
+        for batch in batches:
+            for index in batch:
+                key = self.memo_keys[index]
+                field = self.fields[index]
+                if key is not None and key in results and _has_plain_result(field):
+                    field.result = results[key]
+                    memoized += 1
+                    continue
+
+                field.update()
+                updated += 1
+                if key is not None and _has_plain_result(field):
+                    results[key] = field.result
+
+        layout_order = [index for index in self.layout_order() if indexes is None or index in indexes]
+        if layout_order:
+            self.doc.update_page_layout()
+            for index in layout_order:
+                self.fields[index].update()
+
+        return FieldUpdateStatistics(len(self.fields), len(batches), updated, memoized, len(layout_order))
+
+
+def _has_plain_result(field: aw.fields.Field) -> bool:
+    """Returns whether the result of a field is empty or a single run, so that setting "Field.result"
+    loses no formatting."""
+
+    if field.separator is None:
+        return True
+
+    runs = 0
+    node = field.separator.next_sibling
+    # Anything but runs before the field end, such as a nested field, or a result that continues in the next paragraph
+    # (where there is no next sibling), is formatting that plain text cannot carry.
+    while node is not None and node.node_type == aw.NodeType.RUN:
+        runs += 1
+        node = node.next_sibling
+
+    return node is not None and node.node_type == aw.NodeType.FIELD_END and runs <= 1
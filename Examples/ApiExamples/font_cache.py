@@ -0,0 +1,161 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Persistent font search cache shared by all processes that render with the same font folders.
+
+The first process scans the font folders, lets Aspose.Words parse every font and saves the resulting
+search cache next to a manifest with the size, modification time and content hash of each font file.
+Later processes load the search cache instead of parsing the fonts again. Every font source uses the
+content hash as its cache key, so only fonts that were added or changed since the cache was saved are parsed.
+Font data itself is read from disk only when a font is actually used, by "FileFontSource". If a "FontPool" is given,
+the sources come from the pool instead and are shared with its other users; fonts within the pool's memory budget
+are then read into memory once, when the font settings are created."""
+
+import io
+import os
+import json
+import hashlib
+import tempfile
+from typing import Dict, List, Optional
+
+import aspose.words as aw
+
+from font_pool import FontPool
+
+# Font file extensions picked up when scanning folders.
+FONT_EXTENSIONS = (".ttf", ".ttc", ".otf", ".otc")
+
+MANIFEST_FILE_NAME = "font_manifest.json"
+SEARCH_CACHE_FILE_NAME = "font_search_cache.xml"
+
+
+class FontCacheManager:
+    """Keeps a font search cache and a font manifest in "cache_dir" up to date for a set of font folders."""
+
+    def __init__(self, cache_dir: str, folders: Optional[List[str]] = None, include_system_fonts: bool = False,
+                 pool: Optional[FontPool] = None):
+
+        self.cache_dir = cache_dir
+        self.pool = pool
+        self.folders = list(folders or [])
+        if include_system_fonts:
+            self.folders.extend(aw.fonts.SystemFontSource.get_system_font_folders())
+
+        self.manifest = {}  # type: Dict[str, dict]
+        self.hashed = 0
+        self.reused = 0
+
+    @property
+    def manifest_file_name(self) -> str:
+        return os.path.join(self.cache_dir, MANIFEST_FILE_NAME)
+
+    @property
+    def search_cache_file_name(self) -> str:
+        return os.path.join(self.cache_dir, SEARCH_CACHE_FILE_NAME)
+
+    def scan(self) -> bool:
+        """Updates the manifest from the font folders. Returns True if it differs from the saved manifest.
+
+        Files whose size and modification time match the saved manifest are not read again."""
+
+        previous = self._load_manifest()
+        manifest = {}
+        self.hashed = 0
+        self.reused = 0
+
+        for file_name in self._font_files():
+            stat = os.stat(file_name)
+            entry = previous.get(file_name)
+            if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                self.reused += 1
+            else:
+                entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": self._hash_file(file_name)}
+                self.hashed += 1
+            manifest[file_name] = entry
+
+        self.manifest = manifest
+        return manifest != previous
+
+    def create_font_settings(self) -> aw.fonts.FontSettings:
+        """Returns font settings for the scanned folders, initialized from the saved search cache.
+
+        If fonts changed since the cache was saved, only those are parsed and the cache file is rewritten."""
+
+        changed = self.scan()
+
+        # Identical files found in several folders are registered once.
+        sources = {}
+        for file_name, entry in self.manifest.items():
+            if entry["sha256"] not in sources:
+                sources[entry["sha256"]] = self._font_source(file_name, entry["sha256"])
+        sources = list(sources.values())
+
+        font_settings = aw.fonts.FontSettings()
+        if os.path.exists(self.search_cache_file_name):
+            with open(self.search_cache_file_name, "rb") as cache_stream:
+                font_settings.set_fonts_sources(sources, cache_stream)
+        else:
+            changed = True
+            font_settings.set_fonts_sources(sources)
+
+        if changed:
+            with io.BytesIO() as cache_stream:
+                font_settings.save_search_cache(cache_stream)
+                self._write_atomically(self.search_cache_file_name, cache_stream.getvalue())
+
+            # The manifest is saved after the search cache, so it never describes fonts the cache does not hold.
+            self._write_atomically(self.manifest_file_name, json.dumps(self.manifest, indent=1).encode("utf-8"))
+
+        return font_settings
+
+    def _font_source(self, file_name: str, cache_key: str) -> aw.fonts.FontSourceBase:
+
+        if self.pool is not None:
+            return self.pool.get_font_source(file_name, cache_key=cache_key)
+
+        return aw.fonts.FileFontSource(file_name, 0, cache_key)
+
+    def _font_files(self) -> List[str]:
+
+        file_names = []
+        for folder in self.folders:
+            for root, _, names in os.walk(folder):
+                for name in names:
+                    if os.path.splitext(name)[1].lower() in FONT_EXTENSIONS:
+                        file_names.append(os.path.abspath(os.path.join(root, name)))
+
+        return sorted(set(file_names))
+
+    def _load_manifest(self) -> Dict[str, dict]:
+
+        try:
+            with open(self.manifest_file_name, "rt", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _hash_file(file_name: str) -> str:
+
+        digest = hashlib.sha256()
+        with open(file_name, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def _write_atomically(self, file_name: str, data: bytes):
+        """Writes through a temporary file, so that other processes never read a partially written file."""
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_file_name = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_file_name, file_name)
+        except BaseException:
+            os.remove(temp_file_name)
+            raise
@@ -0,0 +1,72 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Font pool that shares one copy of each font between all font settings of a process.
+
+Creating a "MemoryFontSource" for every "FontSettings" instance keeps one copy of the font bytes per instance.
+The pool creates each font source once and hands the same source object to every caller, so all font settings
+that use the same corporate fonts share one copy. Fonts are held in memory while they fit the memory budget;
+fonts beyond the budget get a "FileFontSource", which reads the font file only when Aspose.Words needs it,
+through the operating system's file cache that all processes share."""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import aspose.words as aw
+
+
+class FontPool:
+    """Hands out font sources that are shared by all callers. The pool can be used from several threads at once."""
+
+    def __init__(self, memory_budget: int = 256 * 1024 * 1024):
+
+        self.memory_budget = memory_budget
+        self.loaded_bytes = 0
+        self._sources = {}  # type: Dict[Tuple[str, int, Optional[str]], aw.fonts.FontSourceBase]
+        self._lock = threading.Lock()
+
+    def get_font_source(self, file_name: str, priority: int = 0, cache_key: Optional[str] = None) -> aw.fonts.FontSourceBase:
+        """Returns the font source of a font file. The same source object is shared by all callers.
+
+        Unless a cache key is given, the key is made of the file name, size and modification time."""
+
+        file_name = os.path.abspath(file_name)
+        key = (file_name, priority, cache_key)
+
+        with self._lock:
+            source = self._sources.get(key)
+            if source is not None:
+                return source
+
+            stat = os.stat(file_name)
+            if cache_key is None:
+                cache_key = "{}|{}|{}".format(file_name, stat.st_size, stat.st_mtime_ns)
+
+            if self.loaded_bytes + stat.st_size <= self.memory_budget:
+                with open(file_name, "rb") as file:
+                    data = file.read()
+                source = aw.fonts.MemoryFontSource(data, priority, cache_key)
+                # Counted only once the font is actually held in memory.
+                self.loaded_bytes += len(data)
+            else:
+                source = aw.fonts.FileFontSource(file_name, priority, cache_key)
+
+            self._sources[key] = source
+            return source
+
+    def create_font_settings(self, file_names: List[str]) -> aw.fonts.FontSettings:
+        """Creates font settings that use pooled sources for the given font files."""
+
+        font_settings = aw.fonts.FontSettings()
+        font_settings.set_fonts_sources([self.get_font_source(file_name) for file_name in file_names])
+
+        return font_settings
+
+    def __len__(self) -> int:
+
+        with self._lock:
+            return len(self._sources)
@@ -0,0 +1,143 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Image checks for rendering tests that work on the whole bitmap at once.
+
+Reading an image with "Image.get_pixel" costs one call into the drawing library per pixel,
+which dominates the run time of tests that render pages at high resolutions. Here an image is
+re-encoded once as an uncompressed BMP, its pixel array is read into a NumPy array of RGBA bytes,
+and every check is a vectorized operation over that array."""
+
+import io
+import struct
+from typing import NamedTuple, Optional
+
+import numpy
+
+import aspose.pydrawing as drawing
+
+# Weights of the red, green and blue channels in the luminance of a pixel (ITU-R BT.601).
+LUMINANCE_WEIGHTS = numpy.array([0.299, 0.587, 0.114], dtype=numpy.float32)
+
+
+class ImageDifference(NamedTuple):
+    """Difference between two images of the same size, measured on the luminance of blocks of pixels."""
+
+    mean: float               # Mean absolute difference of the block luminance, from 0 to 255.
+    max: float                # Largest absolute difference of the block luminance, from 0 to 255.
+    changed_fraction: float   # Fraction of blocks whose luminance differs by more than the threshold.
+
+
+def load_pixels(filename: Optional[str] = None, image_stream: Optional[io.BytesIO] = None) -> numpy.ndarray:
+    """Reads an image from a file or a stream into an array of shape (height, width, 4) of RGBA bytes."""
+
+    assert filename is None or image_stream is None
+    assert filename is not None or image_stream is not None
+
+    if filename is not None:
+        with drawing.Image.from_file(filename) as image:
+            return _read_pixels(image)
+
+    with drawing.Image.from_stream(image_stream) as image:
+        return _read_pixels(image)
+
+
+def _read_pixels(image: drawing.Image) -> numpy.ndarray:
+
+    # Drawing onto a new bitmap brings 1-bit, indexed, 16-bit and 48-bit images to the same 32-bit ARGB layout,
+    # whose fourth byte is always the alpha of the pixel.
+    with drawing.Bitmap(image.width, image.height) as bitmap:
+        with drawing.Graphics.from_image(bitmap) as graphics:
+            graphics.draw_image(image, 0, 0, image.width, image.height)
+
+        stream = io.BytesIO()
+        bitmap.save(stream, drawing.imaging.ImageFormat.bmp)
+
+    return decode_bmp(stream.getvalue())
+
+
+def decode_bmp(data: bytes, has_alpha: bool = True) -> numpy.ndarray:
+    """Decodes an uncompressed 24-bit or 32-bit BMP image into an array of shape (height, width, 4) of RGBA bytes.
+
+    The fourth byte of a 32-bit pixel is read as its alpha, so an image whose alpha bytes are all zero is fully
+    transparent. Pass "has_alpha=False" for 32-bit images whose fourth byte is unused; such images are opaque."""
+
+    offset, = struct.unpack_from("<I", data, 10)
+    width, height, _, bits_per_pixel = struct.unpack_from("<iiHH", data, 18)
+    if bits_per_pixel not in (24, 32):
+        raise ValueError("Unsupported BMP pixel depth: " + str(bits_per_pixel))
+
+    channels = bits_per_pixel // 8
+    rows = abs(height)
+    stride = (width * channels + 3) & ~3  # Rows are padded to a multiple of 4 bytes.
+
+    pixels = numpy.frombuffer(data, numpy.uint8, stride * rows, offset).reshape(rows, stride)
+    pixels = pixels[:, :width * channels].reshape(rows, width, channels)
+    if height > 0:
+        # A positive height means that the rows are stored bottom-up.
+        pixels = pixels[::-1]
+
+    rgba = numpy.empty((rows, width, 4), numpy.uint8)
+    rgba[..., :3] = pixels[..., 2::-1]
+
+    if channels == 4 and has_alpha:
+        rgba[..., 3] = pixels[..., 3]
+    else:
+        rgba[..., 3] = 255
+
+    return rgba
+
+
+def contains_transparency(pixels: numpy.ndarray) -> bool:
+    """Returns True if any pixel is not fully opaque."""
+
+    return bool((pixels[..., 3] != 255).any())
+
+
+def luminance(pixels: numpy.ndarray) -> numpy.ndarray:
+    """Returns the luminance of every pixel, from 0 to 255, as if the image was placed on white paper."""
+
+    alpha = pixels[..., 3:].astype(numpy.float32) / 255
+    rgb = pixels[..., :3] * alpha + 255 * (1 - alpha)
+
+    return rgb @ LUMINANCE_WEIGHTS
+
+
+def is_blank(pixels: numpy.ndarray, tolerance: float = 16, max_ink_fraction: float = 0.0) -> bool:
+    """Returns True if the image is a plain background: no more than "max_ink_fraction" of its pixels
+    differ from the prevailing luminance by more than "tolerance"."""
+
+    levels = luminance(pixels)
+    background = numpy.median(levels)
+    ink = numpy.abs(levels - background) > tolerance
+
+    return float(ink.mean()) <= max_ink_fraction
+
+
+def image_difference(actual: numpy.ndarray, expected: numpy.ndarray, block_size: int = 4, threshold: float = 16) -> ImageDifference:
+    """Compares two images of the same size.
+
+    The luminance is averaged over blocks of "block_size" by "block_size" pixels before comparing,
+    so that anti-aliasing and sub-pixel shifts of glyph edges do not count as changes."""
+
+    if actual.shape != expected.shape:
+        raise ValueError("Images differ in size: {} and {}.".format(actual.shape[1::-1], expected.shape[1::-1]))
+
+    difference = numpy.abs(_block_means(luminance(actual), block_size) - _block_means(luminance(expected), block_size))
+
+    return ImageDifference(float(difference.mean()), float(difference.max()), float((difference > threshold).mean()))
+
+
+def _block_means(levels: numpy.ndarray, block_size: int) -> numpy.ndarray:
+
+    block_size = max(1, min(block_size, *levels.shape))
+    rows = levels.shape[0] // block_size
+    columns = levels.shape[1] // block_size
+
+    # Partial blocks at the right and bottom edges are left out.
+    blocks = levels[:rows * block_size, :columns * block_size].reshape(rows, block_size, columns, block_size)
+
+    return blocks.mean(axis=(1, 3))
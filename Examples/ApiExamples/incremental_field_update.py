@@ -0,0 +1,192 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Incremental field updates.
+
+"IncrementalFieldUpdater" records the inputs of every field: the bookmarks that REF fields and formulas read,
+the document properties of DOCPROPERTY, AUTHOR, TITLE and similar fields, the variables of DOCVARIABLE fields
+and the merge data of MERGEFIELD fields. It remembers the values of those inputs, and on every later update
+recomputes only the fields whose inputs changed since then, the fields marked as dirty, and the fields that use
+the results of either (see "FieldUpdateScheduler" for the dependencies between fields).
+
+Inserting, removing or editing fields is noticed by comparing the field codes of the document with the collected
+ones; the updater then collects the fields again and updates all of them once. Otherwise the fields are looked up
+again on every update, so that edits around them do not leave the updater with fields that are no longer in the
+document. Page numbers are not tracked: PAGE, NUMPAGES and similar fields are only updated when
+"include_layout_fields" is set.
+
+Merge fields get their merge data formatted by the switches of their field code: the text before and after ("\\b",
+"\\f") and the general, numeric and date formats ("\\*", "\\#", "\\@"), which a DOCVARIABLE field with the same
+switches applies."""
+
+import re
+import collections
+from typing import Any, Dict, Optional, Set, Tuple
+
+import aspose.words as aw
+
+from field_update_scheduler import FieldUpdateScheduler, EXPRESSION_FIELD_TYPES, BOOKMARK_REFERENCE_FIELD_TYPES
+
+# Document properties displayed by fields of these types.
+PROPERTY_FIELD_TYPES = {
+    aw.fields.FieldType.FIELD_AUTHOR: "Author",
+    aw.fields.FieldType.FIELD_TITLE: "Title",
+    aw.fields.FieldType.FIELD_SUBJECT: "Subject",
+    aw.fields.FieldType.FIELD_COMMENTS: "Comments",
+    aw.fields.FieldType.FIELD_CREATE_DATE: "CreatedTime",
+    aw.fields.FieldType.FIELD_SAVE_DATE: "LastSavedTime",
+}
+
+# Formatting switches with their argument, as in \* Upper, \# "#,##0.00" or \@ "d MMMM yyyy".
+FORMAT_SWITCH_PATTERN = re.compile(r'\\[*#@]\s*(?:"(?:[^"\\]|\\.)*"|[^\s"\\]+)')
+
+BOOKMARK = "bookmark"
+PROPERTY = "property"
+VARIABLE = "variable"
+MERGE_FIELD = "merge field"
+
+
+class IncrementalFieldUpdater:
+    """Updates only the fields of a document whose inputs changed since the previous update.
+
+    The fields are assumed to be up to date when the updater is created."""
+
+    def __init__(self, doc: aw.Document, merge_data: Optional[Dict[str, Any]] = None):
+
+        self.doc = doc
+        self.merge_data = {name.lower(): value for name, value in (merge_data or {}).items()}
+        self._format_builder = None  # type: Optional[aw.DocumentBuilder]
+        self._analyze()
+
+    def _analyze(self):
+
+        self.scheduler = FieldUpdateScheduler(self.doc)
+
+        bookmark_names = {bookmark.name.lower() for bookmark in self.doc.range.bookmarks}
+
+        self.inputs = [self._find_inputs(index, bookmark_names) for index in range(len(self.scheduler.fields))]
+        self.snapshot = {key: self._read_input(key) for inputs in self.inputs for key in inputs}
+
+        self.dependents = collections.defaultdict(set)
+        for index, dependencies in enumerate(self.scheduler.dependencies):
+            for dependency in dependencies:
+                self.dependents[dependency].add(index)
+
+    def _find_inputs(self, index: int, bookmark_names: Set[str]) -> Set[Tuple[str, str]]:
+        """Returns the inputs of a field as (kind, name) pairs."""
+
+        field_type = self.scheduler.types[index]
+        argument = (self.scheduler.argument(index) or "").lower()
+
+        if field_type in BOOKMARK_REFERENCE_FIELD_TYPES:
+            return {(BOOKMARK, argument)}
+
+        if field_type in EXPRESSION_FIELD_TYPES:
+            words = {word.lower() for word in re.findall(r"[A-Za-z_]\w*", self.scheduler.codes[index])}
+            return {(BOOKMARK, name) for name in words & bookmark_names}
+
+        if field_type == aw.fields.FieldType.FIELD_DOC_PROPERTY:
+            return {(PROPERTY, argument)}
+
+        if field_type in PROPERTY_FIELD_TYPES:
+            return {(PROPERTY, PROPERTY_FIELD_TYPES[field_type].lower())}
+
+        if field_type == aw.fields.FieldType.FIELD_DOC_VARIABLE:
+            return {(VARIABLE, argument)}
+
+        if field_type == aw.fields.FieldType.FIELD_MERGE_FIELD:
+            return {(MERGE_FIELD, argument)}
+
+        return set()
+
+    def _read_input(self, key: Tuple[str, str]) -> Optional[str]:
+
+        kind, name = key
+        if kind == BOOKMARK:
+            bookmark = self.doc.range.bookmarks.get_by_name(name)
+            return bookmark.text if bookmark is not None else None
+
+        if kind == PROPERTY:
+            prop = self.doc.built_in_document_properties.get_by_name(name)
+            if prop is None:
+                prop = self.doc.custom_document_properties.get_by_name(name)
+            return str(prop.value) if prop is not None else None
+
+        if kind == VARIABLE:
+            return self.doc.variables.get_by_name(name)
+
+        value = self.merge_data.get(name)
+        return str(value) if value is not None else None
+
+    def changed_inputs(self) -> Set[Tuple[str, str]]:
+        """Returns the inputs whose values differ from those seen at the previous update."""
+
+        return {key for key, value in self.snapshot.items() if self._read_input(key) != value}
+
+    def update(self, merge_data: Optional[Dict[str, Any]] = None, include_layout_fields: bool = False) -> int:
+        """Recomputes the fields whose inputs changed, optionally with new merge data.
+        Returns the number of recomputed fields."""
+
+        if merge_data is not None:
+            self.merge_data.update((name.lower(), value) for name, value in merge_data.items())
+
+        fields = list(self.doc.range.fields)
+        if [field.get_field_code() for field in fields] != self.scheduler.codes:
+            # Fields were inserted, removed or edited, so the collected fields no longer match the document.
+            self._analyze()
+            dirty = set(range(len(self.scheduler.fields)))
+        else:
+            # The same field codes can belong to fields that replaced the collected ones, so the fields are refreshed.
+            self.scheduler.fields = fields
+            changed = self.changed_inputs()
+            dirty = {index for index, inputs in enumerate(self.inputs) if inputs & changed}
+            dirty.update(index for index, field in enumerate(self.scheduler.fields) if field.is_dirty)
+
+        # Fields that use the results of recomputed fields are recomputed too.
+        pending = list(dirty)
+        while pending:
+            for dependent in self.dependents[pending.pop()]:
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    pending.append(dependent)
+
+        if include_layout_fields:
+            dirty.update(self.scheduler.layout_fields)
+
+        # Merge fields display their formatted merge data; all other fields are evaluated by Aspose.Words.
+        merged = set()
+        for index in dirty:
+            if self.scheduler.types[index] == aw.fields.FieldType.FIELD_MERGE_FIELD:
+                value = self._read_input((MERGE_FIELD, (self.scheduler.argument(index) or "").lower()))
+                if value is not None:
+                    field = self.scheduler.fields[index]
+                    field.result = self._format_merge_value(field.as_field_merge_field(), value)
+                    merged.add(index)
+
+        self.scheduler.update(dirty - merged)
+
+        self.snapshot = {key: self._read_input(key) for key in self.snapshot}
+
+        return len(dirty)
+
+    def _format_merge_value(self, field: aw.fields.FieldMergeField, value: str) -> str:
+        """Formats merge data as the merge field would display it after a mail merge."""
+
+        switches = FORMAT_SWITCH_PATTERN.findall(field.get_field_code())
+        if switches:
+            # A DOCVARIABLE field applies the same formatting switches to the value of its variable, which,
+            # unlike text in the field code, needs no escaping. It is evaluated in a separate document.
+            if self._format_builder is None:
+                self._format_builder = aw.DocumentBuilder(aw.Document())
+            self._format_builder.document.variables.add("Value", value)
+            formatter = self._format_builder.insert_field("DOCVARIABLE Value " + " ".join(switches))
+            value = formatter.result
+            formatter.remove()
+
+        if value:
+            value = (field.text_before or "") + value + (field.text_after or "")
+
+        return value
@@ -0,0 +1,186 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Mail merge data sources that read their rows lazily from CSV, NDJSON, SQLite or a sequence of rows.
+
+Unlike a data source over a Python list, these sources hold only the current row (plus one fetched chunk
+for SQLite) in memory, so a merge over millions of records can start without loading the data set first."""
+
+import abc
+import csv
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import aspose.words as aw
+
+
+class StreamingMailMergeDataSource(aw.mailmerging.IMailMergeDataSource, abc.ABC):
+    """Base class for mail merge data sources that pull rows from a generator.
+
+    Subclasses implement "open_rows" as a generator that first yields the list of column names
+    and then one sequence of values per record. Column names are resolved once into an index,
+    so "get_value" is a dictionary lookup instead of a chain of name comparisons.
+    As in Microsoft Word, field names are matched case-insensitively."""
+
+    def __init__(self, table_name: str):
+
+        self._table_name = table_name
+        self._rows = None  # type: Optional[Iterator[Sequence[Any]]]
+        self._row = None  # type: Optional[Sequence[Any]]
+        self._eof = False
+        self.columns = []  # type: List[str]
+        self.column_index = {}  # type: Dict[str, int]
+
+    @abc.abstractmethod
+    def open_rows(self) -> Iterator[Sequence[Any]]:
+        """Returns a new generator over the column names and then the records."""
+
+    def reset(self):
+        """Positions the data source before the first record again."""
+
+        self.close()
+        self._rows = self.open_rows()
+        self.columns = list(next(self._rows, ()))
+        self.column_index = {name.lower(): i for i, name in enumerate(self.columns)}
+        self._row = None
+        self._eof = False
+
+    def close(self):
+        """Releases the file or cursor behind the data source."""
+
+        if self._rows is not None:
+            self._rows.close()
+            self._rows = None
+
+    @property
+    def table_name(self) -> str:
+        """The name of the data source. Used by Aspose.Words only when executing mail merge with repeatable regions."""
+
+        return self._table_name
+
+    def move_next(self) -> bool:
+
+        if self._eof:
+            return False
+
+        self._row = next(self._rows, None)
+        self._eof = self._row is None
+        return not self._eof
+
+    @property
+    def is_eof(self) -> bool:
+
+        return self._eof
+
+    def get_value(self, field_name: str):
+        """Aspose.Words calls this method to get a value for every data field."""
+
+        index = self.column_index.get(field_name.lower())
+        if index is None or self._row is None or index >= len(self._row):
+            # Return "None" to the Aspose.Words mail merge engine to signify
+            # that we could not find a field with this name.
+            return None
+
+        return self._row[index]
+
+    def get_child_data_source(self, table_name: str):
+
+        return None
+
+
+class CsvMailMergeDataSource(StreamingMailMergeDataSource):
+    """Reads records from a CSV file whose first line holds the column names."""
+
+    def __init__(self, file_name: str, table_name: str = "", delimiter: str = ",", encoding: str = "utf-8"):
+
+        super().__init__(table_name)
+        self.file_name = file_name
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.reset()
+
+    def open_rows(self) -> Iterator[Sequence[Any]]:
+
+        with open(self.file_name, "rt", encoding=self.encoding, newline="") as stream:
+            reader = csv.reader(stream, delimiter=self.delimiter)
+            yield next(reader, [])
+            yield from reader
+
+
+class NdjsonMailMergeDataSource(StreamingMailMergeDataSource):
+    """Reads records from a newline-delimited JSON file, one object per line.
+
+    If no columns are given, the keys of the first object are used."""
+
+    def __init__(self, file_name: str, table_name: str = "", columns: Optional[List[str]] = None, encoding: str = "utf-8"):
+
+        super().__init__(table_name)
+        self.file_name = file_name
+        self.encoding = encoding
+        self.fixed_columns = columns
+        self.reset()
+
+    def open_rows(self) -> Iterator[Sequence[Any]]:
+
+        with open(self.file_name, "rt", encoding=self.encoding) as stream:
+            objects = (json.loads(line) for line in stream if line.strip())
+
+            first = next(objects, None)
+            columns = self.fixed_columns if self.fixed_columns is not None else list(first or ())
+            yield columns
+
+            if first is None:
+                return
+
+            yield tuple(first.get(column) for column in columns)
+            for obj in objects:
+                yield tuple(obj.get(column) for column in columns)
+
+
+class SqliteMailMergeDataSource(StreamingMailMergeDataSource):
+    """Reads records from a SQLite query, fetching "chunk_size" rows from the cursor at a time."""
+
+    def __init__(self, connection: sqlite3.Connection, query: str, parameters: Sequence[Any] = (), table_name: str = "", chunk_size: int = 1000):
+
+        super().__init__(table_name)
+        self.connection = connection
+        self.query = query
+        self.parameters = parameters
+        self.chunk_size = chunk_size
+        self.reset()
+
+    def open_rows(self) -> Iterator[Sequence[Any]]:
+
+        cursor = self.connection.execute(self.query, self.parameters)
+        try:
+            yield [description[0] for description in cursor.description]
+            while True:
+                chunk = cursor.fetchmany(self.chunk_size)
+                if not chunk:
+                    return
+                yield from chunk
+        finally:
+            cursor.close()
+
+
+class RowsMailMergeDataSource(StreamingMailMergeDataSource):
+    """Serves records from a sequence of rows with known column names.
+
+    "reset" reads the rows again from the start, so they must be iterable more than once;
+    one-shot iterators, such as generators, are copied into a list first."""
+
+    def __init__(self, columns: List[str], rows: Iterable[Sequence[Any]], table_name: str = ""):
+
+        super().__init__(table_name)
+        self.fixed_columns = columns
+        self.rows = list(rows) if iter(rows) is rows else rows
+        self.reset()
+
+    def open_rows(self) -> Iterator[Sequence[Any]]:
+
+        yield self.fixed_columns
+        yield from self.rows
@@ -0,0 +1,93 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Renders many pages of a document to PNG, JPEG, TIFF or other image formats on a thread pool.
+
+A document must not be rendered from several threads at once, so every worker thread renders from its own
+copy of the document. Each copy builds its page layout once and then reuses it for every page it renders,
+instead of saving the document once per page from scratch. Pages are produced in page order, and at most
+twice the number of workers rendered pages are held in memory at a time."""
+
+import io
+import os
+import queue
+import collections
+import concurrent.futures
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import aspose.words as aw
+
+
+class PageRasterizer:
+    """Renders pages of one document to images, laying the document out once per worker."""
+
+    def __init__(self, doc: aw.Document, save_format: aw.SaveFormat = aw.SaveFormat.PNG,
+                 resolution: Optional[float] = None, max_workers: Optional[int] = None, scale: Optional[float] = None):
+
+        self.doc = doc
+        self.save_format = save_format
+        self.resolution = resolution
+        self.scale = scale
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self.doc.update_page_layout()
+        self.page_count = self.doc.page_count
+
+    def _create_options(self, page_index: int) -> aw.saving.ImageSaveOptions:
+
+        options = aw.saving.ImageSaveOptions(self.save_format)
+        options.page_set = aw.saving.PageSet(page_index)
+        if self.resolution is not None:
+            options.resolution = self.resolution
+        if self.scale is not None:
+            options.scale = self.scale
+
+        return options
+
+    def _render_page(self, documents: queue.Queue, page_index: int) -> Tuple[int, bytes]:
+
+        doc = documents.get()
+        try:
+            stream = io.BytesIO()
+            doc.save(stream, self._create_options(page_index))
+            return page_index, stream.getvalue()
+        finally:
+            documents.put(doc)
+
+    def render(self, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, bytes]]:
+        """Yields (page index, image bytes) pairs in the order of "pages" (all pages by default)."""
+
+        pages = list(range(self.page_count) if pages is None else pages)
+        workers = max(1, min(self.max_workers, len(pages)))
+
+        # One document copy per worker. The original is used as the first copy,
+        # and its layout is already built.
+        documents = queue.Queue()
+        documents.put(self.doc)
+        for _ in range(workers - 1):
+            documents.put(self.doc.clone())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = collections.deque()
+            for page_index in pages:
+                in_flight.append(executor.submit(self._render_page, documents, page_index))
+                if len(in_flight) >= 2 * workers:
+                    yield in_flight.popleft().result()
+
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def save(self, file_name_format: str, pages: Optional[Iterable[int]] = None) -> List[str]:
+        """Saves each page as "file_name_format.format(page_index + 1)". Returns the file names in page order."""
+
+        file_names = []
+        for page_index, data in self.render(pages):
+            file_name = file_name_format.format(page_index + 1)
+            with open(file_name, "wb") as file:
+                file.write(data)
+            file_names.append(file_name)
+
+        return file_names
@@ -0,0 +1,338 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Rendering benchmark with a visual regression check against gold files.
+
+Renders documents to PDF, PNG, SVG, XPS and HtmlFixed and records the wall time, the peak resident memory
+and the output size of every document in every format. Each render runs in a fresh worker process,
+so that the peak memory of one render is not hidden by an earlier, larger one. The workers are spawned rather than
+forked: a forked worker would start with the peak memory of this process, and forking a process that has the .NET
+runtime loaded can deadlock. The peak memory therefore includes loading Aspose.Words, which is the same for every render.
+
+PNG renders save every page to its own file ("<document>.<page index>.png"), because an image file holds one page.
+The results of a run can be saved as a baseline, together with the PNG renders as gold images.
+A later run (for example, with a new version of Aspose.Words) is compared with that baseline: it fails when
+a format became slower or a document needs more memory than the allowed thresholds, or when a PNG render differs
+from its gold image by more than the allowed tolerance.
+
+Usage: python render_benchmark.py [-docs <glob>] [-formats pdf,png,...] [-outdir <folder>] [-golds <folder>]
+                                  [-repeat <count>] [-threshold <fraction>] [-report <csv>] [-update]"""
+
+import os
+import sys
+import csv
+import glob
+import json
+import time
+import shutil
+import collections
+import multiprocessing
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; the peak memory is then reported as 0.
+    resource = None
+
+import aspose.words as aw
+
+import image_verification
+from api_example_base import MY_DIR, ARTIFACTS_DIR, GOLDS_DIR
+
+# Output formats, with the file extension of each.
+FORMATS = {
+    "pdf": (aw.SaveFormat.PDF, ".pdf"),
+    "png": (aw.SaveFormat.PNG, ".png"),
+    "svg": (aw.SaveFormat.SVG, ".svg"),
+    "xps": (aw.SaveFormat.XPS, ".xps"),
+    "html_fixed": (aw.SaveFormat.HTML_FIXED, ".html"),
+}
+
+BASELINE_FILE_NAME = "RenderBenchmark.json"
+
+DEFAULT_GOLD_DIR = GOLDS_DIR + "RenderBenchmark/"
+DEFAULT_OUT_DIR = ARTIFACTS_DIR + "RenderBenchmark/"
+
+
+class BenchmarkResult(NamedTuple):
+    document: str       # Base name of the document file.
+    format: str         # Key of "FORMATS".
+    seconds: float      # Fastest of the repeated load-and-save runs.
+    peak_rss: int       # Peak resident memory of the worker process, in bytes.
+    output_size: int    # Size of the output files, in bytes.
+    pages: int = 1      # Number of output files: the page count for PNG renders, otherwise 1.
+
+
+class Thresholds(NamedTuple):
+    time: float = 0.2                   # Allowed relative slowdown of a format, over all documents.
+    memory: float = 0.2                 # Allowed relative growth of the peak memory of a document.
+    size: float = 0.2                   # Allowed relative change of the output size of a document.
+    max_changed_fraction: float = 0.01  # Allowed fraction of a PNG render that differs from its gold image.
+
+
+def _output_file_name(out_dir: str, document: str, format_name: str) -> str:
+    return os.path.join(out_dir, os.path.splitext(document)[0] + FORMATS[format_name][1])
+
+
+def _output_file_names(out_dir: str, document: str, format_name: str, pages: int) -> List[str]:
+    """Returns the names of the output files of a render; PNG renders have one file per page."""
+
+    if format_name != "png":
+        return [_output_file_name(out_dir, document, format_name)]
+
+    base_name = os.path.join(out_dir, os.path.splitext(document)[0])
+    return ["{}.{}.png".format(base_name, page) for page in range(pages)]
+
+
+def _create_save_options(format_name: str) -> aw.saving.SaveOptions:
+
+    save_options = aw.saving.SaveOptions.create_save_options(FORMATS[format_name][0])
+    if format_name == "html_fixed":
+        # Keep all resources inside the one output file, so that its size covers the whole output.
+        save_options.export_embedded_css = True
+        save_options.export_embedded_fonts = True
+        save_options.export_embedded_images = True
+        save_options.export_embedded_svg = True
+
+    return save_options
+
+
+def _peak_rss() -> int:
+
+    if resource is None:
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other systems report kilobytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _render(job: Tuple[str, str, str, int]) -> BenchmarkResult:
+    """Runs in a worker process that renders only this one job."""
+
+    in_file_name, format_name, out_dir, repeat = job
+    document = os.path.basename(in_file_name)
+
+    seconds = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        doc = aw.Document(in_file_name)
+        save_options = _create_save_options(format_name)
+
+        pages = doc.page_count if format_name == "png" else 1
+        out_file_names = _output_file_names(out_dir, document, format_name, pages)
+        for page, out_file_name in enumerate(out_file_names):
+            if format_name == "png":
+                # Image formats render one page per file, the first one unless another page is selected.
+                save_options.page_set = aw.saving.PageSet(page)
+            doc.save(out_file_name, save_options)
+
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    output_size = sum(os.path.getsize(out_file_name) for out_file_name in out_file_names)
+    return BenchmarkResult(document, format_name, seconds, _peak_rss(), output_size, len(out_file_names))
+
+
+def run_benchmark(file_names: List[str], formats: Optional[List[str]] = None,
+                  out_dir: str = DEFAULT_OUT_DIR, repeat: int = 3) -> List[BenchmarkResult]:
+    """Renders every document to every format, one render at a time, so that renders do not compete for the CPU."""
+
+    formats = formats or list(FORMATS)
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = [(file_name, format_name, out_dir, repeat) for file_name in file_names for format_name in formats]
+    with multiprocessing.get_context("spawn").Pool(processes=1, maxtasksperchild=1) as pool:
+        return pool.map(_render, jobs, chunksize=1)
+
+
+def summarize(results: List[BenchmarkResult]) -> Dict[str, Tuple[float, int, int]]:
+    """Returns the total time, the largest peak memory and the total output size of each format."""
+
+    summary = collections.OrderedDict()
+    for result in results:
+        seconds, peak_rss, output_size = summary.get(result.format, (0.0, 0, 0))
+        summary[result.format] = (seconds + result.seconds, max(peak_rss, result.peak_rss), output_size + result.output_size)
+
+    return summary
+
+
+def save_baseline(results: List[BenchmarkResult], out_dir: str = DEFAULT_OUT_DIR, gold_dir: str = DEFAULT_GOLD_DIR):
+    """Saves the results as the baseline, and the PNG renders as gold images."""
+
+    os.makedirs(gold_dir, exist_ok=True)
+
+    with open(os.path.join(gold_dir, BASELINE_FILE_NAME), "wt", encoding="utf-8") as file:
+        json.dump([result._asdict() for result in results], file, indent=1)
+
+    for result in results:
+        if result.format == "png":
+            for out_file_name, gold_file_name in zip(_output_file_names(out_dir, result.document, "png", result.pages),
+                                                     _output_file_names(gold_dir, result.document, "png", result.pages)):
+                shutil.copyfile(out_file_name, gold_file_name)
+
+
+def load_baseline(gold_dir: str = DEFAULT_GOLD_DIR) -> Dict[Tuple[str, str], BenchmarkResult]:
+    """Loads the saved baseline, keyed by document and format. Returns an empty baseline if none was saved."""
+
+    try:
+        with open(os.path.join(gold_dir, BASELINE_FILE_NAME), "rt", encoding="utf-8") as file:
+            entries = json.load(file)
+    except FileNotFoundError:
+        return {}
+
+    results = (BenchmarkResult(**entry) for entry in entries)
+    return {(result.document, result.format): result for result in results}
+
+
+def find_regressions(results: List[BenchmarkResult], baseline: Dict[Tuple[str, str], BenchmarkResult],
+                     out_dir: str = DEFAULT_OUT_DIR, gold_dir: str = DEFAULT_GOLD_DIR,
+                     thresholds: Thresholds = Thresholds()) -> List[str]:
+    """Compares the results with the baseline and returns a description of every regression.
+
+    Time is compared per format over the documents present in both runs, because single short renders are too noisy.
+    Memory and output size are compared per document, and every page of a PNG render is compared with its gold image."""
+
+    regressions = []
+    seconds = collections.defaultdict(lambda: [0.0, 0.0])
+
+    for result in results:
+        expected = baseline.get((result.document, result.format))
+        if expected is None:
+            continue
+
+        seconds[result.format][0] += result.seconds
+        seconds[result.format][1] += expected.seconds
+
+        if expected.peak_rss and result.peak_rss > expected.peak_rss * (1 + thresholds.memory):
+            regressions.append("{} ({}): peak memory grew from {} to {} bytes.".format(
+                result.document, result.format, expected.peak_rss, result.peak_rss))
+
+        if abs(result.output_size - expected.output_size) > expected.output_size * thresholds.size:
+            regressions.append("{} ({}): output size changed from {} to {} bytes.".format(
+                result.document, result.format, expected.output_size, result.output_size))
+
+        if result.format == "png":
+            if result.pages != expected.pages:
+                regressions.append("{} ({}): page count changed from {} to {}.".format(
+                    result.document, result.format, expected.pages, result.pages))
+
+            out_file_names = _output_file_names(out_dir, result.document, "png", result.pages)
+            gold_file_names = _output_file_names(gold_dir, result.document, "png", expected.pages)
+            for page, (out_file_name, gold_file_name) in enumerate(zip(out_file_names, gold_file_names)):
+                if not os.path.exists(gold_file_name):
+                    continue
+
+                regression = _compare_with_gold(out_file_name, gold_file_name, thresholds)
+                if regression:
+                    regressions.append("{} ({}), page {}: {}".format(result.document, result.format, page + 1, regression))
+
+    for format_name, (actual, expected) in seconds.items():
+        if actual > expected * (1 + thresholds.time):
+            regressions.append("{}: rendering took {:.3f} s instead of {:.3f} s.".format(format_name, actual, expected))
+
+    return regressions
+
+
+def _compare_with_gold(file_name: str, gold_file_name: str, thresholds: Thresholds) -> Optional[str]:
+
+    actual = image_verification.load_pixels(filename=file_name)
+    expected = image_verification.load_pixels(filename=gold_file_name)
+    if actual.shape != expected.shape:
+        return "image size changed from {}x{} to {}x{}.".format(expected.shape[1], expected.shape[0], actual.shape[1], actual.shape[0])
+
+    difference = image_verification.image_difference(actual, expected)
+    if difference.changed_fraction > thresholds.max_changed_fraction:
+        return "{:.2%} of the image differs from the gold image.".format(difference.changed_fraction)
+
+    return None
+
+
+def write_report(report_file_name: str, results: List[BenchmarkResult], baseline: Dict[Tuple[str, str], BenchmarkResult]):
+    """Writes a CSV report with the results of every document and format next to the baseline values."""
+
+    with open(report_file_name, "wt", encoding="utf-8", newline="") as report:
+        writer = csv.writer(report)
+        writer.writerow(BenchmarkResult._fields + ("baseline_seconds", "baseline_peak_rss", "baseline_output_size"))
+        for result in results:
+            expected = baseline.get((result.document, result.format))
+            writer.writerow([result.document, result.format, "{:.3f}".format(result.seconds), result.peak_rss, result.output_size] +
+                            (["{:.3f}".format(expected.seconds), expected.peak_rss, expected.output_size] if expected else ["", "", ""]))
+
+
+def main(args: List[str]) -> int:
+
+    docs = MY_DIR + "*.docx"
+    formats = None
+    out_dir = DEFAULT_OUT_DIR
+    gold_dir = DEFAULT_GOLD_DIR
+    repeat = 3
+    thresholds = Thresholds()
+    report_file_name = None
+    update = False
+
+    i = 0
+    while i < len(args):
+        token = args[i].lower()
+        if token == "-docs":
+            i += 1
+            docs = args[i]
+
+        elif token == "-formats":
+            i += 1
+            formats = args[i].split(",")
+
+        elif token == "-outdir":
+            i += 1
+            out_dir = args[i]
+
+        elif token == "-golds":
+            i += 1
+            gold_dir = args[i]
+
+        elif token == "-repeat":
+            i += 1
+            repeat = int(args[i])
+
+        elif token == "-threshold":
+            i += 1
+            thresholds = thresholds._replace(time=float(args[i]), memory=float(args[i]))
+
+        elif token == "-report":
+            i += 1
+            report_file_name = args[i]
+
+        elif token == "-update":
+            update = True
+
+        else:
+            raise Exception("Unknown command line argument: " + token)
+
+        i += 1
+
+    results = run_benchmark(sorted(glob.glob(docs)), formats, out_dir, repeat)
+
+    for format_name, (seconds, peak_rss, output_size) in summarize(results).items():
+        print("{:<12}{:>10.3f} s{:>10} MB peak{:>12} KB".format(format_name, seconds, peak_rss // (1024 * 1024), output_size // 1024))
+
+    baseline = load_baseline(gold_dir)
+    if report_file_name is not None:
+        write_report(report_file_name, results, baseline)
+
+    if update:
+        save_baseline(results, out_dir, gold_dir)
+        return 0
+
+    regressions = find_regressions(results, baseline, out_dir, gold_dir, thresholds)
+    for regression in regressions:
+        print(regression)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
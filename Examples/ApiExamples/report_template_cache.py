@@ -0,0 +1,122 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Reusable report templates for the LINQ Reporting Engine.
+
+A template is loaded from disk once and kept as a document in memory together with a configured
+"ReportingEngine". Every report is built into a clone of that document, so rendering the same template
+many times pays for neither the file load nor the engine setup again. Loaded templates are kept
+in an LRU cache keyed by path and modification time, bounded by entry count and by total template file size."""
+
+import os
+import collections
+from typing import Iterable, Optional, Tuple
+
+import aspose.words as aw
+
+
+class CompiledReportTemplate:
+    """A loaded report template that can be bound to data many times."""
+
+    def __init__(self, template: aw.Document,
+                 options: Optional[aw.reporting.ReportBuildOptions] = None,
+                 known_types: Optional[Iterable] = None):
+
+        self.template = template
+
+        self.engine = aw.reporting.ReportingEngine()
+        if options is not None:
+            self.engine.options = options
+        if known_types is not None:
+            for known_type in known_types:
+                self.engine.known_types.add(known_type)
+
+    @staticmethod
+    def load(file_name: str, options: Optional[aw.reporting.ReportBuildOptions] = None,
+             known_types: Optional[Iterable] = None) -> 'CompiledReportTemplate':
+
+        return CompiledReportTemplate(aw.Document(file_name), options, known_types)
+
+    def render(self, data_source, data_source_name: Optional[str] = None) -> aw.Document:
+        """Builds a report into a clone of the template. The template itself stays unchanged."""
+
+        doc = self.template.clone()
+
+        if data_source_name is not None:
+            self.engine.build_report(doc, data_source, data_source_name)
+        else:
+            self.engine.build_report(doc, data_source)
+
+        return doc
+
+
+class ReportTemplateCache:
+    """LRU cache of compiled report templates.
+
+    An entry is reused while the template file keeps its modification time; a changed file is loaded again.
+    The least recently used templates are evicted when either "max_entries" or "max_bytes"
+    (measured as the total size of the cached template files) is exceeded."""
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024):
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()  # key -> (CompiledReportTemplate, size)
+
+    def get(self, file_name: str, options: Optional[aw.reporting.ReportBuildOptions] = None) -> CompiledReportTemplate:
+
+        stat = os.stat(file_name)
+        key = (os.path.abspath(file_name), stat.st_mtime_ns, options)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        self._discard_stale(key[0], key[1])
+
+        template = CompiledReportTemplate.load(file_name, options)
+        self._entries[key] = (template, stat.st_size)
+        self.total_bytes += stat.st_size
+        self._evict()
+
+        return template
+
+    def render(self, file_name: str, data_source, data_source_name: Optional[str] = None,
+               options: Optional[aw.reporting.ReportBuildOptions] = None) -> aw.Document:
+
+        return self.get(file_name, options).render(data_source, data_source_name)
+
+    def clear(self):
+
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def _discard_stale(self, path: str, mtime_ns: int):
+        """Drops entries of an older version of the same template file."""
+
+        for key in [key for key in self._entries if key[0] == path and key[1] != mtime_ns]:
+            self._remove(key)
+
+    def _evict(self):
+
+        # The most recently added entry is always kept, even if it alone exceeds the budget.
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Tuple):
+
+        _, size = self._entries.pop(key)
+        self.total_bytes -= size
@@ -0,0 +1,196 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Sharded mail merge: splits one merge over many records into chunks that are merged in worker processes.
+
+Each worker loads the template once and clones it for every chunk (or record) it merges. The workers are started
+with the "spawn" method: forking a process that has the .NET runtime loaded can deadlock the child, so everything
+passed to them is picklable (the template as DOCX bytes, the mail merge settings as plain values).
+The results are either reassembled in record order into one document with "append_document",
+or saved as one document per record."""
+
+import io
+import os
+import itertools
+import collections
+import multiprocessing
+import concurrent.futures
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import aspose.words as aw
+
+from mail_merge_data_sources import RowsMailMergeDataSource
+
+# Mail merge settings of the template that are applied to every copy merged in a worker process.
+MAIL_MERGE_SETTINGS = (
+    "cleanup_options",
+    "cleanup_paragraphs_with_punctuation_marks",
+    "use_non_merge_fields",
+    "preserve_unused_tags",
+    "trim_whitespaces",
+    "use_whole_paragraph_as_region",
+    "merge_duplicate_regions",
+    "merge_whole_document",
+    "restart_lists_at_each_section",
+    "unconditional_merge_fields_and_regions",
+    "region_start_tag",
+    "region_end_tag",
+)
+
+# Template document of the current worker process and its mail merge settings, set once by the pool initializer.
+_template = None  # type: Optional[aw.Document]
+_settings = {}  # type: Dict[str, Any]
+_mapped_data_fields = []  # type: List[Tuple[str, str]]
+
+
+def _init_worker(template_bytes: bytes, settings: Dict[str, Any], mapped_data_fields: List[Tuple[str, str]]):
+
+    global _template, _settings, _mapped_data_fields
+    _template = aw.Document(io.BytesIO(template_bytes))
+    _settings = settings
+    _mapped_data_fields = mapped_data_fields
+
+
+def _mail_merge_settings(template: aw.Document, retain_first_section_start: bool) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """Reads the mail merge settings of the template, which are not part of the saved document."""
+
+    if template.mail_merge.field_merging_callback is not None:
+        raise ValueError("A field merging callback cannot be passed to worker processes.")
+
+    settings = {name: getattr(template.mail_merge, name) for name in MAIL_MERGE_SETTINGS}
+    # Aspose.Words enumerations cannot be pickled, so the cleanup options are passed as a number.
+    settings["cleanup_options"] = int(settings["cleanup_options"])
+    settings["retain_first_section_start"] = retain_first_section_start
+    mapped_data_fields = [(field.key, field.value) for field in template.mail_merge.mapped_data_fields]
+
+    return settings, mapped_data_fields
+
+
+def _apply_settings(doc: aw.Document, settings: Dict[str, Any], mapped_data_fields: List[Tuple[str, str]]) -> aw.Document:
+
+    for name, value in settings.items():
+        if name == "cleanup_options":
+            value = aw.mailmerging.MailMergeCleanupOptions(value)
+        setattr(doc.mail_merge, name, value)
+    for document_field_name, data_source_field_name in mapped_data_fields:
+        doc.mail_merge.mapped_data_fields.add(document_field_name, data_source_field_name)
+
+    return doc
+
+
+def _merge_chunk(columns: List[str], rows: List[Sequence[Any]]) -> bytes:
+    """Merges a range of records into a clone of the template and returns the result as DOCX bytes."""
+
+    doc = _apply_settings(_template.clone(), _settings, _mapped_data_fields)
+    doc.mail_merge.execute(RowsMailMergeDataSource(columns, rows))
+
+    stream = io.BytesIO()
+    doc.save(stream, aw.SaveFormat.DOCX)
+    return stream.getvalue()
+
+
+def _merge_records_to_files(columns: List[str], rows: List[Sequence[Any]], file_names: List[str]) -> List[str]:
+    """Merges every record of a range into its own clone of the template and saves it."""
+
+    for row, file_name in zip(rows, file_names):
+        doc = _apply_settings(_template.clone(), _settings, _mapped_data_fields)
+        doc.mail_merge.execute(columns, list(row))
+        doc.save(file_name)
+
+    return file_names
+
+
+def _chunks(rows: Iterable[Sequence[Any]], chunk_size: int) -> Iterator[Tuple[int, List[Sequence[Any]]]]:
+    """Splits rows into disjoint consecutive ranges, yielding the index of the first record with each range."""
+
+    iterator = iter(rows)
+    start = 0
+    while True:
+        chunk = [tuple(row) for row in itertools.islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _template_bytes(template: aw.Document) -> bytes:
+
+    stream = io.BytesIO()
+    template.save(stream, aw.SaveFormat.DOCX)
+    return stream.getvalue()
+
+
+def _run_sharded(template: aw.Document, retain_first_section_start: bool, max_workers: Optional[int],
+                 tasks: Iterator[tuple], function) -> Iterator[Any]:
+    """Runs "function" over "tasks" on a process pool and yields the results in task order.
+
+    Only a bounded number of tasks is submitted ahead, so lazily produced rows are not all read into memory at once."""
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    settings, mapped_data_fields = _mail_merge_settings(template, retain_first_section_start)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                                initializer=_init_worker,
+                                                initargs=(_template_bytes(template), settings, mapped_data_fields)) as executor:
+        in_flight = collections.deque()
+        for task in tasks:
+            in_flight.append(executor.submit(function, *task))
+            if len(in_flight) >= 2 * max_workers:
+                yield in_flight.popleft().result()
+
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def execute_sharded(template: aw.Document, columns: List[str], rows: Iterable[Sequence[Any]],
+                    max_workers: Optional[int] = None, chunk_size: int = 500,
+                    retain_first_section_start: bool = False) -> aw.Document:
+    """Performs the equivalent of "template.mail_merge.execute" over all rows, merging chunks of rows in parallel.
+
+    Every chunk is merged with the mail merge settings of the template (see "MAIL_MERGE_SETTINGS",
+    and its mapped data fields), except for "retain_first_section_start", which is given here. When it is False,
+    the first section of every record after the first starts on a new page, as in a single merge;
+    this includes the first record of every chunk after the first. The template itself is not modified. A field merging callback
+    cannot be passed to the worker processes, so templates with one are rejected."""
+
+    tasks = ((columns, chunk) for _, chunk in _chunks(rows, chunk_size))
+
+    result = None
+    for shard_bytes in _run_sharded(template, retain_first_section_start, max_workers, tasks, _merge_chunk):
+        shard = aw.Document(io.BytesIO(shard_bytes))
+        if result is None:
+            result = shard
+        else:
+            if not retain_first_section_start:
+                shard.first_section.page_setup.section_start = aw.SectionStart.NEW_PAGE
+            # All shards come from the same template, so their styles already match the destination.
+            result.append_document(shard, aw.ImportFormatMode.USE_DESTINATION_STYLES)
+
+    if result is None:
+        # No records: a regular merge leaves the template with its fields removed.
+        result = _apply_settings(template.clone(), *_mail_merge_settings(template, retain_first_section_start))
+        result.mail_merge.execute(RowsMailMergeDataSource(columns, []))
+
+    return result
+
+
+def execute_per_record(template: aw.Document, columns: List[str], rows: Iterable[Sequence[Any]],
+                       file_name_format: str, max_workers: Optional[int] = None, chunk_size: int = 100,
+                       retain_first_section_start: bool = False) -> List[str]:
+    """Merges each row into its own document, saved as "file_name_format.format(record_index)".
+
+    Returns the saved file names in record order."""
+
+    def tasks():
+        for start, chunk in _chunks(rows, chunk_size):
+            yield columns, chunk, [file_name_format.format(start + i) for i in range(len(chunk))]
+
+    file_names = []
+    for chunk_file_names in _run_sharded(template, retain_first_section_start, max_workers, tasks(), _merge_records_to_files):
+        file_names.extend(chunk_file_names)
+
+    return file_names
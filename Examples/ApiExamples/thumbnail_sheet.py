@@ -0,0 +1,194 @@
+# Copyright (c) 2001-2022 Aspose Pty Ltd. All Rights Reserved.
+#
+# This file is part of Aspose.Words. The source code in this file
+# is only intended as a supplement to the documentation, and is provided
+# "as is", without warranty of any kind, either expressed or implied.
+
+"""Thumbnail sheets built from cached page tiles.
+
+Every page is rendered to its own tile on a thread pool (see "PageRasterizer"), and the tiles are kept
+in an LRU cache keyed by the hash of the page content, page index and scale. The hash of a page covers
+what the whole document shares (headers, footers, page setup) and the body content laid out on the page,
+so when a sheet is generated again only the pages whose content changed are rendered; all other tiles,
+including those of identical pages of other documents, are taken from the cache.
+
+The hash covers the text, paragraph format and run fonts of the paragraphs on a page (also inside tables),
+the images and size of their shapes, and the position of every layout entity on the page together with the
+text of its spans. Content that moves on or between pages, such as text pushed down by an edit further up or
+a table whose indent changed, renders the page again, and so do list numbers and PAGE fields, whose text only
+exists in the layout. Formatting that neither is held by paragraphs and runs nor moves the layout, such as table
+borders and shading, is not part of it: a change to that alone does not render the page again."""
+
+import io
+import hashlib
+import collections
+from typing import Dict, List, Optional, Tuple
+
+import aspose.words as aw
+import aspose.pydrawing as drawing
+
+from page_rasterizer import PageRasterizer
+from document_fingerprint import paragraph_formatting
+
+
+class TileCache:
+    """LRU cache of rendered page tiles, bounded by the total size of the tile images."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._tiles = collections.OrderedDict()  # (page fingerprint, page index, scale) -> image bytes
+
+    def get(self, key: Tuple[str, int, float]) -> Optional[bytes]:
+
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+
+        return tile
+
+    def put(self, key: Tuple[str, int, float], data: bytes):
+
+        previous = self._tiles.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= len(previous)
+
+        self._tiles[key] = data
+        self.total_bytes += len(data)
+
+        while len(self._tiles) > 1 and self.total_bytes > self.max_bytes:
+            _, evicted = self._tiles.popitem(last=False)
+            self.total_bytes -= len(evicted)
+
+    def __len__(self) -> int:
+
+        return len(self._tiles)
+
+
+def page_fingerprints(doc: aw.Document, layout_collector: aw.layout.LayoutCollector) -> List[str]:
+    """Computes a hash of the content of every page: the text and formatting of the body paragraphs laid out on it,
+    the images and size of their shapes, the position and text of the layout entities on it, and the headers,
+    footers and page setup that all pages share.
+
+    The document layout must be up to date and "layout_collector" must have been created before it was built."""
+
+    shared = hashlib.sha256()
+    for header_footer in doc.get_child_nodes(aw.NodeType.HEADER_FOOTER, True):
+        shared.update(header_footer.get_text().encode("utf-8"))
+    for section in doc.sections:
+        page_setup = section.as_section().page_setup
+        shared.update(repr((page_setup.page_width, page_setup.page_height, page_setup.orientation)).encode("utf-8"))
+
+    digests = [shared.copy() for _ in range(doc.page_count)]
+
+    for paragraph in doc.get_child_nodes(aw.NodeType.PARAGRAPH, True):
+        paragraph = paragraph.as_paragraph()
+        if paragraph.get_ancestor(aw.NodeType.BODY) is None:
+            continue
+
+        content = [paragraph.get_text()] + paragraph_formatting(paragraph)
+        for shape in paragraph.get_child_nodes(aw.NodeType.SHAPE, True):
+            shape = shape.as_shape()
+            content += [str(shape.width), str(shape.height), str(shape.wrap_type)]
+            if shape.has_image:
+                content.append(hashlib.sha256(shape.image_data.image_bytes).hexdigest())
+        content = "\u0000".join(content).encode("utf-8")
+
+        # Page indexes of the layout collector are 1-based.
+        first_page = layout_collector.get_start_page_index(paragraph)
+        last_page = layout_collector.get_end_page_index(paragraph)
+        for page in range(max(1, first_page), min(last_page, len(digests)) + 1):
+            digests[page - 1].update(content)
+
+    # Paragraphs do not tell where their lines are laid out, so the layout of every page is added as well.
+    layout_enumerator = aw.layout.LayoutEnumerator(doc)
+    for digest in digests:
+        _update_with_layout(layout_enumerator, digest)
+        layout_enumerator.move_next()
+
+    return [digest.hexdigest() for digest in digests]
+
+
+def _update_with_layout(layout_enumerator: aw.layout.LayoutEnumerator, digest):
+    """Adds the type and position of every entity below the current one to "digest", and the text of the spans."""
+
+    if not layout_enumerator.move_first_child():
+        return
+
+    while True:
+        rectangle = layout_enumerator.rectangle
+        content = [str(layout_enumerator.type),
+                   "{:.1f} {:.1f} {:.1f} {:.1f}".format(rectangle.x, rectangle.y, rectangle.width, rectangle.height)]
+        if layout_enumerator.type == aw.layout.LayoutEntityType.SPAN:
+            content.append(layout_enumerator.text or "")
+        digest.update("\u0000".join(content).encode("utf-8"))
+
+        _update_with_layout(layout_enumerator, digest)
+        if not layout_enumerator.move_next():
+            break
+
+    layout_enumerator.move_parent()
+
+
+class ThumbnailSheetService:
+    """Renders thumbnail sheets of documents, reusing cached tiles of pages that did not change."""
+
+    def __init__(self, cache: Optional[TileCache] = None, columns: int = 2, scale: float = 0.25, max_workers: Optional[int] = None):
+
+        self.cache = cache if cache is not None else TileCache()
+        self.columns = columns
+        self.scale = scale
+        self.max_workers = max_workers
+        self.rendered_pages = 0
+
+    def get_tiles(self, doc: aw.Document) -> List[bytes]:
+        """Returns a PNG tile for every page, rendering only pages whose content is missing from the cache."""
+
+        layout_collector = aw.layout.LayoutCollector(doc)
+        rasterizer = PageRasterizer(doc, aw.SaveFormat.PNG, resolution=96, max_workers=self.max_workers, scale=self.scale)
+        fingerprints = page_fingerprints(doc, layout_collector)
+
+        tiles = {}  # type: Dict[int, bytes]
+        stale_pages = []
+        for page_index, fingerprint in enumerate(fingerprints):
+            tile = self.cache.get((fingerprint, page_index, self.scale))
+            if tile is not None:
+                tiles[page_index] = tile
+            else:
+                stale_pages.append(page_index)
+
+        for page_index, data in rasterizer.render(stale_pages):
+            self.cache.put((fingerprints[page_index], page_index, self.scale), data)
+            tiles[page_index] = data
+            self.rendered_pages += 1
+
+        return [tiles[page_index] for page_index in range(len(fingerprints))]
+
+    def render_sheet(self, doc: aw.Document, file_name: str):
+        """Saves a sheet with the thumbnails of all pages, framed and arranged in rows of "columns" tiles."""
+
+        tiles = [drawing.Image.from_stream(io.BytesIO(data)) for data in self.get_tiles(doc)]
+        try:
+            tile_width = max(tile.width for tile in tiles)
+            tile_height = max(tile.height for tile in tiles)
+            rows = -(-len(tiles) // self.columns)
+
+            img_width = tile_width * self.columns
+            img_height = tile_height * rows
+
+            with drawing.Bitmap(img_width, img_height) as img:
+                with drawing.Graphics.from_image(img) as graphics:
+                    graphics.fill_rectangle(drawing.SolidBrush(drawing.Color.white), 0, 0, img_width, img_height)
+
+                    for page_index, tile in enumerate(tiles):
+                        left = (page_index % self.columns) * tile_width
+                        top = (page_index // self.columns) * tile_height
+
+                        graphics.draw_image(tile, left, top)
+                        graphics.draw_rectangle(drawing.Pens.black, left, top, tile.width, tile.height)
+
+                img.save(file_name)
+        finally:
+            for tile in tiles:
+                tile.dispose()
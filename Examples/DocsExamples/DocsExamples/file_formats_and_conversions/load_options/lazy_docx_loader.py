@@ -0,0 +1,179 @@
+import io
+import posixpath
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Set
+
+import aspose.words as aw
+
+#ExStart:LazyDocxLoader
+MEDIA = "media"
+OLE = "ole"
+CUSTOM_XML = "custom_xml"
+VBA = "vba"
+COMMENTS = "comments"
+
+RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+
+def part_kind(part_name: str) -> Optional[str]:
+    """Returns the kind of a DOCX package part that can be deferred, or None."""
+
+    if part_name.startswith("word/media/"):
+        return MEDIA
+    if part_name.startswith("word/embeddings/"):
+        return OLE
+    if part_name.startswith("customXml/"):
+        return CUSTOM_XML
+    if part_name.startswith("word/vba"):
+        return VBA
+    if part_name.startswith("word/comments") or part_name == "word/people.xml":
+        return COMMENTS
+    return None
+
+
+class LazyDocument():
+    """Opens a DOCX document without the parts that are not needed to read its text and properties.
+
+    Aspose.Words parses every part of a package when a document is loaded. Here, images, OLE objects,
+    custom XML parts, VBA projects and comments (the "defer" kinds) are left out of the package before loading,
+    together with their relationships and content types, so "document" holds the body text, headers, footers
+    and properties. In it, shapes that showed the left out images have no image data ("has_image" is False), and
+    OLE objects whose embedded data was left out are plain picture shapes without an image. Images that do not come
+    from the package keep their image data: for example, the evaluation watermark that Aspose.Words adds to
+    the headers when no license is set is a PNG image in both "document" and "full_document".
+
+    "deferred" lists the left out parts by kind as soon as the lazy document is created. The bytes of a left out part
+    are read from the original package on first access with "part", and "full_document" loads the complete document
+    on first access; both are cached.
+
+    Documents that are not ZIP packages (for example, encrypted ones) are loaded completely, and nothing is deferred."""
+
+    def __init__(self, file_name: str, load_options: aw.loading.LoadOptions = None,
+                 defer=(MEDIA, OLE, CUSTOM_XML, VBA, COMMENTS)):
+
+        self.file_name = file_name
+        self.load_options = load_options or aw.loading.LoadOptions()
+        self.defer = set(defer)
+        self.deferred = {}  # type: Dict[str, List[str]]
+        self._is_package = zipfile.is_zipfile(file_name)
+        self._document = None
+        self._full_document = None
+        self._parts = {}  # type: Dict[str, bytes]
+        self._lock = threading.Lock()
+
+        if self._is_package:
+            with zipfile.ZipFile(file_name) as package:
+                for info in package.infolist():
+                    kind = part_kind(info.filename)
+                    if kind in self.defer:
+                        self.deferred.setdefault(kind, []).append(info.filename)
+
+    @property
+    def document(self) -> aw.Document:
+        """The document without the deferred parts."""
+
+        with self._lock:
+            if self._document is None:
+                if self._is_package:
+                    with zipfile.ZipFile(self.file_name) as package:
+                        self._document = aw.Document(self._slim_package(package), self.load_options)
+                else:
+                    self._document = aw.Document(self.file_name, self.load_options)
+
+            return self._document
+
+    @property
+    def full_document(self) -> aw.Document:
+        """The complete document, with all of its parts."""
+
+        with self._lock:
+            if self._full_document is None:
+                self._full_document = aw.Document(self.file_name, self.load_options)
+
+            return self._full_document
+
+    def part(self, part_name: str) -> bytes:
+        """Returns the bytes of a part of the original package, such as "word/media/image1.png"."""
+
+        with self._lock:
+            if part_name not in self._parts:
+                with zipfile.ZipFile(self.file_name) as package:
+                    self._parts[part_name] = package.read(part_name)
+
+            return self._parts[part_name]
+
+    def _slim_package(self, package: zipfile.ZipFile) -> io.BytesIO:
+        """Copies a package without the deferred parts and the references to them."""
+
+        deferred = {part_name for part_names in self.deferred.values() for part_name in part_names}
+
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as slim:
+            for info in package.infolist():
+                name = info.filename
+                if name in deferred or _relationships_source(name) in deferred:
+                    continue
+
+                data = package.read(info)
+                if name.endswith(".rels"):
+                    data = _remove_relationships(name, data, deferred)
+                elif name == "[Content_Types].xml":
+                    data = _remove_content_types(data, deferred)
+
+                slim.writestr(info, data, zipfile.ZIP_DEFLATED)
+
+        stream.seek(0)
+        return stream
+
+
+def _relationships_source(part_name: str) -> Optional[str]:
+    """Returns the part whose relationships a ".rels" part holds, for example "word/document.xml"
+    for "word/_rels/document.xml.rels", or None."""
+
+    folder, name = posixpath.split(part_name)
+    if posixpath.basename(folder) != "_rels" or not name.endswith(".rels"):
+        return None
+
+    return posixpath.join(posixpath.dirname(folder), name[:-len(".rels")])
+
+
+def _remove_relationships(part_name: str, data: bytes, deferred: Set[str]) -> bytes:
+
+    source_folder = posixpath.dirname(_relationships_source(part_name) or "")
+
+    root = ET.fromstring(data)
+    removed = False
+    for relationship in list(root):
+        if relationship.get("TargetMode") == "External":
+            continue
+
+        target = relationship.get("Target", "")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(source_folder, target))
+
+        if target in deferred:
+            root.remove(relationship)
+            removed = True
+
+    if not removed:
+        return data
+
+    ET.register_namespace("", RELATIONSHIPS_NAMESPACE)
+    return ET.tostring(root, encoding="UTF-8", xml_declaration=True)
+
+
+def _remove_content_types(data: bytes, deferred: Set[str]) -> bytes:
+
+    root = ET.fromstring(data)
+    for override in root.findall("{%s}Override" % CONTENT_TYPES_NAMESPACE):
+        if override.get("PartName", "").lstrip("/") in deferred:
+            root.remove(override)
+
+    ET.register_namespace("", CONTENT_TYPES_NAMESPACE)
+    return ET.tostring(root, encoding="UTF-8", xml_declaration=True)
+#ExEnd:LazyDocxLoader
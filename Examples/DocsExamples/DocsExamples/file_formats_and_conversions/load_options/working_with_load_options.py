@@ -1,5 +1,6 @@
 import aspose.words as aw
 from docs_examples_base import DocsExamplesBase, MY_DIR, ARTIFACTS_DIR
+from .lazy_docx_loader import LazyDocument
 
 class WorkingWithLoadOptions(DocsExamplesBase):
 
@@ -92,3 +93,43 @@ class WorkingWithLoadOptions(DocsExamplesBase):
 
         doc = aw.Document(MY_DIR + "HTML help.chm", load_options)
         #ExEnd:LoadCHM
+
+    def test_lazy_load(self):
+
+        #ExStart:LazyLoad
+        lazy = LazyDocument(MY_DIR + "Images.docx")
+
+        # Only the text and properties are loaded; the images are read when they are needed.
+        print(lazy.document.get_text())
+        print(lazy.document.built_in_document_properties.author)
+
+        for part_name in lazy.deferred["media"]:
+            print(part_name, len(lazy.part(part_name)))
+        #ExEnd:LazyLoad
+
+        # The deferred parts are known before the document is loaded.
+        lazy = LazyDocument(MY_DIR + "Images.docx")
+        self.assertEqual(9, len(lazy.deferred["media"]))
+        self.assertEqual(["word/embeddings/Microsoft_Excel_97-2003_Worksheet.xls"], lazy.deferred["ole"])
+
+        doc = aw.Document(MY_DIR + "Images.docx")
+        self.assertEqual(doc.get_text(), lazy.document.get_text())
+        self.assertIs(lazy.full_document, lazy.full_document)
+
+        # The nine shapes that show the deferred images have no image data. Other images, such as the evaluation
+        # watermark in the headers when no license is set, are the same as in the full document.
+        shapes = [shape.as_shape() for shape in lazy.document.get_child_nodes(aw.NodeType.SHAPE, True)]
+        full_shapes = [shape.as_shape() for shape in lazy.full_document.get_child_nodes(aw.NodeType.SHAPE, True)]
+        self.assertEqual(len(full_shapes), len(shapes))
+        self.assertEqual(9, len([shape for shape, full_shape in zip(shapes, full_shapes) if full_shape.has_image and not shape.has_image]))
+        for shape, full_shape in zip(shapes, full_shapes):
+            if shape.has_image:
+                self.assertEqual(full_shape.image_data.image_bytes, shape.image_data.image_bytes)
+
+        lazy = LazyDocument(MY_DIR + "VBA project.docm")
+        self.assertIsNone(lazy.document.vba_project)
+        self.assertIsNotNone(lazy.full_document.vba_project)
+
+        lazy = LazyDocument(MY_DIR + "Comments.docx")
+        self.assertEqual(0, lazy.document.get_child_nodes(aw.NodeType.COMMENT, True).count)
+        self.assertLess(0, lazy.full_document.get_child_nodes(aw.NodeType.COMMENT, True).count)
@@ -0,0 +1,253 @@
+import binascii
+import collections
+import concurrent.futures
+import mmap
+import os
+import posixpath
+import re
+import struct
+import tempfile
+import uuid
+import zipfile
+import zlib
+from typing import List, NamedTuple, Optional
+from xml.sax.saxutils import quoteattr, unescape
+
+import aspose.words as aw
+
+#ExStart:ParallelOoxmlWriter
+# Parts in these formats are compressed already, so they are stored as is.
+STORED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".jpe", ".gif", ".webp", ".wdp", ".mp3", ".mp4", ".m4a", ".zip",
+                     ".docx", ".docm", ".xlsx", ".xlsm", ".pptx", ".pptm", ".odt", ".ods", ".odp"}
+
+XML_EXTENSIONS = {".xml", ".rels", ".vml"}
+
+# The flat OPC format that holds the same parts as each OOXML package format.
+FLAT_OPC_FORMATS = {
+    aw.SaveFormat.DOCX: aw.SaveFormat.FLAT_OPC,
+    aw.SaveFormat.DOCM: aw.SaveFormat.FLAT_OPC_MACRO_ENABLED,
+    aw.SaveFormat.DOTX: aw.SaveFormat.FLAT_OPC_TEMPLATE,
+    aw.SaveFormat.DOTM: aw.SaveFormat.FLAT_OPC_TEMPLATE_MACRO_ENABLED,
+}
+
+RELATIONSHIPS_CONTENT_TYPE = "application/vnd.openxmlformats-package.relationships+xml"
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n'
+
+# Parts are dated 1980-01-01, the earliest date a ZIP entry can hold, as in packages written by Word.
+DOS_TIME, DOS_DATE = 0, 1 << 5 | 1
+
+
+class PackageStatistics(NamedTuple):
+    parts: int          # Number of parts in the package.
+    stored: int         # Parts stored without compression.
+    size: int           # Size of the uncompressed parts, in bytes.
+    compressed_size: int
+
+
+class FlatOpcPart(NamedTuple):
+    name: str           # Name of the part in the package, without the leading slash.
+    content_type: str
+    binary: bool        # Whether the part is held as Base64 ("pkg:binaryData") rather than as XML ("pkg:xmlData").
+    start: int          # Offsets of the part data in the flat OPC document.
+    end: int
+
+
+class ParallelOoxmlWriter():
+    """Saves documents as OOXML packages whose parts are compressed on a thread pool.
+
+    "OoxmlSaveOptions.compression_level" applies one level to the whole package, and the parts are compressed
+    one after another. Here, the document is saved as flat OPC instead, a single XML document that holds every
+    part of the package uncompressed, either as XML or as Base64. The parts are decoded and compressed on a thread
+    pool ("zlib" releases the GIL while doing so), with a level chosen for the type of the part: media that is
+    compressed already is stored, XML parts get the maximum level, and other parts (such as EMF/WMF images and OLE
+    objects) the default level. A part is stored whenever compressing does not make it smaller. Parts are written
+    in their original order as soon as they are ready; at most twice the number of workers parts wait in memory.
+
+    The flat OPC document is mapped into memory from a temporary file rather than read, so only the parts being
+    compressed are held in memory. Media parts are Base64 encoded in it, which takes a third more disk space than
+    the media itself.
+
+    Packages larger than 4 GB, which would need ZIP64 records, are not supported."""
+
+    def __init__(self, max_workers: Optional[int] = None, xml_level: int = 9, default_level: int = 6):
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.xml_level = xml_level
+        self.default_level = default_level
+
+    def compression_level(self, part_name: str) -> int:
+        """Returns the zlib compression level for a part, or 0 to store the part."""
+
+        extension = posixpath.splitext(part_name)[1].lower()
+        if extension in STORED_EXTENSIONS:
+            return 0
+        if extension in XML_EXTENSIONS:
+            return self.xml_level
+        return self.default_level
+
+    def save(self, doc: aw.Document, file_name: str, save_options: aw.saving.OoxmlSaveOptions = None) -> PackageStatistics:
+
+        save_options = save_options or aw.saving.OoxmlSaveOptions()
+        if save_options.password:
+            raise ValueError("Encrypted documents are not saved as ZIP packages.")
+        if save_options.save_format not in FLAT_OPC_FORMATS:
+            raise ValueError("Only DOCX, DOCM, DOTX and DOTM packages are supported.")
+
+        save_format = save_options.save_format
+        save_options.save_format = FLAT_OPC_FORMATS[save_format]
+        with tempfile.TemporaryFile() as flat_opc:
+            try:
+                doc.save(flat_opc, save_options)
+            finally:
+                save_options.save_format = save_format
+
+            flat_opc.flush()
+            with mmap.mmap(flat_opc.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return self._save_parts(data, file_name)
+
+    def _save_parts(self, flat_opc, file_name: str) -> PackageStatistics:
+
+        parts = _flat_opc_parts(flat_opc)
+
+        folder = os.path.dirname(os.path.abspath(file_name))
+        temp_file_name = os.path.join(folder, "~{}.tmp".format(uuid.uuid4().hex))
+        # Unlike "mkstemp", which creates the file readable by its owner only, this leaves the umask to the system.
+        fd = os.open(temp_file_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            # The file object owns the descriptor from here on, so it is closed even if writing fails.
+            with os.fdopen(fd, "wb") as output:
+                statistics = self._write(flat_opc, parts, output)
+
+            os.replace(temp_file_name, file_name)
+        except BaseException:
+            os.remove(temp_file_name)
+            raise
+
+        return statistics
+
+    def _write(self, flat_opc, parts: List[FlatOpcPart], output) -> PackageStatistics:
+
+        central_directory = []
+        stored = size = compressed_size = 0
+
+        def write_part(part_name: str, future: concurrent.futures.Future):
+
+            nonlocal stored, size, compressed_size
+
+            method, crc, file_size, data = future.result()
+            offset = output.tell()
+            if offset + len(data) > 0xFFFFFFFF or file_size > 0xFFFFFFFF:
+                raise ValueError("The package needs ZIP64 records, which are not supported.")
+
+            name = part_name.encode("utf-8")
+            flags = 0x800 if not part_name.isascii() else 0
+
+            output.write(struct.pack("<IHHHHHIIIHH", 0x04034b50, 20, flags, method, DOS_TIME, DOS_DATE,
+                                     crc, len(data), file_size, len(name), 0))
+            output.write(name)
+            output.write(data)
+
+            central_directory.append(struct.pack("<IHHHHHHIIIHHHHHII", 0x02014b50, 20, 20, flags, method, DOS_TIME,
+                                                 DOS_DATE, crc, len(data), file_size, len(name), 0, 0, 0, 0, 0,
+                                                 offset) + name)
+
+            stored += method == zipfile.ZIP_STORED
+            size += file_size
+            compressed_size += len(data)
+
+        part_count = len(parts) + 1
+        if part_count > 0xFFFF:
+            raise ValueError("The package needs ZIP64 records, which are not supported.")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = collections.deque()
+            in_flight.append(("[Content_Types].xml",
+                              executor.submit(_compress, _content_types(parts), self.xml_level)))
+            for part in parts:
+                in_flight.append((part.name, executor.submit(_pack_part, flat_opc, part, self.compression_level(part.name))))
+
+                if len(in_flight) >= 2 * self.max_workers:
+                    write_part(*in_flight.popleft())
+
+            while in_flight:
+                write_part(*in_flight.popleft())
+
+        directory_offset = output.tell()
+        for entry in central_directory:
+            output.write(entry)
+        directory_size = output.tell() - directory_offset
+
+        if output.tell() > 0xFFFFFFFF:
+            raise ValueError("The package needs ZIP64 records, which are not supported.")
+        output.write(struct.pack("<IHHHHIIH", 0x06054b50, 0, 0, part_count, part_count, directory_size, directory_offset, 0))
+
+        return PackageStatistics(part_count, stored, size, compressed_size)
+
+
+_PART_START = re.compile(rb"<pkg:part\s([^>]*)>\s*<pkg:(xmlData|binaryData)[^>]*>")
+_ATTRIBUTE = re.compile(rb'pkg:(\w+)="([^"]*)"')
+
+
+def _flat_opc_parts(flat_opc) -> List[FlatOpcPart]:
+    """Finds the parts of a flat OPC document. Only the element tags are scanned; the part data is not copied."""
+
+    parts = []
+    position = 0
+    while True:
+        match = _PART_START.search(flat_opc, position)
+        if match is None:
+            return parts
+
+        attributes = {key.decode("ascii"): unescape(value.decode("utf-8"), {"&quot;": '"'})
+                      for key, value in _ATTRIBUTE.findall(match.group(1))}
+        end_tag = b"</pkg:" + match.group(2) + b">"
+        end = flat_opc.find(end_tag, match.end())
+        if end < 0:
+            raise ValueError("The flat OPC part '{}' is not closed.".format(attributes.get("name")))
+
+        parts.append(FlatOpcPart(attributes["name"].lstrip("/"), attributes["contentType"],
+                                 match.group(2) == b"binaryData", match.end(), end))
+        position = end + len(end_tag)
+
+
+def _content_types(parts: List[FlatOpcPart]) -> bytes:
+    """Returns the "[Content_Types].xml" part, which flat OPC leaves out, with the content type of every part."""
+
+    entries = ['<Default Extension="rels" ContentType="{}"/>'.format(RELATIONSHIPS_CONTENT_TYPE),
+               '<Default Extension="xml" ContentType="application/xml"/>']
+    for part in parts:
+        if part.content_type != RELATIONSHIPS_CONTENT_TYPE:
+            entries.append("<Override PartName={} ContentType={}/>".format(
+                quoteattr("/" + part.name), quoteattr(part.content_type)))
+
+    return XML_DECLARATION + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">{}</Types>'.format(
+        "".join(entries)).encode("utf-8")
+
+
+def _pack_part(flat_opc, part: FlatOpcPart, level: int):
+    """Decodes a part of the flat OPC document and compresses it."""
+
+    data = flat_opc[part.start:part.end]
+    if part.binary:
+        # Line breaks between the Base64 lines are skipped by the decoder.
+        data = binascii.a2b_base64(data)
+    else:
+        # The root element of an XML part declares every namespace the part uses.
+        data = XML_DECLARATION + data.strip()
+
+    return _compress(data, level)
+
+
+def _compress(data: bytes, level: int):
+    """Returns the compression method, the CRC-32, the size and the bytes of a part, as written to the package."""
+
+    crc = zlib.crc32(data)
+    if level > 0:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = compressor.compress(data) + compressor.flush()
+        if len(compressed) < len(data):
+            return zipfile.ZIP_DEFLATED, crc, len(data), compressed
+
+    return zipfile.ZIP_STORED, crc, len(data), data
+#ExEnd:ParallelOoxmlWriter
@@ -1,5 +1,8 @@
+import zipfile
+
 import aspose.words as aw
 from docs_examples_base import DocsExamplesBase, MY_DIR, ARTIFACTS_DIR
+from .parallel_ooxml_writer import ParallelOoxmlWriter
 
 class WorkingWithOoxmlSaveOptions(DocsExamplesBase):
 
@@ -59,3 +62,27 @@ class WorkingWithOoxmlSaveOptions(DocsExamplesBase):
 
         doc.save(ARTIFACTS_DIR + "WorkingWithOoxmlSaveOptions.set_compression_level.docx", save_options)
         #ExEnd:SetCompressionLevel
+
+    def test_parallel_package_writer(self):
+
+        #ExStart:ParallelPackageWriter
+        doc = aw.Document(MY_DIR + "Images.docx")
+
+        writer = ParallelOoxmlWriter()
+        statistics = writer.save(doc, ARTIFACTS_DIR + "WorkingWithOoxmlSaveOptions.parallel_package_writer.docx")
+
+        print("{} parts, {} stored, {} of {} bytes.".format(
+            statistics.parts, statistics.stored, statistics.compressed_size, statistics.size))
+        #ExEnd:ParallelPackageWriter
+
+        with zipfile.ZipFile(ARTIFACTS_DIR + "WorkingWithOoxmlSaveOptions.parallel_package_writer.docx") as package:
+            self.assertIsNone(package.testzip())
+            for info in package.infolist():
+                if info.filename.endswith((".png", ".jpeg")):
+                    self.assertEqual(zipfile.ZIP_STORED, info.compress_type)
+                elif info.filename.endswith(".xml"):
+                    self.assertEqual(zipfile.ZIP_DEFLATED, info.compress_type)
+
+        saved = aw.Document(ARTIFACTS_DIR + "WorkingWithOoxmlSaveOptions.parallel_package_writer.docx")
+        self.assertEqual(doc.get_text(), saved.get_text())
+        self.assertEqual(doc.get_child_nodes(aw.NodeType.SHAPE, True).count, saved.get_child_nodes(aw.NodeType.SHAPE, True).count)
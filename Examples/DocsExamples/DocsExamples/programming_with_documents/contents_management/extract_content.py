@@ -1,6 +1,10 @@
+import os
+import shutil
+
 import aspose.words as aw
 from docs_examples_base import DocsExamplesBase, MY_DIR, ARTIFACTS_DIR
 from . import extract_content_helper as helper
+from .image_exporter import ImageExporter
 
 class ExtractContent(DocsExamplesBase):
 
@@ -54,6 +58,35 @@ class ExtractContent(DocsExamplesBase):
         dst_doc.save(ARTIFACTS_DIR + "ExtractContent.extract_content_between_bookmark.without_bookmark.docx")
         #ExEnd:ExtractContentBetweenBookmark
 
+    def test_extract_contents_between_bookmarks(self):
+
+        #ExStart:ExtractContentsBetweenBookmarks
+        doc = aw.Document(MY_DIR + "Extract content.docx")
+
+        # Collect the start and end markers of every bookmark in the document.
+        ranges = [(bookmark.bookmark_start, bookmark.bookmark_end) for bookmark in doc.range.bookmarks]
+
+        # Index the document's block-level nodes once and extract all ranges against that index.
+        extracted_ranges = helper.ExtractContentHelper.extract_contents(doc, ranges, True)
+
+        for i, extracted_nodes in enumerate(extracted_ranges):
+            dst_doc = helper.ExtractContentHelper.generate_document(doc, extracted_nodes)
+            dst_doc.save(ARTIFACTS_DIR + f"ExtractContent.extract_contents_between_bookmarks.{i}.docx")
+        #ExEnd:ExtractContentsBetweenBookmarks
+
+        # The batch extraction produces the same content as extracting each range separately.
+        for (bookmark_start, bookmark_end), extracted_nodes in zip(ranges, extracted_ranges):
+            expected = helper.ExtractContentHelper.generate_document(doc,
+                helper.ExtractContentHelper.extract_content(bookmark_start, bookmark_end, True))
+            actual = helper.ExtractContentHelper.generate_document(doc, extracted_nodes)
+            self.assertEqual(expected.get_text(), actual.get_text())
+
+        # Each range is checked as in "extract_content", so markers from another document are rejected.
+        other_doc = aw.Document(MY_DIR + "Extract content.docx")
+        bookmark = doc.range.bookmarks[0]
+        with self.assertRaises(ValueError):
+            helper.ExtractContentHelper.extract_contents(doc, [(bookmark.bookmark_start, other_doc.range.bookmarks[0].bookmark_end)], True)
+
     def test_extract_content_between_comment_range(self):
 
         #ExStart:ExtractContentBetweenCommentRange
@@ -280,3 +313,27 @@ class ExtractContent(DocsExamplesBase):
                 image_index += 1
 
         #ExEnd:ExtractImagesToFiles
+
+    def test_export_unique_images(self):
+
+        #ExStart:ExportUniqueImages
+        doc = aw.Document(MY_DIR + "Images.docx")
+        image_count = len([shape for shape in doc.get_child_nodes(aw.NodeType.SHAPE, True) if shape.as_shape().has_image])
+
+        # Append a copy of the document to itself, so that every image occurs twice.
+        doc.append_document(doc.clone(), aw.ImportFormatMode.KEEP_SOURCE_FORMATTING)
+
+        # Images already in the folder are not written again, so start from an empty folder.
+        shutil.rmtree(ARTIFACTS_DIR + "ExportUniqueImages", ignore_errors=True)
+
+        exporter = ImageExporter(ARTIFACTS_DIR + "ExportUniqueImages", max_workers=4)
+        manifest = exporter.export(doc)
+        #ExEnd:ExportUniqueImages
+
+        # Every shape is listed, but each image is written once.
+        self.assertEqual(2 * image_count, len(manifest))
+        self.assertEqual(len({image.digest for image in manifest}), exporter.written)
+        self.assertEqual(len(manifest) - exporter.written, exporter.reused)
+        for image in manifest:
+            self.assertTrue(image.file_name.endswith(image.digest + os.path.splitext(image.file_name)[1]))
+            self.assertTrue(os.path.exists(image.file_name))
@@ -9,8 +9,15 @@ class ExtractContentHelper():
         # First, check that the nodes passed to this method are valid for use.
         ExtractContentHelper.verify_parameter_nodes(start_node, end_node)
 
-        # Create a list to store the extracted nodes.
-        nodes = []
+        original_start_node, original_end_node, start_node, end_node = ExtractContentHelper.find_block_markers(start_node, end_node, is_inclusive)
+
+        return ExtractContentHelper.extract_blocks(ExtractContentHelper.blocks_between(start_node, end_node),
+                                                   original_start_node, original_end_node, is_inclusive,
+                                                   lambda node: node.clone(True))
+
+    @staticmethod
+    def find_block_markers(start_node: aw.Node, end_node: aw.Node, is_inclusive: bool):
+        """Returns the original marker nodes and the block-level nodes (paragraphs and tables) that contain them."""
 
         # If either marker is part of a comment, including the comment itself, we need to move the pointer
         # forward to the Comment Node found after the CommentRangeEnd node.
@@ -20,55 +27,62 @@ class ExtractContentHelper():
                 end_node = node
 
         # Keep a record of the original nodes passed to this method to split marker nodes if needed.
-        original_start_node = start_node
-        original_end_node = end_node
-
         # Extract content based on block-level nodes (paragraphs and tables). Traverse through parent nodes to find them.
         # We will split the first and last nodes' content, depending if the marker nodes are inline.
-        start_node = ExtractContentHelper.get_ancestor_in_body(start_node)
-        end_node = ExtractContentHelper.get_ancestor_in_body(end_node)
+        return (start_node, end_node,
+                ExtractContentHelper.get_ancestor_in_body(start_node), ExtractContentHelper.get_ancestor_in_body(end_node))
+
+    @staticmethod
+    def blocks_between(start_node: aw.Node, end_node: aw.Node):
+        """Yields the block-level nodes from the start node to the end node, moving on to the next section when needed."""
 
-        is_extracting = True
-        is_starting_node = True
-        # The current node we are extracting from the document.
         curr_node = start_node
+        while True:
+            yield curr_node
+            if curr_node == end_node:
+                return
+
+            # If the next node is None, the rest of the content is found in a different section.
+            if curr_node.next_sibling is None:
+                next_section = curr_node.get_ancestor(aw.NodeType.SECTION).next_sibling.as_section()
+                curr_node = next_section.body.first_child
+            else:
+                curr_node = curr_node.next_sibling
+
+    @staticmethod
+    def extract_blocks(blocks, original_start_node: aw.Node, original_end_node: aw.Node, is_inclusive: bool, clone_inner_node):
+        """Copies block-level nodes, splitting the first and last ones at the marker nodes.
+        "clone_inner_node" copies the nodes that lie fully between the markers."""
+
+        # Create a list to store the extracted nodes.
+        nodes = []
+        blocks = list(blocks)
+        end_node = blocks[-1]
 
         # Begin extracting content. Process all block-level nodes and specifically split the first
         # and last nodes when needed, so paragraph formatting is retained.
         # Method is a little more complicated than a regular extractor as we need to factor
         # in extracting using inline nodes, fields, bookmarks, etc. to make it useful.
-        while is_extracting:
-
-            # Clone the current node and its children to obtain a copy.
-            clone_node = curr_node.clone(True)
-            is_ending_node = curr_node == end_node
+        for i, curr_node in enumerate(blocks):
+            is_starting_node = i == 0
+            is_ending_node = i == len(blocks) - 1
 
             if is_starting_node or is_ending_node:
+                # Marker nodes get trimmed, so they always need their own copy.
+                clone_node = curr_node.clone(True)
 
                 # We need to process each marker separately, so pass it off to a separate method instead.
                 # End should be processed at first to keep node indexes.
                 if is_ending_node:
-                    # !isStartingNode: don't add the node twice if the markers are the same node.
+                    # not is_starting_node: don't add the node twice if the markers are the same node.
                     ExtractContentHelper.process_marker(clone_node, nodes, original_end_node, curr_node, is_inclusive, False, not is_starting_node, False)
-                    is_extracting = False
 
                 # Conditional needs to be separate as the block level start and end markers, maybe the same node.
                 if is_starting_node:
                     ExtractContentHelper.process_marker(clone_node, nodes, original_start_node, curr_node, is_inclusive, True, True, False)
-                    is_starting_node = False
             else:
                 # Node is not a start or end marker, simply add the copy to the list.
-                nodes.append(clone_node)
-
-            # Move to the next node and extract it. If the next node is None,
-            # the rest of the content is found in a different section.
-            if curr_node.next_sibling is None and is_extracting:
-                # Move to the next section.
-                next_section = curr_node.get_ancestor(aw.NodeType.SECTION).next_sibling.as_section()
-                curr_node = next_section.body.first_child
-            else:
-                # Move to the next node in the body.
-                curr_node = curr_node.next_sibling
+                nodes.append(clone_inner_node(curr_node))
 
         # For compatibility with mode with inline bookmarks, add the next paragraph (empty).
         if is_inclusive and original_end_node == end_node and not original_end_node.is_composite:
@@ -78,6 +92,44 @@ class ExtractContentHelper():
         return nodes
 
     #ExEnd:CommonExtractContent
+
+    #ExStart:CommonExtractContents
+    @staticmethod
+    def extract_contents(doc: aw.Document, ranges, is_inclusive: bool):
+        """Extracts many start/end node ranges from the same document.
+
+        Each range is checked with "verify_parameter_nodes", as in "extract_content". Block-level node positions
+        are indexed once, so range walks do not move node by node through the document. Block-level nodes
+        that lie fully inside a range are cloned once and the clone is shared by all ranges that contain them,
+        so treat the returned nodes as read-only (for example, import them into another document with "generate_document")."""
+
+        index = BlockNodeIndex(doc)
+        shared_clones = {}
+
+        def clone_shared(node: aw.Node):
+            position = index.position_of(node)
+            if position not in shared_clones:
+                shared_clones[position] = node.clone(True)
+            return shared_clones[position]
+
+        contents = []
+        for start_node, end_node in ranges:
+            # Check each range as "extract_content" does, before any of its nodes are looked up in the index.
+            ExtractContentHelper.verify_parameter_nodes(start_node, end_node)
+
+            original_start_node, original_end_node, start_node, end_node = ExtractContentHelper.find_block_markers(start_node, end_node, is_inclusive)
+
+            start_position = index.position_of(start_node)
+            end_position = index.position_of(end_node)
+
+            contents.append(ExtractContentHelper.extract_blocks(index.blocks[start_position:end_position + 1],
+                                                                original_start_node, original_end_node, is_inclusive,
+                                                                clone_shared))
+
+        return contents
+
+    #ExEnd:CommonExtractContents
+
     @staticmethod
     def paragraphs_by_style_name(doc: aw.Document, style_name: str):
 
@@ -267,3 +319,26 @@ class ExtractContentHelper():
         return start_node
 
     #ExEnd:CommonExtractContentHelperMethods
+
+
+class BlockNodeIndex():
+    """Positions of all block-level nodes (the children of every section body) of a document, in document order."""
+
+    def __init__(self, doc: aw.Document):
+
+        self.blocks = []
+        self.positions = {}
+
+        for section in doc.sections:
+            for node in section.as_section().body.child_nodes:
+                self.positions[node] = len(self.blocks)
+                self.blocks.append(node)
+
+    def position_of(self, node: aw.Node):
+        """Returns the position of the block-level node that is or contains the given node."""
+
+        position = self.positions.get(ExtractContentHelper.get_ancestor_in_body(node))
+        if position is None:
+            raise ValueError("The node must be a child or descendant of a body of the indexed document")
+
+        return position
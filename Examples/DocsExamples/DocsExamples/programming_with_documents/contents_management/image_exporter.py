@@ -0,0 +1,97 @@
+import collections
+import concurrent.futures
+import hashlib
+import os
+import tempfile
+import threading
+from typing import List, NamedTuple, Optional
+
+import aspose.words as aw
+
+#ExStart:ImageExporter
+class ExportedImage(NamedTuple):
+    shape_index: int    # Index of the shape among all shapes of the document.
+    shape_name: str
+    digest: str         # SHA-256 of the image bytes.
+    file_name: str      # File that holds the image, shared by all shapes with the same image.
+
+
+class ImageExporter():
+    """Exports the images of documents into a content-addressed folder.
+
+    Each image is stored once, under the hash of its bytes, in a subfolder named after the first two
+    characters of the hash, so identical images (such as a logo repeated on every page, or in every document)
+    are written only once. Image bytes are read from the document on the calling thread, while hashing and
+    writing run on a thread pool; at most twice the number of workers images wait in memory."""
+
+    def __init__(self, out_dir: str, max_workers: Optional[int] = None):
+
+        self.out_dir = out_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.written = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._digests = set()
+
+    def export(self, doc: aw.Document) -> List[ExportedImage]:
+        """Exports all images of a document. Returns the manifest of the shapes that have an image, in document order."""
+
+        manifest = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = collections.deque()
+            for shape_index, shape in enumerate(doc.get_child_nodes(aw.NodeType.SHAPE, True)):
+                shape = shape.as_shape()
+                if not shape.has_image:
+                    continue
+
+                image_bytes = shape.image_data.image_bytes
+                extension = aw.FileFormatUtil.image_type_to_extension(shape.image_data.image_type)
+                in_flight.append((shape_index, shape.name, executor.submit(self._store, image_bytes, extension)))
+
+                if len(in_flight) >= 2 * self.max_workers:
+                    manifest.append(self._complete(in_flight.popleft()))
+
+            while in_flight:
+                manifest.append(self._complete(in_flight.popleft()))
+
+        return manifest
+
+    @staticmethod
+    def _complete(item) -> ExportedImage:
+
+        shape_index, shape_name, future = item
+        digest, file_name = future.result()
+        return ExportedImage(shape_index, shape_name, digest, file_name)
+
+    def _store(self, image_bytes: bytes, extension: str):
+
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        folder = os.path.join(self.out_dir, digest[:2])
+        file_name = os.path.join(folder, digest + extension)
+
+        with self._lock:
+            is_new = digest not in self._digests
+            self._digests.add(digest)
+
+        # The file may also exist from an earlier run or another process.
+        if not is_new or os.path.exists(file_name):
+            with self._lock:
+                self.reused += 1
+            return digest, file_name
+
+        # Write through a temporary file, so that a partially written image never appears under its digest.
+        os.makedirs(folder, exist_ok=True)
+        fd, temp_file_name = tempfile.mkstemp(dir=folder)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(image_bytes)
+            os.replace(temp_file_name, file_name)
+        except BaseException:
+            os.remove(temp_file_name)
+            raise
+
+        with self._lock:
+            self.written += 1
+        return digest, file_name
+#ExEnd:ImageExporter
@@ -0,0 +1,66 @@
+import collections
+import concurrent.futures
+import os
+from typing import Optional
+
+import aspose.words as aw
+
+#ExStart:DocumentSplitter
+class DocumentSplitter():
+    """Splits one document into pages or sections.
+
+    Pages are split with "Document.extract_pages". The layout of the document is built once, by "page_count"
+    in the constructor, and every call to "extract_pages" finds its page boundaries in that layout for as long
+    as the document is not changed, so splitting into parts costs one layout pass. Parts are produced one at
+    a time, so only the parts that are being saved are held in memory, and they are saved on a thread pool."""
+
+    def __init__(self, doc: aw.Document):
+
+        self.doc = doc
+        # Builds the layout that all parts are extracted from.
+        self.page_count = self.doc.page_count
+
+    def pages(self, page_count: int = 1):
+        """Yields (first page index, document) pairs, each part holding "page_count" consecutive pages."""
+
+        for page in range(0, self.page_count, page_count):
+            # The source document is not modified here, so its layout stays valid for the next part.
+            yield page, self.doc.extract_pages(page, min(page_count, self.page_count - page))
+
+    def sections(self):
+        """Yields (section index, document) pairs, one document per section."""
+
+        for i in range(self.doc.sections.count):
+            new_doc = aw.Document()
+            new_doc.sections.clear()
+
+            # "import_node" already creates a copy, so the section is not cloned beforehand.
+            new_doc.sections.add(new_doc.import_node(self.doc.sections[i], True).as_section())
+
+            yield i, new_doc
+
+    @staticmethod
+    def save_parts(parts, file_name_format: str, max_workers: Optional[int] = None):
+        """Saves parts produced by "pages" or "sections" as "file_name_format.format(index)".
+
+        Parts are produced one after another from the source document, while saving runs on a thread pool.
+        At most twice the number of workers parts wait in memory. Returns the file names in part order."""
+
+        max_workers = max_workers or os.cpu_count() or 1
+        file_names = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = collections.deque()
+            for index, part in parts:
+                file_name = file_name_format.format(index)
+                file_names.append(file_name)
+                in_flight.append(executor.submit(part.save, file_name))
+
+                if len(in_flight) >= 2 * max_workers:
+                    in_flight.popleft().result()
+
+            while in_flight:
+                in_flight.popleft().result()
+
+        return file_names
+#ExEnd:DocumentSplitter
@@ -2,6 +2,7 @@ import os
 
 import aspose.words as aw
 from docs_examples_base import DocsExamplesBase, MY_DIR, ARTIFACTS_DIR
+from .document_splitter import DocumentSplitter
 
 class SplitDocument(DocsExamplesBase):
 
@@ -65,6 +66,28 @@ class SplitDocument(DocsExamplesBase):
 
         self.merge_documents()
 
+    def test_split_in_parallel(self):
+
+        #ExStart:SplitDocumentInParallel
+        doc = aw.Document(MY_DIR + "Big document.docx")
+
+        # Parts are produced one at a time, so only the parts being saved are held in memory.
+        splitter = DocumentSplitter(doc)
+
+        # Save each page as a separate document, writing several parts in parallel.
+        page_file_names = DocumentSplitter.save_parts(splitter.pages(),
+            ARTIFACTS_DIR + "SplitDocument.split_in_parallel.page_{}.docx")
+
+        # Save each section as a separate document.
+        section_file_names = DocumentSplitter.save_parts(splitter.sections(),
+            ARTIFACTS_DIR + "SplitDocument.split_in_parallel.section_{}.docx")
+        #ExEnd:SplitDocumentInParallel
+
+        self.assertEqual(doc.page_count, len(page_file_names))
+        self.assertEqual(doc.sections.count, len(section_file_names))
+        for file_name in page_file_names + section_file_names:
+            self.assertTrue(os.path.exists(file_name))
+
     #ExStart:MergeSplitDocuments
     @staticmethod
     def merge_documents():
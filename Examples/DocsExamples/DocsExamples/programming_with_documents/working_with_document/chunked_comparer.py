@@ -0,0 +1,161 @@
+import concurrent.futures
+import difflib
+import hashlib
+import os
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+import aspose.words as aw
+
+#ExStart:ChunkedComparer
+# Hash of the entry that stands for a section break in the list of blocks.
+SECTION_BREAK = "section break"
+
+
+class ComparisonStatistics(NamedTuple):
+    original_blocks: int    # Paragraphs, tables and other block-level nodes in the original document.
+    edited_blocks: int      # Block-level nodes in the edited document.
+    identical_blocks: int   # Blocks found unchanged, which were not compared any further.
+    regions: int            # Runs of changed blocks.
+    compared_regions: int   # Changed regions compared with "Document.compare".
+
+
+class ChunkedComparer():
+    """Compares large documents region by region.
+
+    Both documents are first aligned block by block (paragraphs, tables and other block-level nodes
+    of all sections), using a hash of the text and paragraph style of each block. Identical blocks are skipped.
+    Blocks that were only deleted or only inserted become tracked deletions and insertions directly. Each region
+    where blocks were changed is copied into a pair of small documents, which are compared with "Document.compare"
+    (and its "CompareOptions", such as the granularity) on a thread pool. The compared blocks, with their
+    revisions, then replace the region in the original document.
+
+    Section breaks take part in the alignment, so a changed region never spans a section break that both documents
+    have. If a section break was removed, the compared blocks of the region go into the section where the region
+    starts, and sections left without blocks are removed.
+
+    As with "Document.compare", the revisions end up in the original document, and neither document
+    may contain revisions beforehand. Formatting changes that keep the text and paragraph style of a block,
+    and changes to the section breaks themselves, are not tracked as revisions."""
+
+    def __init__(self, author: str, date_time: Optional[datetime] = None, options: Optional[aw.comparing.CompareOptions] = None,
+                 max_workers: Optional[int] = None):
+
+        self.author = author
+        self.date_time = date_time or datetime.now()
+        self.options = options or aw.comparing.CompareOptions()
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @staticmethod
+    def blocks(doc: aw.Document) -> List[Tuple[aw.Node, str]]:
+        """Returns the block-level nodes of all sections, each with the hash of its content.
+        Every section but the first is preceded by the section itself, with the hash "SECTION_BREAK"."""
+
+        blocks = []
+        for index, section in enumerate(doc.sections):
+            if index > 0:
+                blocks.append((section, SECTION_BREAK))
+
+            for node in section.as_section().body.child_nodes:
+                content = node.get_text()
+                if node.node_type == aw.NodeType.PARAGRAPH:
+                    content += "\u0000" + node.as_paragraph().paragraph_format.style_name
+
+                blocks.append((node, hashlib.sha1(content.encode("utf-8")).hexdigest()))
+
+        return blocks
+
+    def compare(self, doc_original: aw.Document, doc_edited: aw.Document) -> ComparisonStatistics:
+
+        original = self.blocks(doc_original)
+        edited = self.blocks(doc_edited)
+
+        matcher = difflib.SequenceMatcher(None, [digest for _, digest in original], [digest for _, digest in edited], autojunk=False)
+        opcodes = matcher.get_opcodes()
+        regions = [opcode for opcode in opcodes if opcode[0] != "equal"]
+        identical = sum(len(_block_nodes(original[i1:i2])) for tag, i1, i2, _, _ in opcodes if tag == "equal")
+
+        # Documents are not changed from several threads: the parts are built and spliced on this thread,
+        # and each worker compares its own pair of parts.
+        replaced = []
+        deleted = []
+        inserted = []
+        for _, i1, i2, j1, j2 in regions:
+            original_nodes = _block_nodes(original[i1:i2])
+            edited_nodes = _block_nodes(edited[j1:j2])
+            if original_nodes and edited_nodes:
+                replaced.append((original_nodes, self._extract(doc_original, original_nodes), self._extract(doc_edited, edited_nodes)))
+            elif original_nodes:
+                deleted += original_nodes
+            elif edited_nodes:
+                inserted.append((i1, edited_nodes))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for future in [executor.submit(self._compare_parts, part_original, part_edited)
+                           for _, part_original, part_edited in replaced]:
+                future.result()
+
+        # The compared blocks take the place of the original blocks of their region.
+        for original_nodes, part_original, _ in replaced:
+            importer = aw.NodeImporter(part_original, doc_original, aw.ImportFormatMode.USE_DESTINATION_STYLES)
+            anchor = original_nodes[0]
+            for node in part_original.first_section.body.child_nodes:
+                anchor.parent_node.insert_before(importer.import_node(node, True), anchor)
+
+            for node in original_nodes:
+                body = node.parent_node.as_body()
+                node.remove()
+                if not body.has_child_nodes:
+                    # The region spanned a section break that the edited document does not have.
+                    body.parent_node.remove()
+
+        # Blocks that were only deleted or only inserted are recorded as tracked changes.
+        doc_original.start_track_revisions(self.author, self.date_time)
+        for node in deleted:
+            node.remove()
+
+        importer = aw.NodeImporter(doc_edited, doc_original, aw.ImportFormatMode.USE_DESTINATION_STYLES)
+        for i1, edited_nodes in inserted:
+            if i1 < len(original) and original[i1][1] != SECTION_BREAK:
+                anchor = original[i1][0]
+                for node in edited_nodes:
+                    anchor.parent_node.insert_before(importer.import_node(node, True), anchor)
+            elif i1 > 0 and original[i1 - 1][1] != SECTION_BREAK:
+                # Blocks inserted at the end of a section follow its last block.
+                anchor = original[i1 - 1][0]
+                for node in reversed(edited_nodes):
+                    anchor.parent_node.insert_after(importer.import_node(node, True), anchor)
+            else:
+                # Blocks inserted into a section without blocks, or into an original document without any,
+                # start the body of that section.
+                section = original[i1 - 1][0].as_section() if i1 > 0 else doc_original.first_section
+                for node in reversed(edited_nodes):
+                    section.body.prepend_child(importer.import_node(node, True))
+        doc_original.stop_track_revisions()
+
+        return ComparisonStatistics(len(_block_nodes(original)), len(_block_nodes(edited)), identical, len(regions), len(replaced))
+
+    @staticmethod
+    def _extract(doc: aw.Document, nodes: List[aw.Node]) -> aw.Document:
+        """Copies blocks into a new document."""
+
+        part = aw.Document()
+        body = part.first_section.body
+        body.remove_all_children()
+
+        importer = aw.NodeImporter(doc, part, aw.ImportFormatMode.USE_DESTINATION_STYLES)
+        for node in nodes:
+            body.append_child(importer.import_node(node, True))
+
+        return part
+
+    def _compare_parts(self, part_original: aw.Document, part_edited: aw.Document):
+
+        part_original.compare(part_edited, self.author, self.date_time, self.options)
+
+
+def _block_nodes(blocks: List[Tuple[aw.Node, str]]) -> List[aw.Node]:
+    """Returns the block-level nodes of a list of blocks, without the section breaks."""
+
+    return [node for node, digest in blocks if digest != SECTION_BREAK]
+#ExEnd:ChunkedComparer
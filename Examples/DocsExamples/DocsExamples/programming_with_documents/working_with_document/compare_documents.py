@@ -2,6 +2,7 @@ from datetime import datetime
 
 import aspose.words as aw
 from docs_examples_base import DocsExamplesBase, MY_DIR, ARTIFACTS_DIR
+from .chunked_comparer import ChunkedComparer
 
 class CompareDocument(DocsExamplesBase):
 
@@ -101,3 +102,74 @@ class CompareDocument(DocsExamplesBase):
         self.assertEqual(0, doc1.revisions.count)
         self.assertEqual(doc2.get_text().strip(), doc1.get_text().strip())
         #ExEnd:ApplyCompareTwoDocuments
+
+    def test_chunked_compare(self):
+
+        builder = aw.DocumentBuilder(aw.Document())
+        for i in range(50):
+            builder.writeln("Paragraph number {}.".format(i))
+
+        doc_original = builder.document
+        doc_edited = doc_original.clone().as_document()
+
+        paragraphs = doc_edited.first_section.body.paragraphs
+        paragraphs[10].first_child.as_run().text = "Paragraph number ten."
+        paragraphs[20].remove()
+        inserted = paragraphs[30].clone(True).as_paragraph()
+        inserted.first_child.as_run().text = "An inserted paragraph."
+        paragraphs[30].parent_node.insert_after(inserted, paragraphs[30])
+
+        #ExStart:ChunkedCompare
+        comparer = ChunkedComparer("user", datetime.now(), max_workers=2)
+        statistics = comparer.compare(doc_original, doc_edited)
+        #ExEnd:ChunkedCompare
+
+        self.assertEqual(3, statistics.regions)
+        self.assertEqual(1, statistics.compared_regions)
+        self.assertLess(0, doc_original.revisions.count)
+
+        doc_original.revisions.accept_all()
+        self.assertEqual(doc_edited.get_text(), doc_original.get_text())
+
+    def test_chunked_compare_sections(self):
+
+        builder = aw.DocumentBuilder(aw.Document())
+        builder.writeln("First section.")
+        builder.write("End of the first section.")
+        builder.insert_break(aw.BreakType.SECTION_BREAK_NEW_PAGE)
+        builder.write("Second section.")
+
+        doc_original = builder.document
+        doc_edited = doc_original.clone().as_document()
+
+        # Change the blocks on both sides of the section break.
+        doc_edited.first_section.body.last_paragraph.first_child.as_run().text = "Changed end of the first section."
+        doc_edited.last_section.body.first_paragraph.first_child.as_run().text = "Changed second section."
+
+        statistics = ChunkedComparer("user", datetime.now()).compare(doc_original, doc_edited)
+
+        # The section break splits the changes into two regions, and no empty paragraph is left behind.
+        self.assertEqual(2, statistics.regions)
+        self.assertEqual(2, doc_original.sections.count)
+
+        doc_original.revisions.accept_all()
+        self.assertEqual(doc_edited.get_text(), doc_original.get_text())
+
+    def test_chunked_compare_insert_at_start(self):
+
+        doc_original = aw.Document()
+        doc_original.first_section.body.remove_all_children()
+
+        builder = aw.DocumentBuilder(aw.Document())
+        builder.writeln("First paragraph.")
+        builder.write("Second paragraph.")
+        doc_edited = builder.document
+
+        # The original document has no blocks, so the inserted blocks start its first section.
+        statistics = ChunkedComparer("user", datetime.now()).compare(doc_original, doc_edited)
+
+        self.assertEqual(0, statistics.original_blocks)
+        self.assertTrue(doc_original.has_revisions)
+
+        doc_original.revisions.accept_all()
+        self.assertEqual(doc_edited.get_text(), doc_original.get_text())